@@ -1,20 +1,22 @@
+import importlib
 import os
 from types import ModuleType
-from typing import Iterator
+from typing import Iterator, Tuple
 
 
 class Handlers:
     base_path_handlers = ('controllers',)  # Ajustado para no repetir 'api'
     ignored = ('__init__.py', '__pycache__')
+    _scanned: Tuple[str, ...] | None = None
 
     @classmethod
     def __all_module_names(cls) -> list:
         # Obtener la ruta absoluta para los módulos dentro de 'api/controllers'
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Subimos un nivel para no duplicar 'api'
         handlers_path = os.path.join(base_dir, 'api', *cls.base_path_handlers)
-        return list(
+        return sorted(
             filter(
-                lambda module: module not in cls.ignored, os.listdir(handlers_path)
+                lambda module: module not in cls.ignored and module.endswith('.py'), os.listdir(handlers_path)
             )
         )
 
@@ -23,15 +25,23 @@ class Handlers:
         # Crear el namespace del módulo usando 'api.controllers'
         return 'api.%s' % ('.'.join(cls.base_path_handlers + (handler_name,)))
 
+    @classmethod
+    def scan_modules(cls) -> Tuple[str, ...]:
+        # Recorre el directorio una sola vez por proceso
+        if cls._scanned is None:
+            cls._scanned = tuple(cls.__module_namespace(module[:-3]) for module in cls.__all_module_names())
+        return cls._scanned
+
     @classmethod
     def iterator(cls) -> Iterator[ModuleType]:
-        for module in cls.__all_module_names():
-            import importlib
-            handler = importlib.import_module(cls.__module_namespace(module[:-3]))
-            yield handler
+        for module in cls.modules():
+            yield importlib.import_module(module)
 
     @classmethod
-    def modules(cls) -> map:
-        return map(
-            lambda module: cls.__module_namespace(module[:-3]), cls.__all_module_names()
-        )
+    def modules(cls) -> Tuple[str, ...]:
+        # Con ROUTES_MANIFEST=false se recorre el directorio en lugar de usar `api.routes_manifest`. Se lee en cada
+        # llamada, ya que el contenedor la hace al importarse.
+        if os.getenv('ROUTES_MANIFEST', 'true') == 'true':
+            from api.routes_manifest import CONTROLLER_MODULES
+            return CONTROLLER_MODULES
+        return cls.scan_modules()
@@ -0,0 +1,30 @@
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Response
+
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.container import Container
+
+router = APIRouter(
+    tags=['metrics']
+)
+
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@router.get('/metrics', include_in_schema=False)
+@inject
+async def get_metrics(
+        metrics: MetricsRegistry = Depends(Provide[Container.metrics])
+) -> Response:
+    """
+    Endpoint con las métricas de la aplicación en el formato de texto de Prometheus: latencia por ruta y estado,
+    peticiones en curso, duración de las consultas SQLite por nombre, latencia y estado de las peticiones a PokeAPI
+    y contadores de las cachés.
+
+    Args:
+        metrics (MetricsRegistry): Dependencia inyectada con el registro de métricas.
+
+    Returns:
+        Response: Las métricas en texto plano.
+    """
+    return Response(metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -1,15 +1,29 @@
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterable, List, Literal, Optional, Union
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from application.get_general.get_general_handler import GetGeneralHandler
 from application.get_general.get_general_query import GetGeneralQuery
 from application.get_specific.get_specific_handler import GetSpecificHandler
+from application.get_specific_batch.get_specific_batch_handler import GetSpecificBatchHandler
+from application.get_specific_batch.get_specific_batch_query import GetSpecificBatchQuery
+from application.patch_pokemon.patch_pokemon_command import PatchPokemonDto
+from application.patch_pokemon.patch_pokemon_handler import PatchPokemonHandler
 from application.update_pokemon.update_pokemon_command import UpdatePokemonDto
 from application.update_pokemon.update_pokemon_handler import UpdatePokemonHanlder
+from application.update_pokemon_bulk.update_pokemon_bulk_command import UpdatePokemonBulkDto
+from application.update_pokemon_bulk.update_pokemon_bulk_handler import UpdatePokemonBulkHandler
+from domain.dto.bulk_update_result_dto import BulkUpdateResultDto
 from domain.dto.general_pokemon_dto import GeneralPokemonDto
+from domain.dto.materialized_list_dto import MaterializedListDto
+from domain.dto.page_dto import MAX_PAGE_SIZE, PageDto
+from domain.dto.projection_dto import ProjectionDto
 from domain.dto.specific_pokemon_dto import SpecificPokemonDto
+from infrastructure.adapters.data_version import DataVersion
+from infrastructure.adapters.request_timing import timed
 from infrastructure.container import Container
 
 from application.get_specific.get_specific_query import GetSpecificQuery
@@ -19,12 +33,100 @@ router = APIRouter(
     tags=['pokemon']
 )
 
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+_VARY_ACCEPT = {'Vary': 'Accept'}
+"""`/specific` responde JSON o NDJSON en la misma URL según `Accept`, por lo que las cachés deben distinguirlos."""
+
+_SPECIFIC_LIST = TypeAdapter(List[SpecificPokemonDto])
+_GENERAL_LIST = TypeAdapter(List[GeneralPokemonDto])
+_BATCH_ITEM = Optional[Union[SpecificPokemonDto, Literal['unavailable']]]
+_SPECIFIC_BATCH = TypeAdapter(Dict[str, _BATCH_ITEM])
+_BULK_RESULTS = TypeAdapter(List[BulkUpdateResultDto])
+
+_MAX_ENCODED_PROJECTIONS = 8
+"""Proyecciones distintas cuya serialización se guarda como máximo en cada lista materializada."""
+
+
+def _json(adapter: TypeAdapter, value, headers: Dict[str, str] | None = None,
+          projection: ProjectionDto | None = None) -> Response:
+    """
+    Serializa el resultado directamente a bytes JSON con pydantic-core. Al devolver una `Response`, FastAPI no vuelve
+    a validar el resultado contra el modelo de respuesta ni lo pasa por `jsonable_encoder`: los DTO los construye
+    la propia aplicación. Las listas materializadas se serializan una sola vez (por proyección) y después se
+    reutilizan sus bytes. `projection` solo se aplica a listas de `SpecificPokemonDto`.
+    """
+    with timed('serialize'):
+        return _encode(adapter, value, headers, projection)
+
+
+def _encode(adapter: TypeAdapter, value, headers: Dict[str, str] | None,
+            projection: ProjectionDto | None) -> Response:
+    if projection is None:
+        if isinstance(value, MaterializedListDto):
+            if value.encoded is None:
+                value.encoded = adapter.dump_json(value)
+            return Response(value.encoded, media_type='application/json', headers=headers)
+        return Response(adapter.dump_json(value), media_type='application/json', headers=headers)
+
+    include = {'__all__': projection.include()}
+    if not isinstance(value, MaterializedListDto):
+        return Response(adapter.dump_json(value, include=include), media_type='application/json', headers=headers)
+    if value.encoded_projections is None:
+        value.encoded_projections = {}
+    encoded = value.encoded_projections.get(projection.key())
+    if encoded is None:
+        encoded = adapter.dump_json(value, include=include)
+        if len(value.encoded_projections) < _MAX_ENCODED_PROJECTIONS:
+            value.encoded_projections[projection.key()] = encoded
+    return Response(encoded, media_type='application/json', headers=headers)
+
+
+def _page_headers(result, etag: str | None, extra: Dict[str, str] | None = None) -> Dict[str, str]:
+    """
+    Cabeceras de una respuesta de lectura. El ETag solo se envía si el resultado está completo: una respuesta
+    degradada (PokeAPI no respondió) no debe poder revalidarse con un 304 cuando PokeAPI vuelva.
+    """
+    headers = dict(extra or {})
+    if etag is not None and getattr(result, 'complete', True):
+        headers['ETag'] = etag
+    if isinstance(result, PageDto) and result.next_cursor:
+        headers['X-Next-Cursor'] = result.next_cursor
+    return headers
+
+
+def _not_modified(etag: str, extra: Dict[str, str] | None = None) -> Response:
+    return Response(status_code=304, headers={**(extra or {}), 'ETag': etag})
+
+
+async def _ndjson(items: AsyncIterator[SpecificPokemonDto] | Iterable[SpecificPokemonDto],
+                  projection: ProjectionDto | None = None) -> AsyncIterator[str]:
+    """
+    Serializa cada Pokémon como una línea JSON en cuanto está disponible.
+    """
+    include = projection.include() if projection else None
+    if not hasattr(items, '__aiter__'):
+        for item in items:
+            yield item.model_dump_json(include=include) + '\n'
+        return
+    async for item in items:
+        yield item.model_dump_json(include=include) + '\n'
+
 
 @router.get('/specific')
 @inject
 async def get_specific(
         data_to_search: Optional[str] = None,
-        get_specific_handler: GetSpecificHandler = Depends(Provide[Container.get_specific_handler])
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[str] = None,
+        sprites: Optional[str] = None,
+        accept: Optional[str] = Header(None),
+        if_none_match: Optional[str] = Header(None),
+        get_specific_handler: GetSpecificHandler = Depends(Provide[Container.get_specific_handler]),
+        data_version: DataVersion = Depends(Provide[Container.data_version])
 ) -> list[SpecificPokemonDto]:
     """
     Endpoint para obtener detalles específicos de un Pokémon.
@@ -32,24 +134,75 @@ async def get_specific(
     Args:
         data_to_search (Optional[str]): Nombre o número de Pokédex del Pokémon a buscar. Si no se proporciona,
         se devuelve una lista vacía.
+        limit (Optional[int]): Tamaño de página (hasta 100). Si se indica (y no hay búsqueda), se devuelve solo una
+        página ordenada por número de Pokédex y el cursor de la siguiente en la cabecera `X-Next-Cursor`.
+        offset (int): Posición de inicio en el listado de PokeAPI para la primera página.
+        cursor (Optional[str]): Cursor recibido en `X-Next-Cursor` con la página anterior.
+        stream (bool): Si es True (o si `Accept` es `application/x-ndjson`) la respuesta es NDJSON, un Pokémon
+        por línea, y sin búsqueda ni página cada registro se envía en cuanto está disponible.
+        fields (Optional[str]): Campos a devolver, separados por comas (por ejemplo `name,sprites`).
+        sprites (Optional[str]): Claves de `sprites` a conservar, separadas por comas; las anidadas se indican
+        con puntos (por ejemplo `front_default,other.official-artwork.front_default`).
+        accept (Optional[str]): Cabecera `Accept` de la petición.
+        if_none_match (Optional[str]): ETag de una respuesta anterior. Si los datos no cambiaron desde entonces se
+        responde 304 sin consultar el repositorio. El NDJSON sin búsqueda ni página no lleva ETag, porque las
+        cabeceras se envían antes de saber si llegarán todos los registros.
         get_specific_handler (GetSpecificHandler): Dependencia inyectada para manejar la consulta específica.
+        data_version (DataVersion): Versión de los datos de la que se deriva el ETag.
 
     Returns:
         list[SpecificPokemonDto]: Lista de Pokémon específicos encontrados. Devuelve una lista vacía si no
         se encuentra ningún resultado.
     """
-    result = await get_specific_handler.handler(GetSpecificQuery(data_to_search=data_to_search))
-    if isinstance(result, list) and all(isinstance(item, SpecificPokemonDto) for item in result):
-        return [item.dict() for item in result]
+    stream = stream or NDJSON_MEDIA_TYPE in (accept or '')
+    query = GetSpecificQuery(data_to_search=data_to_search, limit=limit, offset=offset, cursor=cursor, stream=stream,
+                             fields=fields, sprites=sprites)
+    streamed = stream and not query.data_to_search and query.page is None
+    # El ETag se calcula antes de consultar: si los datos cambian durante la consulta, la siguiente petición
+    # recibe la respuesta completa en vez de un 304 con datos viejos.
+    version = None if streamed else await data_version.current()
+    etag = data_version.etag(version, 'ndjson' if stream else '') if version else None
+    if etag and data_version.matches(if_none_match, etag):
+        return _not_modified(etag, _VARY_ACCEPT)
+    result = await get_specific_handler.handler(query)
+    headers = _page_headers(result, etag, _VARY_ACCEPT)
+    if isinstance(result, PageDto):
+        result = result.items
+    if stream:
+        return StreamingResponse(_ndjson(result, query.projection), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+    return _json(_SPECIFIC_LIST, result or [], headers, query.projection)
+
+
+@router.post('/specific/batch')
+@inject
+async def get_specific_batch(
+        query: GetSpecificBatchQuery,
+        get_specific_batch_handler: GetSpecificBatchHandler = Depends(Provide[Container.get_specific_batch_handler])
+) -> Dict[str, _BATCH_ITEM]:
+    """
+    Endpoint para obtener los detalles específicos de varios Pokémon en una sola petición.
 
-    return []
+    Args:
+        query (GetSpecificBatchQuery): Hasta 100 nombres o números de Pokédex a buscar.
+        get_specific_batch_handler (GetSpecificBatchHandler): Dependencia inyectada para manejar la consulta.
+
+    Returns:
+        Dict[str, Optional[SpecificPokemonDto | str]]: Cada identificador recibido con su Pokémon, null si no existe o
+        `"unavailable"` si PokeAPI falló o no respondió a tiempo. Si no se pudo resolver ninguno se responde 503.
+    """
+    return _json(_SPECIFIC_BATCH, await get_specific_batch_handler.handler(query))
 
 
 @router.get('/general')
 @inject
 async def get_general(
         data_to_search: Optional[str] = None,
-        get_general_handler: GetGeneralHandler = Depends(Provide[Container.get_general_handler])
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+        get_general_handler: GetGeneralHandler = Depends(Provide[Container.get_general_handler]),
+        data_version: DataVersion = Depends(Provide[Container.data_version])
 ) -> list[GeneralPokemonDto]:
     """
     Endpoint para obtener una lista general de Pokémon.
@@ -57,17 +210,51 @@ async def get_general(
     Args:
         data_to_search (Optional[str]): Nombre o número de Pokédex del Pokémon a buscar. Si no se proporciona,
         se devuelve la lista completa de Pokémon.
+        limit (Optional[int]): Tamaño de página (hasta 100). Si se indica (y no hay búsqueda), se devuelve solo una
+        página ordenada por número de Pokédex y el cursor de la siguiente en la cabecera `X-Next-Cursor`.
+        offset (int): Posición de inicio en el listado de PokeAPI para la primera página.
+        cursor (Optional[str]): Cursor recibido en `X-Next-Cursor` con la página anterior.
+        if_none_match (Optional[str]): ETag de una respuesta anterior. Si los datos no cambiaron desde entonces se
+        responde 304 sin consultar el repositorio.
         get_general_handler (GetGeneralHandler): Dependencia inyectada para manejar la consulta general.
+        data_version (DataVersion): Versión de los datos de la que se deriva el ETag.
 
     Returns:
         list[GeneralPokemonDto]: Lista general de Pokémon encontrados. Si no se encuentra ningún resultado,
         se devuelve una lista vacía.
     """
-    result = await get_general_handler.handler(GetGeneralQuery(data_to_search=data_to_search))
-    if isinstance(result, list) and all(isinstance(item, GeneralPokemonDto) for item in result):
-        return [item.dict() for item in result]
+    version = await data_version.current()
+    etag = data_version.etag(version) if version else None
+    if etag and data_version.matches(if_none_match, etag):
+        return _not_modified(etag)
+    query = GetGeneralQuery(data_to_search=data_to_search, limit=limit, offset=offset, cursor=cursor)
+    result = await get_general_handler.handler(query)
+    headers = _page_headers(result, etag)
+    if isinstance(result, PageDto):
+        result = result.items
+    return _json(_GENERAL_LIST, result or [], headers)
 
-    return []
+
+@router.put('/bulk')
+@inject
+async def update_pokemon_bulk(
+        pokemon_data: UpdatePokemonBulkDto,
+        update_pokemon_bulk_handler: UpdatePokemonBulkHandler = Depends(Provide[Container.update_pokemon_bulk_handler])
+) -> List[BulkUpdateResultDto]:
+    """
+    Endpoint para actualizar varios Pokémon en una sola petición. Se registra antes de `/{pokedex_number}`
+    para que `bulk` no se interprete como un número de Pokédex.
+
+    Args:
+        pokemon_data (UpdatePokemonBulkDto): Hasta 5000 elementos con el número de Pokédex y los datos actualizados
+        de cada Pokémon. Si alguno no es válido se rechaza la petición completa.
+        update_pokemon_bulk_handler (UpdatePokemonBulkHandler): Dependencia inyectada para manejar la actualización.
+
+    Returns:
+        List[BulkUpdateResultDto]: El resultado (`updated`, `not_found` o `unavailable`) de cada elemento, en el
+        mismo orden.
+    """
+    return _json(_BULK_RESULTS, await update_pokemon_bulk_handler.handler(pokemon_data))
 
 
 @router.put('/{pokedex_number}')
@@ -89,3 +276,24 @@ async def update_pokemon(
         None: Si la actualización es exitosa, no se devuelve contenido.
     """
     await update_pokemon_handler.handler(pokedex_number, pokemon_data)
+
+
+@router.patch('/{pokedex_number}')
+@inject
+async def patch_pokemon(
+        pokedex_number: int,
+        pokemon_data: PatchPokemonDto,
+        patch_pokemon_handler: PatchPokemonHandler = Depends(Provide[Container.patch_pokemon_handler])
+) -> None:
+    """
+    Endpoint para actualizar solo algunos datos de un Pokémon.
+
+    Args:
+        pokedex_number (int): Número de Pokédex del Pokémon a actualizar.
+        pokemon_data (PatchPokemonDto): Campos a actualizar; los que se omiten conservan su valor.
+        patch_pokemon_handler (PatchPokemonHandler): Dependencia inyectada para manejar la actualización parcial.
+
+    Returns:
+        None: Si la actualización es exitosa, no se devuelve contenido.
+    """
+    await patch_pokemon_handler.handler(pokedex_number, pokemon_data)
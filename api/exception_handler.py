@@ -1,18 +1,47 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from infrastructure.adapters.pokeapi_client import UpstreamUnavailableError
+
+
+class ExceptionMiddleware:
+    """
+    Middleware ASGI que convierte cualquier excepción no controlada en una respuesta 400 con
+    `{"message", "ExceptionType"}`, salvo `UpstreamUnavailableError`, que responde con su `status_code` (503
+    cuando PokeAPI no está disponible). Un atributo `status_code` en cualquier otra excepción se ignora.
+
+    Se implementa directamente sobre ASGI en lugar de `BaseHTTPMiddleware`, que ejecuta cada petición en una tarea
+    aparte y copia el cuerpo de la respuesta por un stream intermedio: así no añade coste por petición y las
+    respuestas en streaming llegan al cliente sin pasar por él.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
 
-class ExceptionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            return JSONResponse(
-                status_code=400,
+            # Si ya se enviaron las cabeceras no se puede cambiar la respuesta.
+            if response_started:
+                raise
+            response = JSONResponse(
+                status_code=exc.status_code if isinstance(exc, UpstreamUnavailableError) else 400,
                 content={
                     "message": str(exc),
                     "ExceptionType": exc.__class__.__name__
                 }
             )
+            await response(scope, receive, send)
@@ -0,0 +1,48 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.adapters.metrics import MetricsRegistry
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP: su latencia por método, ruta y estado, y las peticiones en curso.
+
+    La ruta es la plantilla registrada (`/pokemon/{pokedex_number}`), que FastAPI deja en el `scope` al enrutar,
+    para que el número de series no crezca con los parámetros; las peticiones que no coinciden con ninguna ruta se
+    agrupan en `<unmatched>`. La latencia llega hasta el último fragmento del cuerpo, por lo que en las respuestas
+    en streaming incluye toda la transferencia. Debe registrarse después de `ExceptionMiddleware` para ver el
+    estado final de las peticiones que terminan en excepción.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry) -> None:
+        self.app = app
+        self.duration = metrics.histogram(
+            'http_request_duration_seconds', 'Latencia de las peticiones HTTP por método, ruta y estado.',
+            ('method', 'route', 'status'))
+        self.in_flight = metrics.gauge('http_requests_in_flight', 'Peticiones HTTP en curso por método.', ('method',))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status = '500'
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = str(message['status'])
+            await send(message)
+
+        self.in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get('route')
+            self.duration.observe(time.perf_counter() - started, method,
+                                  getattr(route, 'path', '<unmatched>'), status)
+            self.in_flight.dec(method)
@@ -0,0 +1,10 @@
+"""
+Manifiesto estático de los módulos de controladores, generado con `python generate_routes_manifest.py`.
+
+`Handlers` lo usa en lugar de recorrer `api/controllers` en cada arranque. No editar a mano: regenerar al añadir o
+eliminar un controlador (una prueba comprueba que coincide con el directorio).
+"""
+CONTROLLER_MODULES = (
+    'api.controllers.metrics_controller',
+    'api.controllers.pokemon_controller',
+)
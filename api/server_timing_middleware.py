@@ -0,0 +1,80 @@
+import asyncio
+import hmac
+import os
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.adapters.request_timing import start_request_timings, stop_request_timings
+from infrastructure.adapters.sampling_profiler import SamplingProfiler
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware ASGI que añade a cada respuesta la cabecera `Server-Timing` con el tiempo de cada fase de la
+    petición (`db`, `cache`, `upstream`, `merge`, `serialize` y `total`), medidas por el gateway de SQLite,
+    el cliente de PokeAPI, el repositorio y el controlador.
+
+    Si la petición trae la cabecera `X-Profile` con el valor de `PROFILE_TOKEN`, además se ejecuta bajo un
+    `SamplingProfiler`; el perfil se guarda en `PROFILE_DIR` y su nombre se devuelve en la cabecera `X-Profile`.
+    Sin `PROFILE_TOKEN` el modo de perfilado está desactivado.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = None, profile_token: str = None, profile_dir: str = None,
+                 profile_interval: float = None) -> None:
+        """
+        Inicializa el middleware. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            app (ASGIApp): Aplicación envuelta.
+            enabled (bool): Si es False no se añade `Server-Timing` (`SERVER_TIMING`).
+            profile_token (str): Valor que debe traer `X-Profile` para perfilar la petición (`PROFILE_TOKEN`).
+            profile_dir (str): Directorio donde se guardan los perfiles (`PROFILE_DIR`).
+            profile_interval (float): Segundos entre muestras del profiler (`PROFILE_INTERVAL`).
+        """
+        self.app = app
+        self.enabled = enabled if enabled is not None else os.getenv('SERVER_TIMING', 'true') == 'true'
+        self.profile_token = profile_token if profile_token is not None else os.getenv('PROFILE_TOKEN', '')
+        self.profile_dir = profile_dir or os.getenv('PROFILE_DIR', 'profiles')
+        self.profile_interval = profile_interval or float(os.getenv('PROFILE_INTERVAL', '0.001'))
+
+    def _wants_profile(self, scope: Scope) -> bool:
+        if not self.profile_token:
+            return False
+        for name, value in scope['headers']:
+            if name == b'x-profile':
+                return hmac.compare_digest(value, self.profile_token.encode('latin-1'))
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        profiler = profile_name = None
+        if self._wants_profile(scope):
+            profiler = SamplingProfiler(self.profile_interval)
+            profile_name = SamplingProfiler.file_name(scope['path'])
+        if not self.enabled and profiler is None:
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = start_request_timings()
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                headers.append('Server-Timing', timings.server_timing())
+                if profile_name is not None:
+                    headers.append('X-Profile', profile_name)
+            await send(message)
+
+        if profiler is not None:
+            profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_request_timings(token)
+            if profiler is not None:
+                profiler.stop()
+                await asyncio.to_thread(profiler.save, self.profile_dir, profile_name)
@@ -32,5 +32,8 @@ class GetGeneralHandler:
 
         Returns:
             List[GeneralPokemonDto]: Lista de los Pokémon encontrados o una lista vacía si no se encuentran resultados.
+            PageDto[GeneralPokemonDto]: Si la consulta pide una página y no contiene una búsqueda.
         """
+        if query.page is not None and not query.data_to_search:
+            return await self.__pokemon_repository.get_general_page(query.page)
         return await self.__pokemon_repository.get_general(query.data_to_search)
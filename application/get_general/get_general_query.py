@@ -1,11 +1,21 @@
 from typing import Optional
 
+from domain.dto.page_dto import PageRequestDto
+
 
 class GetGeneralQuery:
     data_to_search: str
+    page: Optional[PageRequestDto]
 
-    def __init__(self, data_to_search: Optional[str] = None):
+    def __init__(self, data_to_search: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                 cursor: Optional[str] = None):
         if data_to_search:
             self.data_to_search = data_to_search.lower()
         else:
             self.data_to_search = None
+        if limit is None:
+            self.page = None
+        elif cursor:
+            self.page = PageRequestDto.from_cursor(limit, cursor)
+        else:
+            self.page = PageRequestDto(limit, upstream_offset=offset)
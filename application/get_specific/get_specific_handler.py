@@ -31,5 +31,11 @@ class GetSpecificHandler:
 
         Returns:
             List[SpecificPokemonDto]: Lista con la información del Pokémon encontrado, o una lista vacía si no se encuentra.
+            PageDto[SpecificPokemonDto]: Si la consulta pide una página y no contiene una búsqueda.
+            AsyncIterator[SpecificPokemonDto]: Si la consulta pide el modo streaming y no contiene una búsqueda.
         """
+        if query.page is not None and not query.data_to_search:
+            return await self.__pokemon_repository.get_specific_page(query.page, query.projection)
+        if query.stream and not query.data_to_search:
+            return self.__pokemon_repository.stream_specific(query.projection)
         return await self.__pokemon_repository.get_specific(query.data_to_search)
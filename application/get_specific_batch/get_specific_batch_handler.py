@@ -0,0 +1,36 @@
+from typing import Dict
+
+from application.get_specific_batch.get_specific_batch_query import GetSpecificBatchQuery
+from domain.dto.specific_pokemon_dto import SpecificPokemonDto
+from domain.repositories.pokemon_repository import PokemonRepository
+
+
+class GetSpecificBatchHandler:
+    """
+    Manejador encargado de procesar las consultas que resuelven varios Pokémon específicos a la vez.
+
+    Esta clase utiliza el repositorio de Pokémon para buscar en una sola operación todos los nombres o números
+    de Pokédex recibidos en la consulta.
+    """
+
+    def __init__(self, pokemon_repository: PokemonRepository) -> None:
+        """
+        Inicializa el manejador con una instancia de `PokemonRepository`.
+
+        Args:
+            pokemon_repository (PokemonRepository): El repositorio que maneja el acceso a los datos de Pokémon.
+        """
+        self.__pokemon_repository = pokemon_repository
+
+    async def handler(self, query: GetSpecificBatchQuery) -> Dict[str, SpecificPokemonDto | str | None]:
+        """
+        Maneja la solicitud para obtener varios Pokémon específicos.
+
+        Args:
+            query (GetSpecificBatchQuery): La consulta con los nombres o números de Pokédex a buscar.
+
+        Returns:
+            Dict[str, SpecificPokemonDto | str | None]: Cada identificador recibido con el Pokémon encontrado, None si
+            no existe o `'unavailable'` si PokeAPI no pudo consultarse.
+        """
+        return await self.__pokemon_repository.get_specific_batch([str(identifier) for identifier in query.identifiers])
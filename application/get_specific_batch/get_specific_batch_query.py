@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 100
+
+
+class GetSpecificBatchQuery(BaseModel):
+    identifiers: List[str | int] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
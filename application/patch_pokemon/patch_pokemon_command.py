@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import List, Dict, Any, Optional
+
+
+class PatchPokemonDto(BaseModel):
+    name: Optional[str] = None
+    abilities: Optional[List[str]] = None
+    sprites: Optional[Dict[str, Any]] = None
+    types: Optional[List[str]] = None
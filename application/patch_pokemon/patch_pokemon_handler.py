@@ -0,0 +1,41 @@
+from application.patch_pokemon.patch_pokemon_command import PatchPokemonDto
+from domain.dto.pokemon_to_patch_dto import PokemonToPatchDto
+from domain.services.pokemon_service import PokemonService
+
+
+class PatchPokemonHandler:
+    """
+    Manejador encargado de procesar los comandos para actualizar solo algunos datos de un Pokémon.
+
+    Esta clase convierte los datos recibidos en un `PokemonToPatchDto` y delega la actualización parcial al
+    servicio `PokemonService`.
+    """
+
+    def __init__(self, pokemon_service: PokemonService) -> None:
+        """
+        Inicializa el manejador con una instancia de `PokemonService`.
+
+        Args:
+            pokemon_service (PokemonService): El servicio que maneja la lógica de negocio para los Pokémon.
+        """
+        self.__pokemon_service = pokemon_service
+
+    async def handler(self, pokedex_number: int, command: PatchPokemonDto) -> None:
+        """
+        Maneja la solicitud de actualización parcial de un Pokémon.
+
+        Args:
+            pokedex_number (int): El número de la Pokédex del Pokémon a actualizar.
+            command (PatchPokemonDto): El comando con los campos que se deben actualizar; los omitidos no cambian.
+
+        Raises:
+            Exception: Si no se proporciona ningún campo o el Pokémon no es encontrado.
+        """
+        pokemon_to_patch = PokemonToPatchDto(
+            pokedex_number,
+            command.name,
+            command.abilities,
+            command.sprites,
+            command.types
+        )
+        await self.__pokemon_service.patch(pokemon_to_patch)
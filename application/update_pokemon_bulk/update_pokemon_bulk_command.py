@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from application.update_pokemon.update_pokemon_command import UpdatePokemonDto
+
+MAX_BULK_SIZE = 5000
+
+
+class UpdatePokemonBulkItemDto(UpdatePokemonDto):
+    pokedex_number: int
+
+
+class UpdatePokemonBulkDto(BaseModel):
+    items: List[UpdatePokemonBulkItemDto] = Field(min_length=1, max_length=MAX_BULK_SIZE)
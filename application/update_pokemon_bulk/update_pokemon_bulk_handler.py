@@ -0,0 +1,40 @@
+from typing import List
+
+from application.update_pokemon_bulk.update_pokemon_bulk_command import UpdatePokemonBulkDto
+from domain.dto.bulk_update_result_dto import BulkUpdateResultDto
+from domain.dto.pokemon_to_update_dto import PokemonToUpdateDto
+from domain.services.pokemon_service import PokemonService
+
+
+class UpdatePokemonBulkHandler:
+    """
+    Manejador encargado de procesar los comandos para actualizar varios Pokémon a la vez.
+
+    Esta clase convierte cada elemento recibido en un `PokemonToUpdateDto` y delega en el servicio `PokemonService`
+    la actualización de todos ellos en una única operación.
+    """
+
+    def __init__(self, pokemon_service: PokemonService) -> None:
+        """
+        Inicializa el manejador con una instancia de `PokemonService`.
+
+        Args:
+            pokemon_service (PokemonService): El servicio que maneja la lógica de negocio para los Pokémon.
+        """
+        self.__pokemon_service = pokemon_service
+
+    async def handler(self, command: UpdatePokemonBulkDto) -> List[BulkUpdateResultDto]:
+        """
+        Maneja la solicitud de actualización de varios Pokémon.
+
+        Args:
+            command (UpdatePokemonBulkDto): El comando con los datos de cada Pokémon a actualizar.
+
+        Returns:
+            List[BulkUpdateResultDto]: El resultado de cada elemento, en el mismo orden en que se recibieron.
+        """
+        pokemons_to_update = [
+            PokemonToUpdateDto(item.name, item.pokedex_number, item.abilities, item.sprites, item.types)
+            for item in command.items
+        ]
+        return await self.__pokemon_service.update_many(pokemons_to_update)
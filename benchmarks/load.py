@@ -0,0 +1,253 @@
+"""
+Benchmark de carga reproducible de la API.
+
+Levanta un `StubPokeApi` local (latencia, tasa de errores y tamaño de cuerpo configurables) y la aplicación con
+uvicorn en un proceso aparte, sobre una base de datos temporal, y recorre cada escenario (listados general y
+específico con y sin búsqueda, una página, `PUT`) con cada nivel de concurrencia. Informa de peticiones por segundo,
+p50/p95/p99 y errores, y guarda los resultados en JSON junto con el commit para comparar ejecuciones:
+
+    python -m benchmarks.load [--concurrency 1 10 50] [--requests 500] [--latency 0.02] [--error-rate 0]
+                              [--payload-padding 0] [--seed-rows 50] [--env DB_WRITE_BEHIND=true]
+                              [--output results.json] [--baseline results-anterior.json]
+
+El generador de carga y el stub comparten proceso, por lo que los números sirven para comparar commits en la misma
+máquina, no como capacidad absoluta.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from infrastructure.adapters.pokemon_codec import encode_column
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: Callable[[int], str]
+    body: Callable[[int], dict] | None = None
+
+
+@dataclass
+class Result:
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def scenarios(catalog_size: int) -> List[Scenario]:
+    """
+    Escenarios medidos. `index` es el número de petición, para repartir las búsquedas y escrituras por el catálogo.
+    """
+    def pokedex_number(index: int) -> int:
+        return index % min(catalog_size, 100) + 1
+
+    return [
+        Scenario('general', 'GET', lambda index: '/pokemon/general'),
+        Scenario('general-search', 'GET', lambda index: f'/pokemon/general?data_to_search=pokemon-{pokedex_number(index)}'),
+        Scenario('specific', 'GET', lambda index: '/pokemon/specific'),
+        Scenario('specific-search', 'GET', lambda index: f'/pokemon/specific?data_to_search={pokedex_number(index)}'),
+        Scenario('specific-page', 'GET', lambda index: '/pokemon/specific?limit=20'),
+        Scenario('put', 'PUT', lambda index: f'/pokemon/{pokedex_number(index)}',
+                 lambda index: {'name': f'edited-{index}', 'abilities': ['static'],
+                                'sprites': {'front_default': None}, 'types': ['electric']}),
+    ]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Percentil por rango más cercano sobre una lista ya ordenada.
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def seed_database(db_path: str, rows: int) -> None:
+    """
+    Crea el esquema y guarda `rows` Pokémon editados, para que las lecturas combinen base de datos y API.
+    """
+    gateway = SqliteGateway(db_path, pool_size=1)
+    await gateway.run(migrate)
+    await gateway.executemany(
+        "INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types, origin) VALUES (?, ?, ?, ?, ?, 'custom')",
+        [(f'custom-{number}', number, encode_column(['static']), encode_column({'front_default': None}),
+          encode_column(['electric'])) for number in range(1, rows + 1)])
+    gateway.close()
+
+
+async def start_stub(stub: StubPokeApi) -> Tuple[web.AppRunner, str]:
+    runner = web.AppRunner(stub.application())
+    await runner.setup()
+    port = free_port()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+    return runner, f'http://127.0.0.1:{port}/api/v2/pokemon/'
+
+
+async def start_app(env: Dict[str, str], workers: int) -> Tuple[subprocess.Popen, str]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--workers', str(workers), '--log-level', 'warning'],
+        cwd=ROOT, env={**os.environ, **env})
+    base_url = f'http://127.0.0.1:{port}'
+    async with aiohttp.ClientSession() as session:
+        for _ in range(200):
+            if process.poll() is not None:
+                raise RuntimeError('The application exited during startup')
+            try:
+                async with session.get(f'{base_url}/openapi.json') as response:
+                    if response.status == 200:
+                        return process, base_url
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.05)
+    process.terminate()
+    raise RuntimeError('The application did not start in time')
+
+
+async def drive(session: aiohttp.ClientSession, base_url: str, scenario: Scenario, concurrency: int,
+                requests: int) -> Result:
+    """
+    Lanza `requests` peticiones del escenario con `concurrency` clientes simultáneos.
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def client() -> None:
+        nonlocal errors
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                async with session.request(scenario.method, base_url + scenario.path(index),
+                                           json=scenario.body(index) if scenario.body else None) as response:
+                    await response.read()
+                    if response.status >= 400:
+                        errors += 1
+            except aiohttp.ClientError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return Result(scenario.name, concurrency, requests, errors, round(requests / elapsed, 1),
+                  *(round(percentile(latencies, fraction) * 1000, 2) for fraction in (0.5, 0.95, 0.99)))
+
+
+def print_result(result: Result, baseline: Dict[Tuple[str, int], dict]) -> None:
+    line = (f'{result.scenario:<16} c={result.concurrency:<4} {result.rps:>9.1f} rps  p50 {result.p50_ms:>8.2f} ms  '
+            f'p95 {result.p95_ms:>8.2f} ms  p99 {result.p99_ms:>8.2f} ms  errores {result.errors}')
+    previous = baseline.get((result.scenario, result.concurrency))
+    if previous:
+        rps_change = (result.rps / previous['rps'] - 1) * 100
+        p99_change = (result.p99_ms / previous['p99_ms'] - 1) * 100
+        line += f'  (rps {rps_change:+.1f}%, p99 {p99_change:+.1f}%)'
+    print(line, flush=True)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    stub = StubPokeApi(count=args.catalog_size, latency=args.latency, error_rate=args.error_rate,
+                       payload_padding=args.payload_padding, seed=args.seed)
+    runner, pokeapi_url = await start_stub(stub)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as previous:
+            baseline = {(item['scenario'], item['concurrency']): item for item in json.load(previous)['results']}
+    selected = [scenario for scenario in scenarios(args.catalog_size)
+                if not args.scenarios or scenario.name in args.scenarios]
+    results: List[Result] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'pokemon.db')
+        await seed_database(db_path, args.seed_rows)
+        env = {'POKEAPI_URL': pokeapi_url, 'DB_PATH': db_path,
+               'HTTP_CACHE_PATH': os.path.join(workdir, 'pokeapi_cache.db'),
+               **dict(item.split('=', 1) for item in args.env)}
+        process, base_url = await start_app(env, args.workers)
+        try:
+            connector = aiohttp.TCPConnector(limit=max(args.concurrency))
+            async with aiohttp.ClientSession(connector=connector) as session:
+                for scenario in selected:
+                    await drive(session, base_url, scenario, 1, args.warmup)
+                    for concurrency in args.concurrency:
+                        result = await drive(session, base_url, scenario, concurrency, args.requests)
+                        print_result(result, baseline)
+                        results.append(result)
+        finally:
+            process.terminate()
+            process.wait()
+            await runner.cleanup()
+    config = {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')}
+    return {'commit': git_commit(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': sys.version.split()[0],
+            'config': config, 'results': [asdict(result) for result in results]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark de carga de la API contra un PokeAPI local.')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--requests', type=int, default=500, help='Peticiones por escenario y nivel de concurrencia.')
+    parser.add_argument('--warmup', type=int, default=100,
+                        help='Peticiones previas de cada escenario; con 100 recorren todo el catálogo consultado, de modo '
+                             'que los resultados no dependen del orden de los escenarios.')
+    parser.add_argument('--scenarios', nargs='*', help='Escenarios a medir (por defecto todos).')
+    parser.add_argument('--catalog-size', type=int, default=150)
+    parser.add_argument('--latency', type=float, default=0.02, help='Latencia simulada de PokeAPI en segundos.')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--payload-padding', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--seed-rows', type=int, default=50, help='Pokémon editados guardados antes de empezar.')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--env', action='append', default=[], help='Variable de entorno extra para la app (CLAVE=VALOR).')
+    parser.add_argument('--output', help='Archivo JSON de resultados (por defecto benchmarks/results/<commit>-<fecha>.json).')
+    parser.add_argument('--baseline', help='Resultados de una ejecución anterior con los que comparar.')
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results',
+                                         f'{report["commit"] or "local"}-{time.strftime("%Y%m%d-%H%M%S")}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f'Resultados en {output}')
+
+
+if __name__ == '__main__':
+    main()
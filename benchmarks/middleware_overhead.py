@@ -0,0 +1,91 @@
+"""
+Mide el coste por petición de los middlewares.
+
+Compara la aplicación sin middleware, con la implementación anterior basada en `BaseHTTPMiddleware`, con el
+`ExceptionMiddleware` ASGI actual y con el `MetricsMiddleware`, llamando a la aplicación ASGI directamente (sin red
+ni servidor) para que solo se mida el middleware:
+
+    python -m benchmarks.middleware_overhead [--requests 20000]
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from api.exception_handler import ExceptionMiddleware
+from api.metrics_middleware import MetricsMiddleware
+from infrastructure.adapters.metrics import MetricsRegistry
+
+
+class BaseHttpExceptionMiddleware(BaseHTTPMiddleware):
+    """
+    Implementación anterior, conservada solo como referencia para la comparación.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            return JSONResponse(status_code=400, content={"message": str(exc), "ExceptionType": exc.__class__.__name__})
+
+
+def build_app(middleware: type | None, **options) -> FastAPI:
+    application = FastAPI()
+
+    @application.get('/ping')
+    async def ping() -> dict:
+        return {'pong': True}
+
+    if middleware is not None:
+        application.add_middleware(middleware, **options)
+    return application
+
+
+async def measure(application: FastAPI, requests: int) -> float:
+    """
+    Devuelve los microsegundos por petición de `GET /ping`.
+    """
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+             'path': '/ping', 'raw_path': b'/ping', 'root_path': '', 'query_string': b'', 'headers': [],
+             'client': ('127.0.0.1', 1), 'server': ('127.0.0.1', 80)}
+
+    async def receive() -> dict:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    for _ in range(500):
+        await application(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await application(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def run(requests: int) -> None:
+    applications = {
+        'sin middleware': build_app(None),
+        'BaseHTTPMiddleware': build_app(BaseHttpExceptionMiddleware),
+        'ExceptionMiddleware (ASGI)': build_app(ExceptionMiddleware),
+        'MetricsMiddleware (ASGI)': build_app(MetricsMiddleware, metrics=MetricsRegistry()),
+    }
+    baseline = None
+    for label, application in applications.items():
+        cost = await measure(application, requests)
+        baseline = cost if baseline is None else baseline
+        print(f'{label:<28} {cost:8.1f} µs/petición  ({cost - baseline:+.1f} µs)')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Coste por petición de los middlewares.')
+    parser.add_argument('--requests', type=int, default=20000)
+    asyncio.run(run(parser.parse_args().requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Mide el tiempo de arranque de la aplicación.
+
+Muestra tres cosas, cada una en procesos nuevos para que no influyan los módulos ya importados:
+
+* El coste de importación de `main` según `python -X importtime`: los módulos de la aplicación y los paquetes
+  externos que más tardan.
+* El coste de cada paso del arranque: descubrir los controladores, importar cada uno, crear el contenedor
+  (wiring) y cablear cada módulo por separado, y registrar sus rutas.
+* El tiempo hasta la primera respuesta con uvicorn en cada modo de arranque (manifiesto estático o recorrido
+  del directorio, `LAZY_STARTUP`), como mediana de varias ejecuciones.
+
+    python -m benchmarks.startup_time [--runs 5] [--top 15]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PACKAGES = ('api', 'application', 'domain', 'infrastructure', 'main')
+MODES = {
+    'manifiesto': {'ROUTES_MANIFEST': 'true', 'LAZY_STARTUP': 'false'},
+    'recorrido del directorio': {'ROUTES_MANIFEST': 'false', 'LAZY_STARTUP': 'false'},
+    'manifiesto + LAZY_STARTUP': {'ROUTES_MANIFEST': 'true', 'LAZY_STARTUP': 'true'},
+}
+
+
+def import_times() -> List[Tuple[str, int, int, int]]:
+    """
+    Importa `main` con `-X importtime` y devuelve `(módulo, nivel, propio µs, acumulado µs)` por módulo.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), level, int(own), int(cumulative)))
+    return entries
+
+
+def print_import_report(top: int) -> None:
+    entries = import_times()
+    total = next(cumulative for name, _, _, cumulative in entries if name == 'main')
+    print(f'Importar main: {total / 1000:.1f} ms\n')
+
+    print('Módulos de la aplicación (propio / acumulado):')
+    project = [entry for entry in entries if entry[0].split('.')[0] in PROJECT_PACKAGES]
+    for name, _, own, cumulative in sorted(project, key=lambda entry: -entry[3])[:top]:
+        print(f'  {name:<60} {own / 1000:7.1f} ms {cumulative / 1000:8.1f} ms')
+
+    print('\nPaquetes externos (acumulado, primera importación):')
+    packages: Dict[str, int] = {}
+    for name, _, _, cumulative in entries:
+        package = name.split('.')[0]
+        if package not in PROJECT_PACKAGES and name == package:
+            packages[package] = max(packages.get(package, 0), cumulative)
+    for package, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f'  {package:<60} {cumulative / 1000:8.1f} ms')
+
+
+def measure_phases() -> Dict[str, float]:
+    """
+    Se ejecuta en el proceso hijo: mide cada paso del arranque por separado, en milisegundos.
+    """
+    phases: Dict[str, float] = {}
+
+    def step(label: str, started: float) -> float:
+        now = time.perf_counter()
+        phases[label] = round((now - started) * 1000, 2)
+        return now
+
+    started = time.perf_counter()
+    import fastapi
+    started = step('import fastapi', started)
+    from api import Handlers
+    modules = Handlers.modules()
+    started = step('descubrir controladores', started)
+    import importlib
+    for module in modules:
+        importlib.import_module(module)
+        started = step(f'importar {module}', started)
+    from infrastructure.container import Container
+    started = step('importar infrastructure.container', started)
+    container = Container()
+    started = step('Container() (wiring de todos los módulos)', started)
+    container.unwire()
+    started = time.perf_counter()
+    for module in modules:
+        container.wire(modules=[module])
+        started = step(f'wiring {module}', started)
+    application = fastapi.FastAPI()
+    for module in modules:
+        application.include_router(importlib.import_module(module).router)
+        started = step(f'rutas {module}', started)
+    return phases
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(env: Dict[str, str]) -> float:
+    """
+    Arranca uvicorn sobre una base de datos temporal y devuelve los milisegundos hasta la primera respuesta de
+    `/metrics`.
+    """
+    port = free_port()
+    workdir = tempfile.TemporaryDirectory()
+    env = {**env, 'DB_PATH': os.path.join(workdir.name, 'pokemon.db'),
+           'HTTP_CACHE_PATH': os.path.join(workdir.name, 'pokeapi_cache.db')}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--log-level', 'warning'], cwd=ROOT, env={**os.environ, **env})
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError('The application exited during startup')
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics', timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait()
+        workdir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Coste de arranque de la aplicación.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_phases()))
+        return
+
+    print_import_report(args.top)
+
+    print('\nPasos del arranque:')
+    completed = subprocess.run([sys.executable, '-m', 'benchmarks.startup_time', '--child'], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    for label, milliseconds in json.loads(completed.stdout.splitlines()[-1]).items():
+        print(f'  {label:<60} {milliseconds:8.2f} ms')
+
+    print(f'\nHasta la primera respuesta (mediana de {args.runs}):')
+    for label, env in MODES.items():
+        runs = [time_to_first_request(env) for _ in range(args.runs)]
+        print(f'  {label:<60} {statistics.median(runs):8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
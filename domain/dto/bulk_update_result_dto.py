@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class BulkUpdateResultDto(BaseModel):
+    pokedex_number: int
+    status: str
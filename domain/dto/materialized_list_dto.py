@@ -0,0 +1,23 @@
+from typing import Dict, Generic, Iterable, List, TypeVar
+
+T = TypeVar('T')
+
+
+class MaterializedListDto(List[T], Generic[T]):
+    """
+    Lista de resultados que el repositorio conserva y reutiliza entre peticiones mientras no cambian los datos.
+
+    `encoded` guarda su serialización JSON la primera vez que se envía, para que las respuestas siguientes sean
+    una copia de esos bytes, y `encoded_projections` la de cada proyección pedida. Al ser compartida, no debe
+    modificarse.
+
+    `complete` es False si falta parte de los datos porque PokeAPI no respondió (el listado falló o algún detalle
+    no llegó a tiempo): esa lista no se conserva ni se identifica con un ETag.
+    """
+
+    encoded: bytes | None = None
+    encoded_projections: Dict[tuple, bytes] | None = None
+
+    def __init__(self, items: Iterable[T] = (), complete: bool = True):
+        super().__init__(items)
+        self.complete = complete
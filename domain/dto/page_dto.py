@@ -0,0 +1,64 @@
+import base64
+import json
+from typing import Generic, List, TypeVar
+
+T = TypeVar('T')
+
+MAX_PAGE_SIZE = 100
+"""Tamaño máximo de página: cada elemento de una página puede costar una consulta de detalle a PokeAPI."""
+
+
+class PageRequestDto:
+    """
+    Petición de una página del catálogo, ordenado por número de Pokédex.
+
+    `after` es el último número de Pokédex ya entregado (paginación por keyset en la base de datos) y
+    `upstream_offset` cuántos elementos del listado de PokeAPI ya se consumieron. Ambos viajan juntos en un
+    cursor opaco para que el cliente solo tenga que devolverlo.
+    """
+
+    def __init__(self, limit: int, after: int | None = None, upstream_offset: int = 0):
+        self.limit = limit
+        self.after = after
+        self.upstream_offset = upstream_offset
+
+    @classmethod
+    def from_cursor(cls, limit: int, cursor: str) -> 'PageRequestDto':
+        """
+        Reconstruye la petición a partir del cursor devuelto en la página anterior.
+
+        Raises:
+            ValueError: Si el cursor no es válido.
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            state = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return cls(limit, int(state['after']), int(state['offset']))
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Invalid cursor")
+
+    def cursor_after(self, last_pokedex_number: int, consumed_upstream: int) -> str:
+        """
+        Genera el cursor de la página siguiente.
+
+        Args:
+            last_pokedex_number (int): Último número de Pokédex incluido en esta página.
+            consumed_upstream (int): Elementos del listado de PokeAPI consumidos en esta página.
+        """
+        state = {'after': last_pokedex_number, 'offset': self.upstream_offset + consumed_upstream}
+        return base64.urlsafe_b64encode(json.dumps(state, separators=(',', ':')).encode('ascii')).decode('ascii').rstrip('=')
+
+    def key(self) -> tuple:
+        return self.limit, self.after, self.upstream_offset
+
+
+class PageDto(Generic[T]):
+    """
+    Página de resultados y cursor para pedir la siguiente (None si no hay más). `complete` es False si falta
+    parte de la página porque PokeAPI no respondió.
+    """
+
+    def __init__(self, items: List[T], next_cursor: str | None, complete: bool = True):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.complete = complete
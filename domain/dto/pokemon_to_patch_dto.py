@@ -0,0 +1,18 @@
+from typing import Any, Dict, List
+
+
+class PokemonToPatchDto:
+    def __init__(self, pokedex_number: int, name: str = None, abilities: List[str] = None,
+                 sprites: Dict[str, Any] = None, types: List[str] = None):
+        self.pokedex_number = pokedex_number
+        self.name = name
+        self.abilities = abilities
+        self.sprites = sprites
+        self.types = types
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        Devuelve solo los campos proporcionados, indexados por su nombre.
+        """
+        fields = {'name': self.name, 'abilities': self.abilities, 'sprites': self.sprites, 'types': self.types}
+        return {field: value for field, value in fields.items() if value is not None}
@@ -0,0 +1,94 @@
+from typing import Any, Dict, Tuple
+
+SPECIFIC_FIELDS = ('name', 'pokedex_number', 'abilities', 'sprites', 'types')
+
+
+class ProjectionDto:
+    """
+    Proyección de la información específica de un Pokémon: qué campos se devuelven (`fields`) y qué partes de
+    `sprites` se conservan (`sprites`, con rutas separadas por puntos para las claves anidadas, por ejemplo
+    `other.official-artwork.front_default`). None en cualquiera de los dos significa que no se recorta.
+    """
+
+    def __init__(self, fields: Tuple[str, ...] | None = None, sprites: Tuple[str, ...] | None = None):
+        self.fields = fields
+        self.sprites = sprites
+        self._sprite_tree = self._tree(sprites) if sprites else None
+        self._include = {field: True for field in fields or SPECIFIC_FIELDS}
+        if self._sprite_tree is not None and 'sprites' in self._include:
+            self._include['sprites'] = self._sprite_tree
+
+    @classmethod
+    def from_params(cls, fields: str | None, sprites: str | None) -> 'ProjectionDto | None':
+        """
+        Construye la proyección a partir de los parámetros `fields` y `sprites`, listas separadas por comas.
+        Devuelve None si no se pidió ninguna.
+
+        Raises:
+            ValueError: Si se pide un campo desconocido o una ruta de `sprites` vacía.
+        """
+        if not fields and not sprites:
+            return None
+        selected = cls._split(fields) if fields else None
+        if selected is not None:
+            unknown = [field for field in selected if field not in SPECIFIC_FIELDS]
+            if unknown or not selected:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        paths = cls._split(sprites) if sprites else None
+        if paths is not None and (not paths or any('' in path.split('.') for path in paths)):
+            raise ValueError("Invalid sprites selector")
+        return cls(selected, paths)
+
+    def includes(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
+
+    def include(self) -> Dict[str, Any]:
+        """
+        Argumento `include` de pydantic para serializar un Pokémon con esta proyección.
+        """
+        return self._include
+
+    def key(self) -> tuple:
+        return self.fields, self.sprites
+
+    def trim_sprites(self, sprites: Dict[str, Any] | None) -> Dict[str, Any] | None:
+        """
+        Devuelve una copia de `sprites` con solo las rutas seleccionadas, sin modificar el original.
+        """
+        if self._sprite_tree is None or sprites is None:
+            return sprites
+        return self._select(sprites, self._sprite_tree)
+
+    @staticmethod
+    def _split(value: str) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(part.strip() for part in value.split(',') if part.strip()))
+
+    @staticmethod
+    def _tree(paths: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Convierte las rutas en un árbol de claves; una ruta más corta incluye todo lo que cuelga de ella.
+        """
+        tree: Dict[str, Any] = {}
+        for path in paths:
+            node = tree
+            *parents, leaf = path.split('.')
+            for part in parents:
+                child = node.setdefault(part, {})
+                if child is True:
+                    break
+                node = child
+            else:
+                node[leaf] = True
+        return tree
+
+    @classmethod
+    def _select(cls, value: Dict[str, Any], tree: Dict[str, Any]) -> Dict[str, Any]:
+        selected = {}
+        for key, subtree in tree.items():
+            if key not in value:
+                continue
+            if subtree is True:
+                selected[key] = value[key]
+            elif isinstance(value[key], dict):
+                selected[key] = cls._select(value[key], subtree)
+        return selected
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, AsyncIterator, Dict, List
 from domain.dto.general_pokemon_dto import GeneralPokemonDto
+from domain.dto.page_dto import PageDto, PageRequestDto
+from domain.dto.projection_dto import ProjectionDto
 from domain.dto.specific_pokemon_dto import SpecificPokemonDto
 from domain.entities.pokemon import Pokemon
 
@@ -23,6 +25,39 @@ class PokemonRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_specific_batch(self, identifiers: List[str]) -> Dict[str, SpecificPokemonDto | str | None]:
+        """
+        Método para obtener varios Pokémon específicos a la vez por nombre o número de Pokédex.
+        Devuelve cada identificador recibido con su Pokémon, None si no existe o `'unavailable'` si no pudo
+        consultarse.
+        """
+        pass
+
+    @abstractmethod
+    def stream_specific(self, projection: ProjectionDto | None = None) -> AsyncIterator[SpecificPokemonDto]:
+        """
+        Método para recorrer la lista específica de todos los Pokémon entregando cada uno en cuanto está disponible.
+        Con `projection` puede omitir los campos no pedidos.
+        """
+        pass
+
+    @abstractmethod
+    async def get_general_page(self, page: PageRequestDto) -> PageDto[GeneralPokemonDto]:
+        """
+        Método para obtener una página de la lista general de Pokémon, ordenada por número de Pokédex.
+        """
+        pass
+
+    @abstractmethod
+    async def get_specific_page(self, page: PageRequestDto,
+                                projection: ProjectionDto | None = None) -> PageDto[SpecificPokemonDto]:
+        """
+        Método para obtener una página de la lista específica de Pokémon, ordenada por número de Pokédex.
+        Con `projection` puede omitir los campos no pedidos.
+        """
+        pass
+
     @abstractmethod
     async def update(self, pokemon: Pokemon) -> None:
         """
@@ -30,9 +65,32 @@ class PokemonRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def patch(self, pokedex_number: int, changes: Dict[str, Any]) -> bool:
+        """
+        Método para actualizar solo algunos campos de un Pokémon. Devuelve False si el Pokémon no existe.
+        """
+        pass
+
     @abstractmethod
     async def get_one(self, pokedex_number: int) -> Pokemon:
         """
         Método para obtener un Pokémon específico por su número de Pokédex.
         """
         pass
+
+    @abstractmethod
+    async def get_many(self, pokedex_numbers: List[int]) -> Dict[int, Pokemon | None]:
+        """
+        Método para obtener varios Pokémon a la vez por su número de Pokédex.
+        Devuelve cada Pokémon resuelto, indexado por su número de Pokédex, con None si se sabe que no existe;
+        los que no pudieron comprobarse (PokeAPI no disponible) no aparecen.
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, pokemons: List[Pokemon]) -> None:
+        """
+        Método para actualizar los datos de varios Pokémon en una única operación.
+        """
+        pass
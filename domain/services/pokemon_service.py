@@ -1,3 +1,7 @@
+from typing import List
+
+from domain.dto.bulk_update_result_dto import BulkUpdateResultDto
+from domain.dto.pokemon_to_patch_dto import PokemonToPatchDto
 from domain.dto.pokemon_to_update_dto import PokemonToUpdateDto
 from domain.entities.pokemon import Pokemon
 from domain.repositories.pokemon_repository import PokemonRepository
@@ -40,3 +44,53 @@ class PokemonService:
             types=pokemon_to_update.types
         )
         await self.__pokemon_repository.update(pokemon_searched)
+
+    async def update_many(self, pokemons_to_update: List[PokemonToUpdateDto]) -> List[BulkUpdateResultDto]:
+        """
+        Actualiza varios Pokémon a la vez.
+
+        Comprueba la existencia de todos ellos con una única búsqueda en el repositorio, aplica los cambios sobre
+        los encontrados y los guarda juntos. Los que no existen se informan como `not_found` y los que no pudieron
+        comprobarse porque PokeAPI no está disponible como `unavailable`, sin impedir que se guarden los demás;
+        si un mismo número de Pokédex se repite, se aplican los cambios en orden.
+
+        :param pokemons_to_update: Lista de DTOs con los datos a actualizar de cada Pokémon.
+        :return: El resultado (`updated`, `not_found` o `unavailable`) de cada elemento, en el mismo orden.
+        """
+        pokemons = await self.__pokemon_repository.get_many(
+            list(dict.fromkeys(pokemon.pokedex_number for pokemon in pokemons_to_update)))
+        results = []
+        for pokemon_to_update in pokemons_to_update:
+            if pokemon_to_update.pokedex_number not in pokemons:
+                results.append(BulkUpdateResultDto(pokedex_number=pokemon_to_update.pokedex_number,
+                                                   status='unavailable'))
+                continue
+            pokemon_searched = pokemons[pokemon_to_update.pokedex_number]
+            if pokemon_searched is None:
+                results.append(BulkUpdateResultDto(pokedex_number=pokemon_to_update.pokedex_number, status='not_found'))
+                continue
+            pokemon_searched.update(
+                name=pokemon_to_update.name,
+                abilities=pokemon_to_update.abilities,
+                sprites=pokemon_to_update.sprites,
+                types=pokemon_to_update.types
+            )
+            results.append(BulkUpdateResultDto(pokedex_number=pokemon_to_update.pokedex_number, status='updated'))
+        updated = dict.fromkeys(result.pokedex_number for result in results if result.status == 'updated')
+        if updated:
+            await self.__pokemon_repository.update_many([pokemons[number] for number in updated])
+        return results
+
+    async def patch(self, pokemon_to_patch: PokemonToPatchDto) -> None:
+        """
+        Actualiza solo los campos proporcionados de un Pokémon, sin leer antes la entidad completa.
+
+        :param pokemon_to_patch: Objeto DTO con el número de Pokédex y los campos a actualizar.
+        :raises Exception: Si no se proporciona ningún campo o el Pokémon no es encontrado en el repositorio.
+        :return: None
+        """
+        changes = pokemon_to_patch.changes()
+        if not changes:
+            raise Exception("No fields to update")
+        if not await self.__pokemon_repository.patch(pokemon_to_patch.pokedex_number, changes):
+            raise Exception("Pokemon not found")
@@ -0,0 +1,34 @@
+"""
+Genera `api/routes_manifest.py`, la lista estática de módulos de controladores que usa `Handlers` al arrancar.
+
+    python generate_routes_manifest.py
+
+Hay que ejecutarlo al añadir o eliminar un controlador en `api/controllers`.
+"""
+import os
+
+from api import Handlers
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api', 'routes_manifest.py')
+
+HEADER = '''"""
+Manifiesto estático de los módulos de controladores, generado con `python generate_routes_manifest.py`.
+
+`Handlers` lo usa en lugar de recorrer `api/controllers` en cada arranque. No editar a mano: regenerar al añadir o
+eliminar un controlador (una prueba comprueba que coincide con el directorio).
+"""
+'''
+
+
+def render(modules) -> str:
+    return HEADER + 'CONTROLLER_MODULES = (\n' + ''.join(f"    '{module}',\n" for module in modules) + ')\n'
+
+
+def main() -> None:
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as manifest:
+        manifest.write(render(Handlers.scan_modules()))
+    print(f'{MANIFEST_PATH}: {len(Handlers.scan_modules())} controladores')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import sqlite3
+import time
+from typing import Iterator, List, Tuple
+
+from infrastructure.adapters.pokeapi_client import PokeApiClient, pokedex_number_from_url
+from infrastructure.adapters.pokemon_codec import encode_column
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+
+
+class CatalogSync:
+    """
+    Copia el catálogo completo de PokeAPI en la tabla local `pokemon`.
+
+    Pagina el listado de forma concurrente, consulta los detalles con paralelismo acotado y escribe por lotes,
+    cada uno en una única transacción junto con su registro en `sync_state`. Por eso una ejecución interrumpida
+    se puede reanudar sin repetir los lotes ya escritos, y las ejecuciones incrementales solo consultan los
+    registros nuevos o cuyo nombre cambió en el listado (o todos, revalidándolos, con `revalidate`).
+    Las filas editadas por los usuarios (`origin='custom'`) nunca se sobrescriben.
+    """
+
+    def __init__(self, pokeapi_client: PokeApiClient, sqlite_gateway: SqliteGateway, api_url: str,
+                 page_size: int = 200, concurrency: int = 20, batch_size: int = 200, binary_encoding: bool = False):
+        """
+        Args:
+            pokeapi_client (PokeApiClient): Cliente HTTP compartido para las consultas a PokeAPI.
+            sqlite_gateway (SqliteGateway): Acceso a la base de datos local.
+            api_url (str): URL base del recurso `pokemon` de PokeAPI.
+            page_size (int): Elementos por página del listado.
+            concurrency (int): Peticiones simultáneas como máximo hacia PokeAPI.
+            batch_size (int): Registros escritos por transacción.
+            binary_encoding (bool): Si es True las columnas estructuradas se guardan como JSON comprimido.
+        """
+        self.pokeapi_client = pokeapi_client
+        self.sqlite_gateway = sqlite_gateway
+        self.api_url = api_url
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.binary_encoding = binary_encoding
+
+    async def run(self, full: bool = False, revalidate: bool = False) -> dict:
+        """
+        Ejecuta la sincronización.
+
+        Args:
+            full (bool): Si es True vuelve a consultar y escribir todos los registros.
+            revalidate (bool): Si es True vuelve a consultar todos los registros (con peticiones condicionales
+                si hay caché HTTP) pero solo escribe los que cambiaron.
+
+        Returns:
+            dict: Resumen con los registros listados, omitidos, consultados, escritos, sin cambios y fallidos.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        listing = await self._list_catalog(semaphore)
+        synced = {number: (name, content_hash) for number, name, content_hash in
+                  await self.sqlite_gateway.fetch_all('SELECT pokedex_number, name, content_hash FROM sync_state')}
+        pending = [(number, name, url) for number, name, url in listing
+                   if full or revalidate or number not in synced or synced[number][0] != name]
+        report = {'listed': len(listing), 'skipped': len(listing) - len(pending), 'fetched': 0, 'written': 0,
+                  'unchanged': 0, 'failed': 0}
+
+        async def fetch_details(url: str) -> dict | None:
+            async with semaphore:
+                return await self.pokeapi_client.get_pokemon(url)
+
+        for batch in self._chunks(pending, self.batch_size):
+            details = await asyncio.gather(*[fetch_details(url) for _, _, url in batch], return_exceptions=True)
+            rows, states = [], []
+            for (number, _, _), data in zip(batch, details):
+                if data is None or isinstance(data, BaseException):
+                    report['failed'] += 1
+                    continue
+                report['fetched'] += 1
+                abilities = encode_column(data['abilities'], self.binary_encoding)
+                sprites = encode_column(data['sprites'], self.binary_encoding)
+                types = encode_column(data['types'], self.binary_encoding)
+                content_hash = self._content_hash(data)
+                states.append((data['id'], data['name'], content_hash, time.time()))
+                if not full and synced.get(number, (None, None))[1] == content_hash:
+                    report['unchanged'] += 1
+                    continue
+                rows.append((data['name'], data['id'], abilities, sprites, types))
+            await self.sqlite_gateway.run(lambda conn: self._write_batch(conn, rows, states))
+            report['written'] += len(rows)
+        return report
+
+    async def _list_catalog(self, semaphore: asyncio.Semaphore) -> List[Tuple[int, str, str]]:
+        """
+        Obtiene el listado completo: la primera página indica el total y el resto se piden en paralelo.
+        """
+        async def fetch_page(offset: int) -> dict:
+            async with semaphore:
+                page = await self.pokeapi_client.get_json(f"{self.api_url}?limit={self.page_size}&offset={offset}")
+            if page is None:
+                raise RuntimeError(f"Could not list pokemon at offset {offset}")
+            return page
+
+        first_page = await fetch_page(0)
+        pages = [first_page] + list(await asyncio.gather(
+            *[fetch_page(offset) for offset in range(self.page_size, first_page['count'], self.page_size)]))
+        listing = []
+        for page in pages:
+            for item in page['results']:
+                pokedex_number = pokedex_number_from_url(item['url'])
+                if pokedex_number is not None:
+                    listing.append((pokedex_number, item['name'], item['url']))
+        return listing
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, rows: list, states: list) -> None:
+        conn.executemany('''
+            INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types, origin)
+            VALUES (?, ?, ?, ?, ?, 'mirror')
+            ON CONFLICT(pokedex_number) DO UPDATE SET name=excluded.name, abilities=excluded.abilities,
+                sprites=excluded.sprites, types=excluded.types
+            WHERE pokemon.origin = 'mirror'
+        ''', rows)
+        conn.executemany('''
+            INSERT INTO sync_state (pokedex_number, name, content_hash, synced_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(pokedex_number) DO UPDATE SET name=excluded.name, content_hash=excluded.content_hash,
+                synced_at=excluded.synced_at
+        ''', states)
+
+    @staticmethod
+    def _content_hash(data: dict) -> str:
+        return hashlib.sha1(encode_column(data).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _chunks(items: list, size: int) -> Iterator[list]:
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
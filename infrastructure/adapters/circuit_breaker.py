@@ -0,0 +1,74 @@
+import os
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """
+    Cortocircuito para las peticiones a PokeAPI.
+
+    Cerrado, deja pasar todas las peticiones y cuenta los fallos consecutivos (errores de red, timeouts y
+    respuestas 5xx o 429). Al llegar a `failure_threshold` se abre: las peticiones fallan al instante, sin ocupar
+    conexiones ni corrutinas esperando a un servicio caído, y el cliente sirve lo que tenga en caché aunque esté
+    vencido. Pasado `reset_timeout` queda semiabierto y deja pasar una única petición de prueba: si sale bien se
+    cierra y si falla se vuelve a abrir. Si la prueba nunca informa (por ejemplo, porque se canceló), otra puede
+    intentarlo tras otro `reset_timeout`.
+
+    No es seguro entre hilos: está pensado para usarse desde el event loop, y cada worker lleva el suyo.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = None, reset_timeout: float = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el cortocircuito cerrado. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            failure_threshold (int): Fallos consecutivos que lo abren (`HTTP_BREAKER_FAILURES`).
+            reset_timeout (float): Segundos que permanece abierto antes de dejar pasar una petición de prueba
+                (`HTTP_BREAKER_RESET_TIMEOUT`).
+            clock (Callable): Reloj monotónico.
+        """
+        self.failure_threshold = failure_threshold or int(os.getenv('HTTP_BREAKER_FAILURES', '5'))
+        self.reset_timeout = reset_timeout or float(os.getenv('HTTP_BREAKER_RESET_TIMEOUT', '30'))
+        self.clock = clock
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probe_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self.clock() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self) -> bool:
+        """
+        Indica si puede salir una petición. En estado semiabierto solo la primera obtiene permiso.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+        now = self.clock()
+        if self._probe_at is None or now - self._probe_at >= self.reset_timeout:
+            self._probe_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = self._probe_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            # Un fallo estando semiabierto (la prueba) vuelve a abrirlo durante otro `reset_timeout`.
+            self._opened_at = self.clock()
+            self._probe_at = None
@@ -0,0 +1,66 @@
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.adapters.write_behind_queue import WriteBehindQueue
+
+
+class DataVersion:
+    """
+    Versión de los datos que sirve la aplicación, de la que se derivan los ETag de los endpoints de lectura.
+
+    Se guarda en la tabla `data_version` de la base de datos, de modo que la comparten todos los workers y
+    procesos que usan el mismo archivo. Los triggers de la migración 5 la incrementan en la misma transacción que
+    cada escritura en `pokemon`, y `bump` la incrementa cuando cambian los datos de PokeAPI (una revalidación que
+    trae un cuerpo distinto o un catálogo reconstruido con otro contenido).
+
+    Mientras la cola de commit agrupado tiene escrituras sin confirmar, las lecturas ya las ven pero la versión
+    todavía no: en ese intervalo no hay versión y no se usan ETag.
+    """
+
+    def __init__(self, sqlite_gateway: SqliteGateway, write_behind_queue: WriteBehindQueue | None = None):
+        """
+        Args:
+            sqlite_gateway (SqliteGateway): Acceso a la base de datos que guarda la versión.
+            write_behind_queue (WriteBehindQueue | None): Cola de commit agrupado; solo se tiene en cuenta si está
+                habilitada.
+        """
+        self.sqlite_gateway = sqlite_gateway
+        self.write_behind_queue = write_behind_queue if write_behind_queue and write_behind_queue.enabled else None
+
+    async def current(self) -> str | None:
+        """
+        Devuelve la versión actual como `<epoch>-<valor>`, o None si hay escrituras pendientes de confirmar.
+        """
+        if self.write_behind_queue is not None and self.write_behind_queue.pending_items():
+            return None
+        return await self.stored()
+
+    async def stored(self) -> str:
+        """
+        Devuelve la versión guardada en la base de datos como `<epoch>-<valor>`, sin tener en cuenta las escrituras
+        pendientes de la cola.
+        """
+        epoch, value = await self.sqlite_gateway.fetch_one('SELECT epoch, value FROM data_version WHERE id = 1',
+                                                           name='data_version.stored')
+        return f'{epoch}-{value}'
+
+    async def bump(self) -> None:
+        await self.sqlite_gateway.execute('UPDATE data_version SET value = value + 1 WHERE id = 1',
+                                          name='data_version.bump')
+
+    @staticmethod
+    def etag(version: str, variant: str = '') -> str:
+        """
+        ETag fuerte de `version`. `variant` distingue representaciones distintas de una misma URL.
+        """
+        suffix = f'-{variant}' if variant else ''
+        return f'"{version}{suffix}"'
+
+    @staticmethod
+    def matches(if_none_match: str | None, etag: str) -> bool:
+        """
+        Indica si la cabecera `If-None-Match` incluye `etag` (o es `*`), con la comparación débil que usa
+        esta cabecera.
+        """
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+        return '*' in candidates or any(candidate.removeprefix('W/') == etag for candidate in candidates)
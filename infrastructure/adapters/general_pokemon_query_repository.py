@@ -1,62 +1,93 @@
-import sqlite3
-import aiohttp
-from typing import List
+from typing import List, Tuple
+from pydantic import ValidationError
 from domain.dto.general_pokemon_dto import GeneralPokemonDto
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient, UpstreamUnavailableError
+from infrastructure.adapters.pokemon_search import search_query
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
 
 
 class GeneralPokemonQueryRepository:
-    def __init__(self, db_path: str, api_url: str):
-        self.db_path = db_path
+    def __init__(self, sqlite_gateway: SqliteGateway, api_url: str, pokeapi_client: PokeApiClient,
+                 pokemon_cache: LruTtlCache):
+        self.sqlite_gateway = sqlite_gateway
         self.api_url = api_url
-        self.HTTP_OK = 200
+        self.pokeapi_client = pokeapi_client
+        self.pokemon_cache = pokemon_cache
 
-    def get_single_from_db(self, data_to_search: str) -> GeneralPokemonDto | None:
+    async def get_single_from_db(self, data_to_search: str) -> GeneralPokemonDto | None:
         """
         Busca un Pokémon en la base de datos SQLite por nombre o número de Pokédex.
+        Si varios nombres coinciden, se prioriza la coincidencia exacta, luego por prefijo y luego por subcadena.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, pokedex_number FROM pokemon WHERE name LIKE ? OR pokedex_number=?",
-                       (f'%{data_to_search}%', data_to_search))
-        result = cursor.fetchone()
-        conn.close()
+        result = await self.sqlite_gateway.fetch_one(
+            *search_query("name, pokedex_number", data_to_search), name='general.get_single_from_db')
 
         if result:
             name, pokedex_number = result
-            return GeneralPokemonDto(name=name, resource=f"{self.api_url}{pokedex_number}/")
+            return GeneralPokemonDto.model_construct(name=name, resource=f"{self.api_url}{pokedex_number}/")
         return None
 
-    def get_all_from_db(self) -> List[GeneralPokemonDto]:
+    async def get_all_from_db(self) -> List[GeneralPokemonDto]:
         """
         Devuelve la lista de todos los Pokémon desde la base de datos.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, pokedex_number FROM pokemon")
-        results = cursor.fetchall()
-        conn.close()
+        results = await self.sqlite_gateway.fetch_all("SELECT name, pokedex_number FROM pokemon",
+                                                      name='general.get_all_from_db')
 
-        return [GeneralPokemonDto(name=name, resource=f"{self.api_url}{pokedex_number}/")
+        return [GeneralPokemonDto.model_construct(name=name, resource=f"{self.api_url}{pokedex_number}/")
+                for name, pokedex_number in results]
+
+    async def get_page_from_db(self, limit: int, after: int | None) -> List[GeneralPokemonDto]:
+        """
+        Devuelve hasta `limit` Pokémon de la base de datos con número de Pokédex mayor que `after`,
+        ordenados por número (paginación por keyset sobre el índice único de `pokedex_number`).
+        """
+        results = await self.sqlite_gateway.fetch_all(
+            "SELECT name, pokedex_number FROM pokemon WHERE pokedex_number > ? ORDER BY pokedex_number LIMIT ?",
+            (after if after is not None else -1, limit), name='general.get_page_from_db')
+
+        return [GeneralPokemonDto.model_construct(name=name, resource=f"{self.api_url}{pokedex_number}/")
                 for name, pokedex_number in results]
 
     async def get_single_from_api(self, data_to_search: str) -> List[GeneralPokemonDto]:
         """
-        Busca un Pokémon específico en la API de PokeAPI por nombre o número.
+        Busca un Pokémon específico en la API de PokeAPI por nombre o número. El detalle llega ya validado por
+        `PokeApiClient.get_pokemon`.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}{data_to_search}") as response:
-                if response.status != self.HTTP_OK:
-                    return []
-                data = await response.json()
-                return [GeneralPokemonDto(name=data["name"], resource=f"{self.api_url}{data['id']}/")]
+        data = await self.pokeapi_client.get_pokemon_cached(self.api_url, data_to_search, self.pokemon_cache)
+        if data is None:
+            return []
+        return [GeneralPokemonDto.model_construct(name=data["name"], resource=f"{self.api_url}{data['id']}/")]
 
     async def get_all_from_api(self) -> List[GeneralPokemonDto]:
         """
         Devuelve la lista de todos los Pokémon desde la API (limitada a 100 resultados).
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}?limit=100") as response:
-                if response.status != self.HTTP_OK:
-                    return []
-                data = await response.json()
-                return [GeneralPokemonDto(name=item["name"], resource=item["url"]) for item in data["results"]]
+        url = f"{self.api_url}?limit=100"
+        data = await self.pokeapi_client.get_json(url)
+        if data is None:
+            return []
+        return self._listing_to_dtos(data, url)[0]
+
+    async def get_page_from_api(self, limit: int, offset: int) -> Tuple[List[GeneralPokemonDto], int]:
+        """
+        Devuelve una página del listado de PokeAPI y el total de elementos del catálogo.
+        """
+        url = f"{self.api_url}?limit={limit}&offset={offset}"
+        data = await self.pokeapi_client.get_json(url)
+        if data is None:
+            return [], 0
+        return self._listing_to_dtos(data, url)
+
+    @staticmethod
+    def _listing_to_dtos(data: dict, url: str) -> Tuple[List[GeneralPokemonDto], int]:
+        """
+        Valida una página del listado de PokeAPI y la convierte en DTO junto con el total del catálogo.
+        Un cuerpo sin la forma esperada se trata como PokeAPI no disponible.
+        """
+        try:
+            return [GeneralPokemonDto(name=item["name"], resource=item["url"])
+                    for item in data["results"]], int(data["count"])
+        except (KeyError, TypeError, ValueError, ValidationError) as exc:
+            raise UpstreamUnavailableError(f"PokeAPI answered an invalid listing: {url}") from exc
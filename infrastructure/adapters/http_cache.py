@@ -0,0 +1,132 @@
+import json
+import os
+import re
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+@dataclass
+class CachedResponse:
+    """
+    Respuesta de PokeAPI guardada en la caché persistente junto con sus validadores.
+    """
+    url: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    max_age: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.max_age
+
+    def validators(self) -> dict:
+        """
+        Cabeceras para revalidar la entrada de forma condicional.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def json(self) -> Any:
+        return json.loads(zlib.decompress(self.body))
+
+
+class HttpCache:
+    """
+    Caché HTTP persistente en SQLite para las respuestas JSON de PokeAPI.
+
+    Vive junto a `pokemon.db` y la comparten todos los workers de uvicorn del mismo host. Guarda el cuerpo
+    comprimido con sus validadores (ETag / Last-Modified), de modo que una entrada vencida se revalida con una
+    petición condicional y, si no cambió, cuesta un 304 en lugar de descargar de nuevo el cuerpo completo.
+    """
+
+    def __init__(self, db_path: str = None, default_ttl: float = None):
+        """
+        Inicializa la caché. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            db_path (str): Ruta del archivo SQLite de la caché (`HTTP_CACHE_PATH`); por defecto
+                `pokeapi_cache.db` en el mismo directorio que `DB_PATH`.
+            default_ttl (float): Segundos que una respuesta se sirve sin revalidar cuando PokeAPI no envía
+                `Cache-Control: max-age` (`HTTP_CACHE_TTL`).
+        """
+        if db_path is None:
+            db_dir = os.path.dirname(os.getenv('DB_PATH', 'pokemon.db'))
+            db_path = os.getenv('HTTP_CACHE_PATH', os.path.join(db_dir, 'pokeapi_cache.db'))
+        self.db_path = db_path
+        self.default_ttl = default_ttl or float(os.getenv('HTTP_CACHE_TTL', '86400'))
+        self.sqlite_gateway = SqliteGateway(db_path, pool_size=2, timing_phase='cache')
+        self._schema_ready = False
+
+    async def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        await self.sqlite_gateway.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                max_age REAL NOT NULL
+            )
+        ''')
+        self._schema_ready = True
+
+    def max_age_from(self, headers: Mapping[str, str]) -> float | None:
+        """
+        Calcula cuántos segundos puede servirse una respuesta sin revalidar según su `Cache-Control`.
+        Devuelve None si la respuesta no debe guardarse.
+        """
+        cache_control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return None
+        if 'no-cache' in cache_control:
+            return 0.0
+        match = _MAX_AGE.search(cache_control)
+        return float(match.group(1)) if match else self.default_ttl
+
+    async def get(self, url: str) -> CachedResponse | None:
+        """
+        Devuelve la entrada guardada para la URL, esté vigente o no, o None si no existe.
+        """
+        await self._ensure_schema()
+        row = await self.sqlite_gateway.fetch_one(
+            'SELECT url, body, etag, last_modified, stored_at, max_age FROM http_cache WHERE url=?', (url,))
+        return CachedResponse(*row) if row else None
+
+    async def store(self, url: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Guarda (o reemplaza) el cuerpo de una respuesta 200 con sus validadores.
+        """
+        max_age = self.max_age_from(headers)
+        if max_age is None:
+            return
+        await self._ensure_schema()
+        await self.sqlite_gateway.execute('''
+            INSERT INTO http_cache (url, etag, last_modified, body, stored_at, max_age) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET etag=excluded.etag, last_modified=excluded.last_modified,
+                body=excluded.body, stored_at=excluded.stored_at, max_age=excluded.max_age
+        ''', (url, headers.get('ETag'), headers.get('Last-Modified'), zlib.compress(body), time.time(), max_age))
+
+    async def refresh(self, url: str, headers: Mapping[str, str]) -> None:
+        """
+        Renueva la vigencia de una entrada tras un 304, sin tocar el cuerpo guardado.
+        """
+        max_age = self.max_age_from(headers)
+        await self.sqlite_gateway.execute(
+            'UPDATE http_cache SET stored_at=?, max_age=?, etag=COALESCE(?, etag) WHERE url=?',
+            (time.time(), max_age if max_age is not None else 0.0, headers.get('ETag'), url))
+
+    def close(self) -> None:
+        self.sqlite_gateway.close()
@@ -0,0 +1,118 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LruTtlCache:
+    """
+    Caché en memoria acotada, con expulsión LRU y tiempo de vida (TTL) por entrada.
+
+    El tamaño se limita tanto en número de entradas como en bytes aproximados (el tamaño del valor
+    serializado a JSON). Lleva contadores de aciertos, fallos, expulsiones y expiraciones.
+    No es segura entre hilos: está pensada para usarse desde el event loop.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None, ttl: float = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa la caché. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            max_entries (int): Número máximo de entradas (`POKEAPI_CACHE_MAX_ENTRIES`).
+            max_bytes (int): Tamaño máximo aproximado en bytes (`POKEAPI_CACHE_MAX_BYTES`).
+            ttl (float): Segundos que una entrada se considera válida (`POKEAPI_CACHE_TTL`).
+            clock (Callable): Reloj monotónico usado para calcular la expiración.
+        """
+        self.max_entries = max_entries or int(os.getenv('POKEAPI_CACHE_MAX_ENTRIES', '1024'))
+        self.max_bytes = max_bytes or int(os.getenv('POKEAPI_CACHE_MAX_BYTES', '67108864'))
+        self.ttl = ttl or float(os.getenv('POKEAPI_CACHE_TTL', '300'))
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def normalize_key(key: Any) -> str:
+        """
+        Normaliza un nombre o número de Pokédex: sin espacios, en minúsculas y sin ceros a la izquierda.
+        """
+        key = str(key).strip().lower()
+        return str(int(key)) if key.isdigit() else key
+
+    @staticmethod
+    def _size_of(value: Any) -> int:
+        return len(json.dumps(value, separators=(',', ':'), default=str))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Any | None:
+        """
+        Devuelve el valor asociado a la clave, o None si no existe o ya expiró.
+        """
+        key = self.normalize_key(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float = None) -> None:
+        """
+        Guarda un valor, expulsando las entradas menos usadas recientemente si se superan los límites.
+        Los valores más grandes que `max_bytes` no se guardan.
+        """
+        key = self.normalize_key(key)
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, self._clock() + (ttl or self.ttl), size)
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate(self, key: Any) -> None:
+        """
+        Elimina una entrada de la caché si existe.
+        """
+        key = self.normalize_key(key)
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores y el tamaño actual de la caché.
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
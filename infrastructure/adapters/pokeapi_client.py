@@ -0,0 +1,375 @@
+import asyncio
+import importlib
+import json
+import os
+import random
+import re
+import time
+import zlib
+from typing import TYPE_CHECKING, Mapping, Tuple
+
+from pydantic import ValidationError
+
+from domain.dto.specific_pokemon_dto import SpecificPokemonDto
+from infrastructure.adapters.circuit_breaker import CircuitBreaker
+from infrastructure.adapters.data_version import DataVersion
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.request_timing import timed
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_POKEDEX_NUMBER = re.compile(r'/pokemon/(\d+)/?$')
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class UpstreamUnavailableError(Exception):
+    """
+    PokeAPI no está disponible (cortocircuito abierto, errores de red, timeouts o respuestas 5xx o 429 tras los
+    reintentos) y no hay copia en caché, o ha respondido con un cuerpo que no tiene la forma esperada. Se responde
+    con `status_code`.
+    """
+
+    status_code = 503
+
+
+def pokedex_number_from_url(url: str) -> int | None:
+    """
+    Extrae el número de Pokédex de la URL de un recurso `pokemon` de PokeAPI, o None si no lo contiene.
+    """
+    match = _POKEDEX_NUMBER.search(url)
+    return int(match.group(1)) if match else None
+
+
+class PokeApiClient:
+    """
+    Cliente HTTP compartido por toda la aplicación para comunicarse con PokeAPI.
+
+    Mantiene una única `aiohttp.ClientSession` con un pool de conexiones reutilizables (keep-alive)
+    y caché de DNS, de modo que las consultas no paguen de nuevo DNS, TCP y TLS en cada petición.
+    La sesión se crea y se cierra junto con el ciclo de vida (lifespan) de FastAPI.
+
+    `aiohttp` se importa al crear la sesión y no al importar el módulo, porque es la dependencia más pesada del
+    arranque; con `start_in_background` se importa en un hilo mientras la aplicación ya atiende peticiones.
+
+    Todas las peticiones (son GET, idempotentes) tienen timeouts de conexión, lectura y total, se reintentan con
+    espera exponencial y jitter ante errores de red, timeouts y respuestas 5xx o 429, y pasan por un
+    `CircuitBreaker`: mientras está abierto, o si se agotan los reintentos, se sirve la copia de la caché
+    persistente aunque esté vencida. Opcionalmente, si una petición tarda más de `hedge_delay` se lanza una segunda
+    igual y se usa la primera que responda.
+    """
+
+    def __init__(self, limit: int = None, limit_per_host: int = None, keepalive_timeout: float = None,
+                 dns_cache_ttl: int = None, http_cache: HttpCache | None = None,
+                 data_version: DataVersion | None = None, metrics: MetricsRegistry | None = None,
+                 connect_timeout: float = None, read_timeout: float = None, total_timeout: float = None,
+                 retries: int = None, backoff_base: float = None, backoff_max: float = None,
+                 hedge_delay: float = None, circuit_breaker: CircuitBreaker | None = None):
+        """
+        Inicializa el cliente con la configuración del pool de conexiones. Los valores no proporcionados
+        se leen del `.env`.
+
+        Args:
+            limit (int): Número máximo de conexiones simultáneas en el pool (`HTTP_POOL_LIMIT`).
+            limit_per_host (int): Número máximo de conexiones simultáneas hacia un mismo host
+                (`HTTP_POOL_LIMIT_PER_HOST`).
+            keepalive_timeout (float): Segundos que una conexión ociosa se mantiene abierta para ser reutilizada
+                (`HTTP_KEEPALIVE_TIMEOUT`).
+            dns_cache_ttl (int): Segundos que se conserva en caché la resolución DNS de un host (`HTTP_DNS_CACHE_TTL`).
+            http_cache (HttpCache | None): Caché persistente de respuestas con revalidación condicional.
+            data_version (DataVersion | None): Versión de los datos, que se incrementa si una revalidación trae
+                un cuerpo distinto del guardado.
+            metrics (MetricsRegistry | None): Registro donde se publican la latencia y el estado de cada petición,
+                el resultado de cada consulta a la caché persistente y los reintentos, peticiones duplicadas,
+                rechazos y respuestas vencidas servidas por la capa de resiliencia.
+            connect_timeout (float): Segundos máximos para establecer la conexión (`HTTP_TIMEOUT_CONNECT`).
+            read_timeout (float): Segundos máximos sin recibir datos del socket (`HTTP_TIMEOUT_READ`).
+            total_timeout (float): Segundos máximos de cada intento completo (`HTTP_TIMEOUT_TOTAL`).
+            retries (int): Reintentos tras el primer intento fallido (`HTTP_RETRIES`).
+            backoff_base (float): Espera máxima en segundos antes del primer reintento; se duplica en cada uno
+                (`HTTP_BACKOFF_BASE`).
+            backoff_max (float): Tope en segundos de la espera entre reintentos (`HTTP_BACKOFF_MAX`).
+            hedge_delay (float): Segundos tras los que se lanza una segunda petición si la primera no respondió;
+                0 lo desactiva (`HTTP_HEDGE_DELAY`).
+            circuit_breaker (CircuitBreaker | None): Cortocircuito de PokeAPI; por defecto uno propio.
+        """
+        self.limit = limit or int(os.getenv('HTTP_POOL_LIMIT', '100'))
+        self.limit_per_host = limit_per_host or int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '30'))
+        self.keepalive_timeout = keepalive_timeout or float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+        self.dns_cache_ttl = dns_cache_ttl or int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+        self.connect_timeout = connect_timeout or float(os.getenv('HTTP_TIMEOUT_CONNECT', '2'))
+        self.read_timeout = read_timeout or float(os.getenv('HTTP_TIMEOUT_READ', '5'))
+        self.total_timeout = total_timeout or float(os.getenv('HTTP_TIMEOUT_TOTAL', '8'))
+        self.retries = retries if retries is not None else int(os.getenv('HTTP_RETRIES', '2'))
+        self.backoff_base = backoff_base or float(os.getenv('HTTP_BACKOFF_BASE', '0.1'))
+        self.backoff_max = backoff_max or float(os.getenv('HTTP_BACKOFF_MAX', '2'))
+        self.hedge_delay = hedge_delay if hedge_delay is not None else float(os.getenv('HTTP_HEDGE_DELAY', '0'))
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.http_cache = http_cache
+        self.data_version = data_version
+        self.HTTP_OK = 200
+        self.HTTP_NOT_MODIFIED = 304
+        self._upstream_duration = metrics.histogram(
+            'pokeapi_request_duration_seconds', 'Latencia de las peticiones a PokeAPI hasta leer el cuerpo, por estado.',
+            ('status',)) if metrics is not None else None
+        self._http_cache_results = metrics.counter(
+            'pokeapi_http_cache_total', 'Consultas a la caché persistente de PokeAPI: fresh, revalidated, refetched '
+            'o miss.', ('result',)) if metrics is not None and http_cache is not None else None
+        self._resilience_events = metrics.counter(
+            'pokeapi_resilience_total', 'Eventos de la capa de resiliencia de PokeAPI: retry, hedge, rejected '
+            '(cortocircuito abierto) o stale (copia vencida servida).', ('event',)) if metrics is not None else None
+        if metrics is not None:
+            metrics.collector(self._collect_metrics)
+        self._session: 'aiohttp.ClientSession | None' = None
+        self._starting: asyncio.Future | None = None
+
+    async def start(self) -> None:
+        """
+        Crea la sesión HTTP compartida si aún no existe.
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True
+            )
+            timeout = aiohttp.ClientTimeout(total=self.total_timeout, sock_connect=self.connect_timeout,
+                                            sock_read=self.read_timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def start_in_background(self) -> None:
+        """
+        Importa `aiohttp` en un hilo y crea la sesión sin bloquear el arranque. Las peticiones que necesiten la
+        sesión antes de que termine la esperan en `session`.
+        """
+        async def start() -> None:
+            await asyncio.to_thread(importlib.import_module, 'aiohttp')
+            await self.start()
+
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(start())
+
+    async def close(self) -> None:
+        """
+        Cierra la sesión HTTP compartida y libera las conexiones del pool.
+        """
+        if self._starting is not None:
+            await asyncio.gather(self._starting, return_exceptions=True)
+            self._starting = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.http_cache is not None:
+            self.http_cache.close()
+
+    async def session(self) -> 'aiohttp.ClientSession':
+        """
+        Devuelve la sesión compartida. Si la aplicación se ejecuta sin lifespan (por ejemplo en pruebas),
+        la sesión se crea bajo demanda.
+        """
+        if self._starting is not None and not self._starting.done():
+            # Si el arranque en segundo plano falla, la sesión se vuelve a intentar crear aquí.
+            await asyncio.wait({self._starting})
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+
+    async def get_json(self, url: str) -> dict | None:
+        """
+        Realiza una petición GET a PokeAPI y devuelve el cuerpo JSON.
+
+        Si hay caché persistente, una entrada vigente se devuelve sin salir a la red y una vencida se revalida
+        con `If-None-Match` / `If-Modified-Since`; ante un 304 se reutiliza el cuerpo guardado. Si PokeAPI no
+        está disponible (cortocircuito abierto o fallo tras los reintentos) también se devuelve la entrada vencida.
+
+        Args:
+            url (str): URL completa del recurso de PokeAPI.
+
+        Returns:
+            dict | None: Cuerpo de la respuesta si el estado es 200; None si PokeAPI responde que el recurso no
+            existe (404 u otro error del cliente).
+
+        Raises:
+            UpstreamUnavailableError: Si PokeAPI no está disponible y no hay copia en caché de la URL.
+        """
+        cached = await self.http_cache.get(url) if self.http_cache is not None else None
+        if cached is not None and cached.is_fresh(time.time()):
+            self._count_cache_result('fresh')
+            return cached.json()
+
+        try:
+            status, response_headers, body = await self._fetch(url, cached.validators() if cached is not None else {})
+        except UpstreamUnavailableError:
+            if cached is None:
+                raise
+            self._count_event('stale')
+            return cached.json()
+        if status == self.HTTP_NOT_MODIFIED and cached is not None:
+            self._count_cache_result('revalidated')
+            await self.http_cache.refresh(url, response_headers)
+            return cached.json()
+        if status != self.HTTP_OK:
+            return None
+        self._count_cache_result('refetched' if cached is not None else 'miss')
+        if self.http_cache is not None:
+            await self.http_cache.store(url, body, response_headers)
+        if cached is not None and self.data_version is not None and zlib.decompress(cached.body) != body:
+            await self.data_version.bump()
+        return json.loads(body)
+
+    async def _fetch(self, url: str, headers: Mapping[str, str]) -> Tuple[int, Mapping[str, str], bytes | None]:
+        """
+        Realiza el GET con reintentos a través del cortocircuito. Lanza `UpstreamUnavailableError` si el
+        cortocircuito rechaza la petición o si el último intento falla, sin respuesta o con un 5xx o 429.
+        """
+        import aiohttp
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count_event('retry')
+                # Espera con "full jitter": aleatoria entre 0 y el tope exponencial, para no sincronizar reintentos.
+                await asyncio.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))))
+            if not self.circuit_breaker.allow():
+                self._count_event('rejected')
+                raise UpstreamUnavailableError(f"PokeAPI circuit is open: {url}")
+            try:
+                response = await self._hedged(url, headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                self.circuit_breaker.record_failure()
+                if attempt == self.retries:
+                    raise UpstreamUnavailableError(f"PokeAPI request failed: {url}") from exc
+                continue
+            if response[0] not in _RETRYABLE_STATUSES:
+                self.circuit_breaker.record_success()
+                return response
+            self.circuit_breaker.record_failure()
+        raise UpstreamUnavailableError(f"PokeAPI answered {response[0]}: {url}")
+
+    async def _hedged(self, url: str, headers: Mapping[str, str]) -> Tuple[int, Mapping[str, str], bytes | None]:
+        """
+        Realiza el GET y, si no termina en `hedge_delay` segundos, lanza otro igual y devuelve el primero que
+        responda sin error; el otro se cancela y se espera a que termine. Solo se duplica con el cortocircuito
+        cerrado.
+        """
+        if not self.hedge_delay or self.circuit_breaker.state != CircuitBreaker.CLOSED:
+            return await self._request(url, headers)
+        first = asyncio.ensure_future(self._request(url, headers))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done:
+                return first.result()
+            self._count_event('hedge')
+            pending.add(asyncio.ensure_future(self._request(url, headers)))
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                successful = [task for task in done if task.exception() is None]
+                if successful:
+                    return successful[0].result()
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _request(self, url: str, headers: Mapping[str, str]) -> Tuple[int, Mapping[str, str], bytes | None]:
+        """
+        Realiza el GET y registra su latencia y su estado (`timeout`, `error` si falla la conexión o `cancelled`
+        si se descarta por una petición duplicada). Solo lee el cuerpo de las respuestas 200.
+        """
+        session = await self.session()
+        started = time.perf_counter()
+        status = 'error'
+        try:
+            with timed('upstream'):
+                async with session.get(url, headers=headers) as response:
+                    status = str(response.status)
+                    body = await response.read() if response.status == self.HTTP_OK else None
+                    return response.status, response.headers, body
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            raise
+        except asyncio.CancelledError:
+            status = 'cancelled'
+            raise
+        finally:
+            if self._upstream_duration is not None:
+                self._upstream_duration.observe(time.perf_counter() - started, status)
+
+    def _count_cache_result(self, result: str) -> None:
+        if self._http_cache_results is not None:
+            self._http_cache_results.inc(result)
+
+    def _count_event(self, event: str) -> None:
+        if self._resilience_events is not None:
+            self._resilience_events.inc(event)
+
+    def _collect_metrics(self):
+        states = (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)
+        yield ('pokeapi_circuit_state', 'gauge', 'Estado del cortocircuito de PokeAPI: 0 cerrado, 1 abierto, '
+               '2 semiabierto.', states.index(self.circuit_breaker.state))
+
+    async def get_pokemon_cached(self, api_url: str, data_to_search: str | int,
+                                 pokemon_cache: LruTtlCache) -> dict | None:
+        """
+        Obtiene el detalle de un Pokémon desde `pokemon_cache` o, si no está, con `get_pokemon`. El resultado se
+        guarda con su nombre y con su número de Pokédex como claves. Es el único camino por el que los repositorios
+        de consulta piden detalles a PokeAPI.
+
+        Args:
+            api_url (str): URL base del recurso `pokemon` de PokeAPI.
+            data_to_search (str | int): Nombre o número de Pokédex del Pokémon.
+            pokemon_cache (LruTtlCache): Caché en memoria compartida por los repositorios.
+
+        Returns:
+            dict | None: El detalle reducido y validado por `get_pokemon`; None si no existe.
+        """
+        data = pokemon_cache.get(data_to_search)
+        if data is None:
+            data = await self.get_pokemon(f"{api_url}{data_to_search}")
+            if data is not None:
+                pokemon_cache.set(data["id"], data)
+                pokemon_cache.set(data["name"], data)
+        return data
+
+    async def get_pokemon(self, url: str) -> dict | None:
+        """
+        Consulta el detalle de un Pokémon y lo reduce a los campos que usa la aplicación, de modo que
+        las capas de caché no retengan el cuerpo completo (movimientos, estadísticas, etc.).
+
+        El detalle se valida aquí con `SpecificPokemonDto`, una sola vez, y por eso los repositorios pueden construir
+        sus DTO a partir de él con `model_construct`.
+
+        Args:
+            url (str): URL del detalle del Pokémon en PokeAPI.
+
+        Returns:
+            dict | None: Diccionario con `name`, `id`, `abilities`, `sprites` y `types`; None si no se encuentra.
+
+        Raises:
+            UpstreamUnavailableError: Si PokeAPI no responde o el detalle no tiene la forma esperada.
+        """
+        data = await self.get_json(url)
+        if data is None:
+            return None
+        try:
+            pokemon = SpecificPokemonDto(
+                name=data["name"],
+                pokedex_number=data["id"],
+                abilities=[ability['ability']['name'] for ability in data['abilities']],
+                sprites=data['sprites'],
+                types=[ptype['type']['name'] for ptype in data['types']])
+        except (KeyError, TypeError, ValidationError) as exc:
+            raise UpstreamUnavailableError(f"PokeAPI answered an invalid pokemon: {url}") from exc
+        return {
+            "name": pokemon.name,
+            "id": pokemon.pokedex_number,
+            "abilities": pokemon.abilities,
+            "sprites": pokemon.sprites,
+            "types": pokemon.types
+        }
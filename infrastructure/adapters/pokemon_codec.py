@@ -0,0 +1,35 @@
+import json
+import zlib
+from typing import Any
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+_decode = json.JSONDecoder().decode
+
+
+def encode_column(value: Any, binary: bool = False) -> str | bytes:
+    """
+    Codifica el valor de una columna estructurada (`abilities`, `sprites`, `types`) para guardarlo en SQLite.
+
+    Args:
+        value (Any): Lista o diccionario a guardar.
+        binary (bool): Si es True se guarda como JSON compacto comprimido con zlib (BLOB); si no, como texto JSON.
+
+    Returns:
+        str | bytes: Valor listo para pasarse como parámetro de la consulta.
+    """
+    encoded = _encoder.encode(value)
+    if binary:
+        return zlib.compress(encoded.encode('utf-8'))
+    return encoded
+
+
+def decode_column(raw: str | bytes | None) -> Any:
+    """
+    Decodifica una columna estructurada guardada con `encode_column`. El formato se detecta por el tipo:
+    los BLOB se descomprimen y el texto se interpreta directamente como JSON.
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, bytes):
+        return _decode(zlib.decompress(raw).decode('utf-8'))
+    return _decode(raw)
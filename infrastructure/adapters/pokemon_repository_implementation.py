@@ -1,11 +1,32 @@
+import asyncio
+import copy
 import os
-import sqlite3
-from typing import List
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
 from domain.dto.general_pokemon_dto import GeneralPokemonDto
+from domain.dto.materialized_list_dto import MaterializedListDto
+from domain.dto.page_dto import PageDto, PageRequestDto
+from domain.dto.projection_dto import ProjectionDto
 from domain.dto.specific_pokemon_dto import SpecificPokemonDto
 from domain.entities.pokemon import Pokemon
+from infrastructure.adapters.data_version import DataVersion
 from infrastructure.adapters.general_pokemon_query_repository import GeneralPokemonQueryRepository
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.pokeapi_client import PokeApiClient, UpstreamUnavailableError, pokedex_number_from_url
+from infrastructure.adapters.pokemon_codec import encode_column
+from infrastructure.adapters.request_timing import timed
+from infrastructure.adapters.single_flight import SingleFlight
 from infrastructure.adapters.specific_pokemon_query_repository import SpecificPokemonQueryRepository
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.adapters.write_behind_queue import WriteBehindQueue
+
+_UPSERT_CUSTOM = '''
+    INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types, origin)
+    VALUES (?, ?, ?, ?, ?, 'custom')
+    ON CONFLICT(pokedex_number) DO UPDATE SET name=excluded.name, abilities=excluded.abilities,
+        sprites=excluded.sprites, types=excluded.types, origin='custom'
+'''
 
 
 class PokemonRepositoryImplementation:
@@ -14,46 +35,365 @@ class PokemonRepositoryImplementation:
     combinando los datos de una base de datos local y una API externa.
     """
 
-    def __init__(self):
+    def __init__(self, pokeapi_client: PokeApiClient, sqlite_gateway: SqliteGateway, pokemon_cache: LruTtlCache,
+                 write_behind_queue: WriteBehindQueue = None, data_version: DataVersion = None,
+                 metrics: MetricsRegistry = None):
         """
         Inicializa el repositorio con los repositorios de consulta general y específica.
+
+        Args:
+            pokeapi_client (PokeApiClient): Cliente HTTP compartido para las consultas a PokeAPI.
+            sqlite_gateway (SqliteGateway): Acceso asíncrono y con pool de conexiones a la base de datos local.
+            pokemon_cache (LruTtlCache): Caché en memoria de las consultas a PokeAPI por nombre o número de Pokédex.
+            write_behind_queue (WriteBehindQueue): Cola de commit agrupado para `update`; solo se usa si está
+                habilitada.
+            data_version (DataVersion): Versión de los datos servidos, que el repositorio incrementa cada vez que
+                el catálogo reconstruido cambia (las escrituras la incrementan por sí solas).
+            metrics (MetricsRegistry): Registro donde se publican, al exportar, los contadores de la caché en memoria,
+                del single-flight y de la cola de escrituras.
         """
-        self.db_path = os.getenv('DB_PATH', 'pokemon.db')
         self.api_url = os.getenv('POKEAPI_URL', 'https://pokeapi.co/api/v2/pokemon/')
-        self.general_query_repo = GeneralPokemonQueryRepository(self.db_path, self.api_url)
-        self.specific_query_repo = SpecificPokemonQueryRepository(self.db_path, self.api_url)
+        self.binary_encoding = os.getenv('DB_BINARY_ENCODING', 'false') == 'true'
+        self.sqlite_gateway = sqlite_gateway
+        self.pokemon_cache = pokemon_cache
+        self.single_flight = SingleFlight()
+        self.data_version = data_version or DataVersion(sqlite_gateway, write_behind_queue)
+        self.catalog_ttl = float(os.getenv('CATALOG_SNAPSHOT_TTL', '300'))
+        self._catalogs: Dict[str, Tuple[float, str, MaterializedListDto]] = {}
+        self.write_behind_queue = write_behind_queue if write_behind_queue and write_behind_queue.enabled else None
+        self.general_query_repo = GeneralPokemonQueryRepository(sqlite_gateway, self.api_url, pokeapi_client,
+                                                                pokemon_cache)
+        self.specific_query_repo = SpecificPokemonQueryRepository(
+            sqlite_gateway,
+            self.api_url,
+            pokeapi_client,
+            pokemon_cache,
+            fanout_concurrency=int(os.getenv('POKEAPI_FANOUT_CONCURRENCY', '10')),
+            fanout_deadline=float(os.getenv('POKEAPI_FANOUT_DEADLINE', '10'))
+        )
+        if metrics is not None:
+            metrics.collector(self._collect_metrics)
+
+    def _collect_metrics(self) -> List[Tuple[str, str, str, float]]:
+        """
+        Lee los contadores que ya llevan la caché en memoria, el single-flight y la cola de escrituras, sin coste
+        en cada petición.
+        """
+        cache = self.pokemon_cache
+        flights = self.single_flight.stats()
+        collected = [
+            ('pokemon_cache_hits_total', 'counter', 'Aciertos de la caché en memoria de PokeAPI.', cache.hits),
+            ('pokemon_cache_misses_total', 'counter', 'Fallos de la caché en memoria de PokeAPI.', cache.misses),
+            ('pokemon_cache_evictions_total', 'counter', 'Entradas expulsadas por LRU.', cache.evictions),
+            ('pokemon_cache_expirations_total', 'counter', 'Entradas descartadas por TTL.', cache.expirations),
+            ('pokemon_cache_entries', 'gauge', 'Entradas en la caché en memoria.', len(cache)),
+            ('pokemon_cache_bytes', 'gauge', 'Tamaño aproximado de la caché en memoria.', cache.current_bytes),
+            ('single_flight_calls_total', 'counter', 'Ejecuciones lanzadas por el single-flight.', flights['calls']),
+            ('single_flight_deduplicated_total', 'counter', 'Llamadas resueltas uniéndose a una ejecución en curso.',
+             flights['deduplicated']),
+            ('single_flight_in_flight', 'gauge', 'Ejecuciones del single-flight en curso.', flights['in_flight']),
+        ]
+        if self.write_behind_queue is not None:
+            stats = self.write_behind_queue.stats()
+            collected += [
+                ('write_behind_commits_total', 'counter', 'Transacciones de la cola de escrituras.', stats['commits']),
+                ('write_behind_writes_total', 'counter', 'Escrituras confirmadas por la cola.', stats['writes']),
+                ('write_behind_pending', 'gauge', 'Escrituras pendientes de confirmar.', stats['pending']),
+            ]
+        return collected
 
     async def get_general(self, data_to_search: str = None) -> List[GeneralPokemonDto]:
         """
         Obtiene la información general de los Pokémon. Si `data_to_search` está presente,
         busca en la base de datos y luego en la API si no encuentra resultados.
         Si no se proporciona `data_to_search`, combina los resultados de la API y la base de datos.
+        Las búsquedas idénticas concurrentes comparten una única ejecución.
         """
+        if not data_to_search:
+            return self._overlay_general(await self._catalog('general', self._load_general), include_new=True)
+        if pending := self._find_pending(data_to_search):
+            return [self._general_dto(pending)]
+        key = ('general', self._normalize_search(data_to_search))
+        return await self.single_flight.do(key, lambda: self._load_general(data_to_search))
+
+    async def _load_general(self, data_to_search: str = None) -> List[GeneralPokemonDto]:
         if data_to_search:
-            from_db = self.general_query_repo.get_single_from_db(data_to_search)
+            from_db = await self.general_query_repo.get_single_from_db(data_to_search)
             if from_db:
                 return [from_db]
             return await self.general_query_repo.get_single_from_api(data_to_search)
 
-        from_db = self.general_query_repo.get_all_from_db()
-        from_api = await self.general_query_repo.get_all_from_api()
-        return self._merge_with_priority_db(from_db, from_api)
+        from_db = await self.general_query_repo.get_all_from_db()
+        complete = True
+        try:
+            from_api = await self.general_query_repo.get_all_from_api()
+        except UpstreamUnavailableError:
+            # Sin PokeAPI la lista completa se sirve solo con la base de datos, marcada como incompleta.
+            from_api, complete = [], False
+        with timed('merge'):
+            return MaterializedListDto(self._merge_with_priority_db(from_db, from_api), complete)
 
     async def get_specific(self, data_to_search: str = None) -> List[SpecificPokemonDto]:
         """
         Obtiene la información específica de los Pokémon. Si `data_to_search` está presente,
         busca en la base de datos y luego en la API si no encuentra resultados.
         Si no se proporciona `data_to_search`, combina los resultados de la API y la base de datos.
+        Las búsquedas idénticas concurrentes comparten una única ejecución.
         """
+        if not data_to_search:
+            return self._overlay_specific(await self._catalog('specific', self._load_specific), include_new=True)
+        if pending := self._find_pending(data_to_search):
+            return [self._specific_dto(pending)]
+        key = ('specific', self._normalize_search(data_to_search))
+        return await self.single_flight.do(key, lambda: self._load_specific(data_to_search))
+
+    async def _load_specific(self, data_to_search: str = None) -> List[SpecificPokemonDto]:
         if data_to_search:
-            from_db = self.specific_query_repo.get_single_from_db(data_to_search)
+            from_db = await self.specific_query_repo.get_single_from_db(data_to_search)
             if from_db:
                 return [from_db]
             return await self.specific_query_repo.get_single_from_api(data_to_search)
 
-        from_db = self.specific_query_repo.get_all_from_db()
-        from_api = await self.specific_query_repo.get_all_from_api()
-        return self._merge_with_priority_db_specific(from_db, from_api)
+        from_db = await self.specific_query_repo.get_all_from_db()
+        try:
+            from_api, complete = await self.specific_query_repo.get_all_from_api()
+        except UpstreamUnavailableError:
+            from_api, complete = [], False
+        with timed('merge'):
+            return MaterializedListDto(self._merge_with_priority_db_specific(from_db, from_api), complete)
+
+    async def get_specific_batch(self, identifiers: List[str]) -> Dict[str, SpecificPokemonDto | str | None]:
+        """
+        Obtiene varios Pokémon específicos a la vez por número de Pokédex o nombre exacto. Resuelve todos los que
+        están en la base de datos con una única consulta y busca el resto en la API de forma concurrente.
+        Los identificadores repetidos o equivalentes (mayúsculas, ceros a la izquierda) se buscan una sola vez.
+
+        Returns:
+            Dict[str, SpecificPokemonDto | str | None]: Cada identificador recibido con su Pokémon, None si PokeAPI
+            responde que no existe o `'unavailable'` si PokeAPI falló o no respondió a tiempo.
+
+        Raises:
+            UpstreamUnavailableError: Si no pudo resolverse ninguno de los identificadores.
+        """
+        normalized = {identifier: self._normalize_search(identifier) for identifier in identifiers}
+        keys = list(dict.fromkeys(key for key in normalized.values() if key))
+        found = await self.specific_query_repo.get_many_from_db(keys)
+        found.update(await self.specific_query_repo.get_many_from_api([key for key in keys if key not in found]))
+        for key in keys:
+            if pending := self._find_pending(key):
+                found[key] = self._specific_dto(pending)
+        unavailable = {key for key in keys if key not in found}
+        if unavailable and len(unavailable) == len(keys):
+            raise UpstreamUnavailableError(f"PokeAPI could not resolve the batch: {', '.join(keys)}")
+        return {identifier: 'unavailable' if key in unavailable else found.get(key)
+                for identifier, key in normalized.items()}
+
+    async def stream_specific(self, projection: ProjectionDto | None = None) -> AsyncIterator[SpecificPokemonDto]:
+        """
+        Recorre la información específica de todos los Pokémon entregando cada uno en cuanto está disponible:
+        primero las filas de la base de datos, por bloques, mientras en paralelo se obtiene el listado de PokeAPI,
+        y después los detalles de PokeAPI que faltan en la base de datos, según van llegando.
+        Los de la base de datos tienen prioridad. A diferencia de `get_specific`, no comparte la ejecución con
+        otras peticiones iguales. Con `projection` solo se decodifican y conservan los campos pedidos.
+        """
+        listing = asyncio.ensure_future(self.specific_query_repo.list_identifiers_from_api())
+        from_db = set()
+        try:
+            async for pokemon in self.specific_query_repo.iter_all_from_db(projection=projection):
+                from_db.add(pokemon.pokedex_number)
+                yield self._overlay_specific([pokemon], include_new=False)[0]
+            try:
+                identifiers = await listing
+            except UpstreamUnavailableError:
+                identifiers = []
+        finally:
+            listing.cancel()
+
+        missing = [identifier for identifier in identifiers if identifier not in from_db]
+        async for pokemon in self.specific_query_repo.iter_details_from_api(missing, projection):
+            if pokemon.pokedex_number not in from_db:
+                yield self._overlay_specific([pokemon], include_new=False)[0]
+
+    async def get_general_page(self, page: PageRequestDto) -> PageDto[GeneralPokemonDto]:
+        """
+        Obtiene una página de la información general de los Pokémon ordenada por número de Pokédex.
+        Solo se consultan `limit` filas de la base de datos y una página del listado de PokeAPI, que se combinan
+        priorizando la base de datos.
+        """
+        result = await self.single_flight.do(('general-page', page.key()), lambda: self._load_general_page(page))
+        return PageDto(self._overlay_general(result.items, include_new=False), result.next_cursor, result.complete)
+
+    async def _load_general_page(self, page: PageRequestDto) -> PageDto[GeneralPokemonDto]:
+        sources = await self._page_sources(page, self.general_query_repo.get_page_from_db)
+        if sources is None:
+            return PageDto([], None)
+        after, from_db, from_api, total, complete = sources
+        with timed('merge'):
+            db_items = {self._extract_pokedex_number(pokemon.resource): pokemon for pokemon in from_db}
+            api_items = {self._extract_pokedex_number(pokemon.resource): pokemon for pokemon in from_api}
+            selected, next_cursor = self._select_page(page, after, db_items, list(api_items), total)
+            return PageDto([db_items.get(number) or api_items[number] for number in selected], next_cursor, complete)
+
+    async def get_specific_page(self, page: PageRequestDto,
+                                projection: ProjectionDto | None = None) -> PageDto[SpecificPokemonDto]:
+        """
+        Obtiene una página de la información específica de los Pokémon ordenada por número de Pokédex.
+        Solo se consultan en PokeAPI los detalles de los Pokémon de la página que no están en la base de datos.
+        Con `projection` solo se decodifican y conservan los campos pedidos.
+        """
+        key = ('specific-page', page.key(), projection.key() if projection else None)
+        result = await self.single_flight.do(key, lambda: self._load_specific_page(page, projection))
+        return PageDto(self._overlay_specific(result.items, include_new=False), result.next_cursor, result.complete)
+
+    async def _load_specific_page(self, page: PageRequestDto,
+                                  projection: ProjectionDto | None) -> PageDto[SpecificPokemonDto]:
+        sources = await self._page_sources(
+            page, lambda limit, after: self.specific_query_repo.get_page_from_db(limit, after, projection))
+        if sources is None:
+            return PageDto([], None)
+        after, from_db, from_api, total, complete = sources
+        with timed('merge'):
+            db_items = {pokemon.pokedex_number: pokemon for pokemon in from_db}
+            api_numbers = [self._extract_pokedex_number(pokemon.resource) for pokemon in from_api]
+            selected, next_cursor = self._select_page(page, after, db_items, api_numbers, total)
+        details, details_complete = await self.specific_query_repo.get_details_from_api(
+            [number for number in selected if number not in db_items], projection)
+        with timed('merge'):
+            combined = {**{pokemon.pokedex_number: pokemon for pokemon in details}, **db_items}
+            return PageDto([combined[number] for number in selected if number in combined], next_cursor,
+                           complete and details_complete)
+
+    async def _page_sources(self, page: PageRequestDto, get_page_from_db) -> tuple | None:
+        """
+        Consulta a la vez una página de la base de datos (por keyset) y una del listado de PokeAPI (por offset).
+        Si el cliente indicó un `offset` sin cursor, el keyset arranca justo antes del primer Pokémon de esa página
+        del listado, por lo que ambas consultas se hacen una tras otra. Devuelve None si esa página está vacía.
+        Si PokeAPI no está disponible la página se forma solo con la base de datos y se marca como incompleta,
+        salvo en ese caso del `offset`, que sin el listado no puede resolverse.
+        """
+        if page.after is None and page.upstream_offset:
+            from_api, total = await self.general_query_repo.get_page_from_api(page.limit, page.upstream_offset)
+            if not from_api:
+                return None
+            after = self._extract_pokedex_number(from_api[0].resource) - 1
+            from_db = await get_page_from_db(page.limit, after)
+            complete = True
+        else:
+            after = page.after
+            (from_api, total, complete), from_db = await asyncio.gather(
+                self._api_page_or_empty(page.limit, page.upstream_offset),
+                get_page_from_db(page.limit, after))
+        return after, from_db, from_api, total, complete
+
+    async def _api_page_or_empty(self, limit: int, offset: int) -> Tuple[List[GeneralPokemonDto], int, bool]:
+        try:
+            return *await self.general_query_repo.get_page_from_api(limit, offset), True
+        except UpstreamUnavailableError:
+            return [], 0, False
+
+    @staticmethod
+    def _select_page(page: PageRequestDto, after: int | None, db_items: Dict[int, object], api_numbers: List[int],
+                     total: int) -> Tuple[List[int], str | None]:
+        """
+        Elige los números de Pokédex de la página combinando ambas fuentes y genera el cursor de la siguiente.
+        """
+        lower_bound = after if after is not None else -1
+        candidates = sorted({number for number in api_numbers if number > lower_bound} | set(db_items))
+        selected = candidates[:page.limit]
+        if not selected:
+            return [], None
+        last = selected[-1]
+        consumed = sum(1 for number in api_numbers if number <= last)
+        has_more = (len(candidates) > page.limit or len(db_items) == page.limit
+                    or page.upstream_offset + consumed < total)
+        return selected, page.cursor_after(last, consumed) if has_more else None
+
+    async def _catalog(self, kind: str, load: Callable[[], Awaitable[MaterializedListDto]]) -> MaterializedListDto:
+        """
+        Devuelve la lista completa ya combinada de `kind` desde memoria. Se guarda junto con la versión de los
+        datos con la que se construyó y solo se vuelve a construir cuando pasan `catalog_ttl` segundos o cuando
+        esa versión cambia, la cambie este proceso, otro worker o `sync.py`. Servirla solo lee la versión: no
+        consulta la tabla `pokemon` ni PokeAPI ni vuelve a combinar los resultados. Una lista incompleta (PokeAPI no
+        respondió) se sirve pero no se conserva ni cambia la versión de los datos.
+        """
+        version = await self.data_version.stored()
+        cached = self._catalogs.get(kind)
+        if cached is not None and cached[1] == version and cached[0] > time.monotonic():
+            return cached[2]
+        # La versión forma parte de la clave: una construcción empezada antes de una escritura no se reutiliza.
+        catalog = await self.single_flight.do((kind, version), load)
+        if not catalog.complete:
+            return catalog
+        # Con la misma versión, una lista distinta solo puede deberse a cambios en PokeAPI.
+        if cached is not None and cached[1] == version and catalog != cached[2]:
+            await self.data_version.bump()
+        # Si hubo una escritura mientras se construía, la versión ya no coincide y la siguiente petición la reconstruye.
+        self._catalogs[kind] = (time.monotonic() + self.catalog_ttl, version, catalog)
+        return catalog
+
+    def _invalidate(self) -> None:
+        """
+        Descarta las listas materializadas y las consultas en curso tras una escritura. La versión de los datos
+        ya la incrementaron los triggers en la transacción de la escritura, así que las listas de otros workers
+        se reconstruyen al leerla.
+        """
+        self._catalogs.clear()
+        self.single_flight.reset()
+
+    def _find_pending(self, data_to_search: str | int) -> Pokemon | None:
+        """
+        Busca entre las actualizaciones pendientes de la cola de commit agrupado la que coincide exactamente con
+        el nombre o número de Pokédex indicado.
+        """
+        if self.write_behind_queue is None:
+            return None
+        key = LruTtlCache.normalize_key(data_to_search)
+        if key.isdigit():
+            return self.write_behind_queue.pending(int(key))
+        return next((pokemon for pokemon in self.write_behind_queue.pending_items().values()
+                     if pokemon.name.lower() == key), None)
+
+    def _overlay_general(self, items: List[GeneralPokemonDto], include_new: bool) -> List[GeneralPokemonDto]:
+        """
+        Sustituye en `items` los Pokémon con actualizaciones pendientes y, si `include_new`, añade los que faltan.
+        """
+        pending = self.write_behind_queue.pending_items() if self.write_behind_queue else {}
+        if not pending:
+            return items
+        numbers = [self._extract_pokedex_number(item.resource) for item in items]
+        result = [self._general_dto(pending[number]) if number in pending else item
+                  for number, item in zip(numbers, items)]
+        if include_new:
+            result += [self._general_dto(pokemon) for number, pokemon in pending.items() if number not in numbers]
+        return MaterializedListDto(result, items.complete) if isinstance(items, MaterializedListDto) else result
+
+    def _overlay_specific(self, items: List[SpecificPokemonDto], include_new: bool) -> List[SpecificPokemonDto]:
+        """
+        Sustituye en `items` los Pokémon con actualizaciones pendientes y, si `include_new`, añade los que faltan.
+        """
+        pending = self.write_behind_queue.pending_items() if self.write_behind_queue else {}
+        if not pending:
+            return items
+        result = [self._specific_dto(pending[item.pokedex_number]) if item.pokedex_number in pending else item
+                  for item in items]
+        if include_new:
+            numbers = {item.pokedex_number for item in items}
+            result += [self._specific_dto(pokemon) for number, pokemon in pending.items() if number not in numbers]
+        return MaterializedListDto(result, items.complete) if isinstance(items, MaterializedListDto) else result
+
+    def _general_dto(self, pokemon: Pokemon) -> GeneralPokemonDto:
+        return GeneralPokemonDto.model_construct(name=pokemon.name,
+                                                 resource=f"{self.api_url}{pokemon.pokedex_number}/")
+
+    @staticmethod
+    def _specific_dto(pokemon: Pokemon) -> SpecificPokemonDto:
+        return SpecificPokemonDto.model_construct(name=pokemon.name, pokedex_number=pokemon.pokedex_number,
+                                                  abilities=pokemon.abilities, sprites=pokemon.sprites,
+                                                  types=pokemon.types)
+
+    @staticmethod
+    def _normalize_search(data_to_search: str | int | None) -> str | None:
+        return LruTtlCache.normalize_key(data_to_search) if data_to_search else None
 
     @staticmethod
     def _merge_with_priority_db(db_data: List[GeneralPokemonDto], api_data: List[GeneralPokemonDto]) -> List[GeneralPokemonDto]:
@@ -81,10 +421,9 @@ class PokemonRepositoryImplementation:
         """
         Extrae el número de la Pokédex desde la URL del recurso.
         """
-        import re
-        match = re.search(r'/pokemon/(\d+)/', resource)
-        if match:
-            return int(match.group(1))
+        pokedex_number = pokedex_number_from_url(resource)
+        if pokedex_number is not None:
+            return pokedex_number
         raise ValueError(f"Could not extract pokedex number from resource: {resource}")
 
     async def update(self, pokemon: Pokemon):
@@ -93,21 +432,103 @@ class PokemonRepositoryImplementation:
 
         Args:
             pokemon: Objeto de tipo `Pokemon` que contiene la información a ser actualizada.
+
+        Si la cola de commit agrupado está habilitada, la escritura se confirma junto con las demás que lleguen
+        en la misma ventana y, hasta entonces, las lecturas ya la ven.
         """
-        conn = sqlite3.connect(self.db_path)  # Usar db_path desde el .env
-        cursor = conn.cursor()
+        if self.write_behind_queue is not None:
+            await self.write_behind_queue.submit(pokemon.pokedex_number, copy.copy(pokemon), _UPSERT_CUSTOM,
+                                                 self._row(pokemon))
+        else:
+            await self.sqlite_gateway.execute(_UPSERT_CUSTOM, self._row(pokemon), name='pokemon.update')
+        self._invalidate()
 
-        abilities_str = ','.join(pokemon.abilities)
-        types_str = ','.join(pokemon.types)
-        sprites_str = str(pokemon.sprites)
+    async def update_many(self, pokemons: List[Pokemon]) -> None:
+        """
+        Actualiza la información de varios Pokémon en la base de datos local con una única sentencia
+        `executemany` dentro de una sola transacción.
 
-        cursor.execute('''
-               INSERT OR REPLACE INTO pokemon (name, pokedex_number, abilities, sprites, types)
-               VALUES (?, ?, ?, ?, ?)
-           ''', (pokemon.name, pokemon.pokedex_number, abilities_str, sprites_str, types_str))
+        Args:
+            pokemons: Lista de objetos `Pokemon` con la información a ser actualizada.
+        """
+        await self._flush_pending()
+        await self.sqlite_gateway.executemany(_UPSERT_CUSTOM, [self._row(pokemon) for pokemon in pokemons],
+                                              name='pokemon.update_many')
+        self._invalidate()
+
+    async def patch(self, pokedex_number: int, changes: Dict[str, Any]) -> bool:
+        """
+        Actualiza solo las columnas indicadas en `changes` sin leer antes la fila. Si el Pokémon no está en la
+        base de datos, lo consulta en la API y lo inserta con los cambios aplicados; el `ON CONFLICT` conserva
+        las columnas no indicadas si otra petición lo insertó mientras tanto.
+
+        Args:
+            pokedex_number: Número de Pokédex del Pokémon a actualizar.
+            changes: Campos a actualizar (`name`, `abilities`, `sprites` o `types`) con sus nuevos valores.
+
+        Returns:
+            bool: False si el Pokémon no existe ni en la base de datos ni en la API.
+        """
+        await self._flush_pending()
+        columns = [column for column in ('name', 'abilities', 'sprites', 'types') if column in changes]
+        values = [changes['name'] if column == 'name' else encode_column(changes[column], self.binary_encoding)
+                  for column in columns]
+        assignments = ', '.join(f'{column}=?' for column in columns)
+        updated = await self.sqlite_gateway.execute(
+            f"UPDATE pokemon SET {assignments}, origin='custom' WHERE pokedex_number=?", (*values, pokedex_number),
+            name='pokemon.patch')
+        if not updated:
+            pokemon = await self.specific_query_repo.get_one(pokedex_number)
+            if pokemon is None:
+                return False
+            for column in columns:
+                setattr(pokemon, column, changes[column])
+            await self.sqlite_gateway.execute(f'''
+                INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types, origin)
+                VALUES (?, ?, ?, ?, ?, 'custom')
+                ON CONFLICT(pokedex_number) DO UPDATE SET {', '.join(f'{column}=excluded.{column}' for column in columns)},
+                    origin='custom'
+            ''', self._row(pokemon), name='pokemon.patch_insert')
+        self._invalidate()
+        return True
+
+    async def _flush_pending(self) -> None:
+        """
+        Confirma antes las actualizaciones encoladas, para que no sobrescriban después una escritura directa.
+        """
+        if self.write_behind_queue is not None:
+            await self.write_behind_queue.flush()
+
+    def _row(self, pokemon: Pokemon) -> tuple:
+        return (pokemon.name, pokemon.pokedex_number,
+                encode_column(pokemon.abilities, self.binary_encoding),
+                encode_column(pokemon.sprites, self.binary_encoding),
+                encode_column(pokemon.types, self.binary_encoding))
+
+    async def get_many(self, pokedex_numbers: List[int]) -> Dict[int, Pokemon]:
+        """
+        Obtiene varios Pokémon por su número de Pokédex, priorizando los datos de la base de datos local.
+        Los que están en la base de datos se leen con una única consulta y el resto se buscan en la API
+        de forma concurrente, esperando a todas las respuestas (sin el plazo de los listados).
 
-        conn.commit()
-        conn.close()
+        Args:
+            pokedex_numbers: Números de Pokédex de los Pokémon que se buscan.
+
+        Returns:
+            Dict[int, Pokemon | None]: Cada Pokémon resuelto, indexado por su número de Pokédex, con None si
+            PokeAPI responde que no existe. Los que no pudieron consultarse en PokeAPI no aparecen.
+        """
+        keys = [str(int(pokedex_number)) for pokedex_number in pokedex_numbers]
+        found = await self.specific_query_repo.get_many_from_db(keys)
+        found.update(await self.specific_query_repo.get_many_from_api([key for key in keys if key not in found],
+                                                                      wait_for_all=True))
+        for key in keys:
+            if pending := self._find_pending(key):
+                found[key] = self._specific_dto(pending)
+        return {int(key): None if found[key] is None else
+                Pokemon(name=found[key].name, pokedex_number=found[key].pokedex_number,
+                        abilities=list(found[key].abilities), sprites=found[key].sprites, types=list(found[key].types))
+                for key in keys if key in found}
 
     async def get_one(self, pokedex_number: int) -> Pokemon | None:
         """
@@ -120,4 +541,9 @@ class PokemonRepositoryImplementation:
         Returns:
             Pokemon: Instancia de la entidad Pokémon con los datos obtenidos.
         """
-        return await self.specific_query_repo.get_one(pokedex_number)
+        if pending := self._find_pending(pokedex_number):
+            return copy.copy(pending)
+        pokemon = await self.single_flight.do(('one', int(pokedex_number)),
+                                              lambda: self.specific_query_repo.get_one(pokedex_number))
+        # Cada solicitante recibe su propia copia, ya que el servicio modifica la entidad antes de guardarla.
+        return copy.copy(pokemon)
@@ -0,0 +1,42 @@
+from typing import Tuple
+
+TRIGRAM_LENGTH = 3
+
+
+def search_query(columns: str, data_to_search: str) -> Tuple[str, tuple | dict]:
+    """
+    Construye la consulta que resuelve una búsqueda por nombre o número de Pokédex sobre la tabla `pokemon`.
+
+    Un número se busca solo por `pokedex_number` (clave única). Un texto se busca en el índice de nombres y los
+    resultados se ordenan de forma determinista: coincidencia exacta, luego por prefijo y luego por subcadena;
+    a igualdad, el nombre más corto y el número de Pokédex más bajo. Los textos de menos de tres caracteres no
+    caben en el índice trigram y se resuelven con el índice NOCASE de `name` (exacta y prefijo) o, en último
+    caso, recorriendo la tabla.
+
+    Args:
+        columns (str): Columnas de `pokemon` a devolver, separadas por comas.
+        data_to_search (str): Nombre (o parte de él) o número de Pokédex.
+
+    Returns:
+        Tuple[str, tuple | dict]: Consulta SQL y sus parámetros.
+    """
+    term = data_to_search.strip()
+    if term.isdigit():
+        return f"SELECT {columns} FROM pokemon WHERE pokedex_number=?", (int(term),)
+
+    term = term.lower()
+    ranking = ("ORDER BY CASE WHEN lower(name) = :term THEN 0 "
+               "WHEN substr(lower(name), 1, length(:term)) = :term THEN 1 ELSE 2 END, "
+               "length(name), pokedex_number LIMIT 1")
+    if len(term) >= TRIGRAM_LENGTH:
+        match = '"%s"' % term.replace('"', '""')
+        return (f"SELECT {columns} FROM pokemon WHERE id IN "
+                f"(SELECT rowid FROM pokemon_name_fts WHERE pokemon_name_fts MATCH :match) {ranking}",
+                {'term': term, 'match': match})
+    prefix = "name COLLATE NOCASE >= :term AND name COLLATE NOCASE < :upper"
+    return (f"SELECT {columns} FROM ("
+            f"SELECT {columns} FROM pokemon WHERE {prefix} "
+            f"UNION ALL "
+            f"SELECT {columns} FROM pokemon WHERE NOT EXISTS (SELECT 1 FROM pokemon WHERE {prefix}) "
+            f"AND instr(lower(name), :term) > 0) {ranking}",
+            {'term': term, 'upper': term + '\uffff'})
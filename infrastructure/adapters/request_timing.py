@@ -0,0 +1,70 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Tuple
+
+
+class RequestTimings:
+    """
+    Tiempo de cada fase (`db`, `cache`, `upstream`, `merge`, `serialize`) dentro de una petición.
+
+    Cada fase acumula el tiempo de reloj durante el que hay al menos una operación suya en curso: si la petición
+    lanza varias consultas a PokeAPI a la vez, `upstream` mide lo que duró el conjunto y no la suma de todas,
+    de modo que las fases se pueden comparar con la duración total de la petición.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self._active: Dict[str, Tuple[int, float]] = {}
+
+    def enter(self, phase: str) -> None:
+        depth, started = self._active.get(phase, (0, 0.0))
+        self._active[phase] = (depth + 1, time.perf_counter() if depth == 0 else started)
+
+    def exit(self, phase: str) -> None:
+        depth, started = self._active.pop(phase)
+        if depth > 1:
+            self._active[phase] = (depth - 1, started)
+        else:
+            self.durations[phase] = self.durations.get(phase, 0.0) + time.perf_counter() - started
+
+    def server_timing(self) -> str:
+        """
+        Valor de la cabecera `Server-Timing`, en milisegundos, con la duración total al final.
+        """
+        entries = [f'{phase};dur={duration * 1000:.2f}' for phase, duration in self.durations.items()]
+        entries.append(f'total;dur={(time.perf_counter() - self.started) * 1000:.2f}')
+        return ', '.join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+def start_request_timings() -> Tuple[RequestTimings, Token]:
+    """
+    Empieza a medir las fases de la petición en curso. Las tareas que cree la petición heredan el contexto y
+    registran en el mismo objeto.
+    """
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def stop_request_timings(token: Token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Mide el bloque como parte de `phase` si hay una petición midiéndose; si no, no hace nada.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    timings.enter(phase)
+    try:
+        yield
+    finally:
+        timings.exit(phase)
@@ -0,0 +1,68 @@
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict
+
+
+class SamplingProfiler:
+    """
+    Profiler por muestreo: un hilo aparte toma cada `interval` segundos la pila de todos los hilos con
+    `sys._current_frames()` y cuenta cuántas veces aparece cada una.
+
+    A diferencia de `cProfile` no instrumenta cada llamada, por lo que el coste no depende de cuánto código se
+    ejecute y puede usarse con tráfico real. El resultado se escribe en formato "folded" (una pila por línea,
+    funciones separadas por `;` y el número de muestras al final), que leen directamente flamegraph.pl y speedscope.
+    Como el event loop es compartido, el perfil incluye todo lo que se ejecutó mientras duraba la petición.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._sample, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names: Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        return ''.join(f'{stack} {count}\n' for stack, count in self.samples.most_common())
+
+    @staticmethod
+    def file_name(label: str) -> str:
+        """
+        Nombre único para el perfil de una petición, a partir de su ruta.
+        """
+        safe_label = ''.join(char if char.isalnum() else '_' for char in label).strip('_') or 'root'
+        return f'{time.strftime("%Y%m%d-%H%M%S")}-{safe_label}-{uuid.uuid4().hex[:8]}.folded'
+
+    def save(self, directory: str, name: str) -> None:
+        """
+        Escribe el perfil en `directory` con el nombre `name`.
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, name), 'w', encoding='utf-8') as profile:
+            profile.write(self.folded())
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Agrupa llamadas idénticas concurrentes para que compartan una única ejecución en vuelo.
+
+    La primera llamada con una clave lanza la operación como una tarea; las que llegan mientras sigue en curso
+    esperan esa misma tarea. Cada espera está protegida con `asyncio.shield`, por lo que cancelar a uno de los
+    solicitantes no cancela la operación compartida ni al resto. El resultado se comparte entre todos, así que
+    no debe modificarse en sitio.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    async def do(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Ejecuta `operation` o se une a la ejecución en curso con la misma clave.
+
+        Args:
+            key (Hashable): Identificador de la llamada; las llamadas con la misma clave se agrupan.
+            operation (Callable): Función que devuelve la corrutina a ejecutar.
+
+        Returns:
+            El resultado de la ejecución compartida.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(operation())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        else:
+            self.deduplicated += 1
+        return await asyncio.shield(task)
+
+    def reset(self) -> None:
+        """
+        Desvincula las ejecuciones en curso: quienes ya esperan reciben su resultado, pero las llamadas
+        nuevas lanzan una ejecución propia. Se usa tras una escritura para no compartir datos anteriores a ella.
+        """
+        self._in_flight.clear()
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Marca la excepción como recuperada aunque todos los solicitantes se hayan cancelado.
+            task.exception()
+
+    def stats(self) -> dict:
+        """
+        Devuelve cuántas ejecuciones se lanzaron y cuántas llamadas se resolvieron uniéndose a una en curso.
+        """
+        return {
+            'calls': self.calls,
+            'deduplicated': self.deduplicated,
+            'in_flight': len(self._in_flight)
+        }
@@ -1,83 +1,223 @@
-import sqlite3
-import aiohttp
-from typing import List
+import asyncio
+from typing import AsyncIterator, Dict, List, Tuple
+from domain.dto.projection_dto import ProjectionDto
 from domain.dto.specific_pokemon_dto import SpecificPokemonDto
 from domain.entities.pokemon import Pokemon
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient, UpstreamUnavailableError, pokedex_number_from_url
+from infrastructure.adapters.pokemon_codec import decode_column
+from infrastructure.adapters.pokemon_search import search_query
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
 
 
 class SpecificPokemonQueryRepository:
-    def __init__(self, db_path: str, api_url: str):
-        self.db_path = db_path
+    def __init__(self, sqlite_gateway: SqliteGateway, api_url: str, pokeapi_client: PokeApiClient,
+                 pokemon_cache: LruTtlCache, fanout_concurrency: int = 10, fanout_deadline: float | None = None):
+        self.sqlite_gateway = sqlite_gateway
         self.api_url = api_url
-        self.HTTP_OK = 200
+        self.pokeapi_client = pokeapi_client
+        self.pokemon_cache = pokemon_cache
+        self.fanout_concurrency = fanout_concurrency
+        self.fanout_deadline = fanout_deadline
 
-    def get_single_from_db(self, data_to_search: str) -> SpecificPokemonDto | None:
+    async def get_single_from_db(self, data_to_search: str) -> SpecificPokemonDto | None:
         """
         Busca un Pokémon específico en la base de datos SQLite por nombre o número de Pokédex.
+        Si varios nombres coinciden, se prioriza la coincidencia exacta, luego por prefijo y luego por subcadena.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT name, pokedex_number, abilities, sprites, types FROM pokemon WHERE name LIKE ? OR pokedex_number=?",
-            (f'%{data_to_search}%', data_to_search))
-        result = cursor.fetchone()
-        conn.close()
+        result = await self.sqlite_gateway.fetch_one(
+            *search_query("name, pokedex_number, abilities, sprites, types", data_to_search),
+            name='specific.get_single_from_db')
 
         if result:
-            name, pokedex_number, abilities, sprites, types = result
-            return SpecificPokemonDto(name=name, pokedex_number=pokedex_number, abilities=abilities.split(','),
-                                      sprites=eval(sprites), types=types.split(','))
+            return self._row_to_dto(result)
         return None
 
-    def get_all_from_db(self) -> List[SpecificPokemonDto]:
+    async def get_all_from_db(self) -> List[SpecificPokemonDto]:
         """
         Devuelve la lista de todos los Pokémon desde la base de datos.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, pokedex_number, abilities, sprites, types FROM pokemon")
-        results = cursor.fetchall()
-        conn.close()
+        results = await self.sqlite_gateway.fetch_all("SELECT name, pokedex_number, abilities, sprites, types FROM pokemon",
+                                                      name='specific.get_all_from_db')
+
+        return [self._row_to_dto(row) for row in results]
 
-        return [SpecificPokemonDto(name=name, pokedex_number=pokedex_number, abilities=abilities.split(','),
-                                   sprites=eval(sprites), types=types.split(','))
-                for name, pokedex_number, abilities, sprites, types in results]
+    async def get_page_from_db(self, limit: int, after: int | None,
+                               projection: ProjectionDto | None = None) -> List[SpecificPokemonDto]:
+        """
+        Devuelve hasta `limit` Pokémon de la base de datos con número de Pokédex mayor que `after`,
+        ordenados por número (paginación por keyset sobre el índice único de `pokedex_number`).
+        Con `projection` las columnas no pedidas no se leen ni se decodifican y quedan en None.
+        """
+        results = await self.sqlite_gateway.fetch_all(
+            f"SELECT {self._columns(projection)} FROM pokemon WHERE pokedex_number > ? "
+            "ORDER BY pokedex_number LIMIT ?",
+            (after if after is not None else -1, limit), name='specific.get_page_from_db')
+
+        return [self._row_to_dto(row, projection) for row in results]
 
     async def get_single_from_api(self, data_to_search: str) -> List[SpecificPokemonDto]:
         """
         Busca un Pokémon específico en la API de PokeAPI por nombre o número de Pokédex.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}{data_to_search}") as response:
-                if response.status != self.HTTP_OK:
-                    return []
-                data = await response.json()
-                return [SpecificPokemonDto(name=data["name"], pokedex_number=data["id"],
-                                           abilities=[ability['ability']['name'] for ability in data['abilities']],
-                                           sprites=data['sprites'],
-                                           types=[ptype['type']['name'] for ptype in data['types']])]
-
-    async def get_all_from_api(self) -> List[SpecificPokemonDto]:
-        """
-        Devuelve una lista con los detalles de todos los Pokémon desde la API (limitada a 100 resultados).
-        """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}?limit=100") as response:
-                if response.status != self.HTTP_OK:
-                    return []
-                data = await response.json()
-                results = []
-                for item in data["results"]:
-                    async with session.get(item["url"]) as detail_response:
-                        if detail_response.status != self.HTTP_OK:
-                            continue
-                        details = await detail_response.json()
-                        results.append(SpecificPokemonDto(name=details["name"], pokedex_number=details["id"],
-                                                          abilities=[ability['ability']['name'] for ability in
-                                                                     details['abilities']],
-                                                          sprites=details['sprites'],
-                                                          types=[ptype['type']['name'] for ptype in details['types']]))
-                return results
+        data = await self._fetch_pokemon(data_to_search)
+        if data is None:
+            return []
+        return [self._to_dto(data)]
+
+    async def get_all_from_api(self) -> Tuple[List[SpecificPokemonDto], bool]:
+        """
+        Devuelve una lista con los detalles de todos los Pokémon desde la API (limitada a 100 resultados) y si
+        llegaron todos. Los detalles se consultan de forma concurrente con `get_details_from_api`.
+        """
+        return await self.get_details_from_api(await self.list_identifiers_from_api())
+
+    async def list_identifiers_from_api(self) -> List[int | str]:
+        """
+        Devuelve los números de Pokédex (o el nombre, si la URL no lo contiene) del listado de PokeAPI
+        (limitado a 100 resultados).
+
+        Raises:
+            UpstreamUnavailableError: Si el listado no tiene la forma esperada.
+        """
+        url = f"{self.api_url}?limit=100"
+        data = await self.pokeapi_client.get_json(url)
+        if data is None:
+            return []
+        try:
+            identifiers = [pokedex_number_from_url(item["url"]) or item["name"] for item in data["results"]]
+        except (KeyError, TypeError) as exc:
+            raise UpstreamUnavailableError(f"PokeAPI answered an invalid listing: {url}") from exc
+        if not all(isinstance(identifier, (int, str)) and identifier for identifier in identifiers):
+            raise UpstreamUnavailableError(f"PokeAPI answered an invalid listing: {url}")
+        return identifiers
+
+    async def iter_all_from_db(self, chunk_size: int = 200,
+                               projection: ProjectionDto | None = None) -> AsyncIterator[SpecificPokemonDto]:
+        """
+        Recorre todos los Pokémon de la base de datos por bloques de `chunk_size` filas, ordenados por número
+        de Pokédex, sin cargar la tabla completa en memoria.
+        """
+        after = None
+        while True:
+            chunk = await self.get_page_from_db(chunk_size, after, projection)
+            for pokemon in chunk:
+                yield pokemon
+            if len(chunk) < chunk_size:
+                return
+            after = chunk[-1].pokedex_number
+
+    async def iter_details_from_api(self, identifiers: List[int | str],
+                                    projection: ProjectionDto | None = None) -> AsyncIterator[SpecificPokemonDto]:
+        """
+        Igual que `get_details_from_api`, pero entrega cada Pokémon en cuanto llega su respuesta en lugar de
+        esperar a todos, por lo que el orden no está garantizado.
+        """
+        semaphore = asyncio.Semaphore(self.fanout_concurrency)
+
+        async def fetch_details(identifier: int | str) -> dict | None:
+            async with semaphore:
+                return await self._fetch_pokemon(identifier)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if self.fanout_deadline is None else loop.time() + self.fanout_deadline
+        pending = {asyncio.ensure_future(fetch_details(identifier)) for identifier in identifiers}
+        try:
+            while pending:
+                timeout = None if deadline is None else deadline - loop.time()
+                if timeout is not None and timeout <= 0:
+                    return
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result() is not None:
+                        yield self._to_dto(task.result(), projection)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_details_from_api(self, identifiers: List[int | str], projection: ProjectionDto | None = None
+                                   ) -> Tuple[List[SpecificPokemonDto], bool]:
+        """
+        Consulta los detalles de varios Pokémon (por número de Pokédex o nombre) de forma concurrente con
+        `_fetch_many`, conservando el orden recibido y omitiendo los que no existen, fallan o no llegan a tiempo.
+
+        Returns:
+            Tuple[List[SpecificPokemonDto], bool]: Los detalles encontrados y False si alguno falló o no llegó a
+            tiempo (los que no existen no cuentan como faltantes).
+        """
+        details = await self._fetch_many(identifiers, self.fanout_deadline)
+        return [self._to_dto(details[identifier], projection) for identifier in identifiers
+                if details.get(identifier) is not None], len(details) == len(set(identifiers))
+
+    async def get_many_from_db(self, identifiers: List[str]) -> Dict[str, SpecificPokemonDto]:
+        """
+        Busca varios Pokémon a la vez por número de Pokédex o nombre exacto (sin distinguir mayúsculas) con una
+        única consulta `IN (...)`. Los identificadores deben llegar normalizados.
+
+        Returns:
+            Dict[str, SpecificPokemonDto]: Cada Pokémon encontrado bajo su número de Pokédex y su nombre.
+        """
+        numbers = [int(identifier) for identifier in identifiers if identifier.isdigit()]
+        names = [identifier for identifier in identifiers if not identifier.isdigit()]
+        conditions = []
+        if numbers:
+            conditions.append(f"pokedex_number IN ({', '.join('?' * len(numbers))})")
+        if names:
+            conditions.append(f"name COLLATE NOCASE IN ({', '.join('?' * len(names))})")
+        if not conditions:
+            return {}
+        results = await self.sqlite_gateway.fetch_all(
+            f"SELECT name, pokedex_number, abilities, sprites, types FROM pokemon WHERE {' OR '.join(conditions)}",
+            numbers + names, name='specific.get_many_from_db')
+
+        found = {}
+        for row in results:
+            pokemon = self._row_to_dto(row)
+            found[str(pokemon.pokedex_number)] = pokemon
+            found[pokemon.name.lower()] = pokemon
+        return found
+
+    async def get_many_from_api(self, identifiers: List[str],
+                                wait_for_all: bool = False) -> Dict[str, SpecificPokemonDto | None]:
+        """
+        Consulta varios Pokémon en PokeAPI de forma concurrente con `_fetch_many`.
+
+        Args:
+            identifiers (List[str]): Números de Pokédex o nombres a consultar.
+            wait_for_all (bool): Si es True no se aplica `fanout_deadline` y se espera a todas las respuestas, cada
+                una limitada por los timeouts del cliente. Lo usan las escrituras, que no pueden dar por inexistente
+                un Pokémon que solo tardó.
+
+        Returns:
+            Dict[str, SpecificPokemonDto | None]: Cada identificador del que PokeAPI respondió, con su Pokémon o con
+            None si no existe. Los que fallan o no llegan a tiempo no aparecen.
+        """
+        details = await self._fetch_many(identifiers, None if wait_for_all else self.fanout_deadline)
+        return {identifier: None if data is None else self._to_dto(data) for identifier, data in details.items()}
+
+    async def _fetch_many(self, identifiers: List[int | str], deadline: float | None) -> Dict[int | str, dict | None]:
+        """
+        Obtiene el detalle de varios Pokémon con `_fetch_pokemon`, con como máximo `fanout_concurrency` peticiones
+        en vuelo y un plazo total de `deadline` segundos (None para esperar a todos). Devuelve la respuesta de cada
+        identificador resuelto: su detalle, o None si PokeAPI responde que no existe. Los que fallan o no llegan
+        a tiempo no aparecen.
+        """
+        semaphore = asyncio.Semaphore(self.fanout_concurrency)
+
+        async def fetch_details(identifier: int | str) -> dict | None:
+            async with semaphore:
+                return await self._fetch_pokemon(identifier)
+
+        tasks = {identifier: asyncio.ensure_future(fetch_details(identifier)) for identifier in identifiers}
+        if not tasks:
+            return {}
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return {identifier: task.result() for identifier, task in tasks.items()
+                if not task.cancelled() and task.exception() is None}
 
     async def get_one(self, pokedex_number: int) -> Pokemon | None:
         """
@@ -90,13 +230,13 @@ class SpecificPokemonQueryRepository:
         Returns:
             Pokemon: Instancia de la entidad Pokémon con los datos obtenidos.
         """
-        pokemon = self._get_from_database(pokedex_number)
+        pokemon = await self._get_from_database(pokedex_number)
         if pokemon:
             return pokemon
 
         return await self._get_from_api(pokedex_number)
 
-    def _get_from_database(self, pokedex_number: int) -> Pokemon | None:
+    async def _get_from_database(self, pokedex_number: int) -> Pokemon | None:
         """
         Busca un Pokémon en la base de datos local por su número de Pokédex.
 
@@ -106,21 +246,18 @@ class SpecificPokemonQueryRepository:
         Returns:
             Pokemon: Instancia de la entidad Pokémon si se encuentra en la base de datos; None si no se encuentra.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT name, pokedex_number, abilities, sprites, types FROM pokemon WHERE pokedex_number=?',
-                       (pokedex_number,))
-        result = cursor.fetchone()
-        conn.close()
+        result = await self.sqlite_gateway.fetch_one(
+            'SELECT name, pokedex_number, abilities, sprites, types FROM pokemon WHERE pokedex_number=?',
+            (pokedex_number,), name='specific.get_one')
 
         if result:
             name, pokedex_number, abilities, sprites, types = result
             return Pokemon(
                 name=name,
                 pokedex_number=pokedex_number,
-                abilities=abilities.split(','),
-                sprites=eval(sprites),
-                types=types.split(',')
+                abilities=decode_column(abilities),
+                sprites=decode_column(sprites),
+                types=decode_column(types)
             )
         return None
 
@@ -134,15 +271,59 @@ class SpecificPokemonQueryRepository:
         Returns:
             Pokemon: Instancia de la entidad Pokémon si se encuentra en la API; None si no se encuentra.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}{pokedex_number}") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return Pokemon(
-                        name=data["name"],
-                        pokedex_number=data["id"],
-                        abilities=[ability['ability']['name'] for ability in data['abilities']],
-                        sprites=data['sprites'],
-                        types=[ptype['type']['name'] for ptype in data['types']]
-                    )
-        return None
+        data = await self._fetch_pokemon(pokedex_number)
+        if data is None:
+            return None
+        return Pokemon(
+            name=data["name"],
+            pokedex_number=data["id"],
+            abilities=list(data['abilities']),
+            sprites=data['sprites'],
+            types=list(data['types'])
+        )
+
+    async def _fetch_pokemon(self, data_to_search: str | int) -> dict | None:
+        return await self.pokeapi_client.get_pokemon_cached(self.api_url, data_to_search, self.pokemon_cache)
+
+    @staticmethod
+    def _columns(projection: ProjectionDto | None) -> str:
+        """
+        Columnas de la consulta para `projection`. El nombre y el número de Pokédex se leen siempre, porque
+        se usan para combinar las fuentes; el resto se sustituye por NULL si no se pidió.
+        """
+        if projection is None:
+            return "name, pokedex_number, abilities, sprites, types"
+        return ", ".join(["name", "pokedex_number"] + [column if projection.includes(column) else "NULL"
+                                                        for column in ("abilities", "sprites", "types")])
+
+    @staticmethod
+    def _row_to_dto(row: tuple, projection: ProjectionDto | None = None) -> SpecificPokemonDto:
+        """
+        Construye el DTO a partir de una fila `(name, pokedex_number, abilities, sprites, types)` sin volver a
+        validarla, ya que la escribió la propia aplicación.
+        """
+        name, pokedex_number, abilities, sprites, types = row
+        sprites = decode_column(sprites)
+        if projection is not None:
+            sprites = projection.trim_sprites(sprites)
+        return SpecificPokemonDto.model_construct(name=name, pokedex_number=pokedex_number,
+                                                  abilities=decode_column(abilities), sprites=sprites,
+                                                  types=decode_column(types))
+
+    @staticmethod
+    def _to_dto(data: dict, projection: ProjectionDto | None = None) -> SpecificPokemonDto:
+        """
+        Construye el DTO a partir del detalle ya recortado y validado por `PokeApiClient.get_pokemon`, sin volver
+        a validarlo.
+        Con `projection` los campos no pedidos quedan en None y `sprites` se reduce a las rutas seleccionadas,
+        sin modificar el detalle guardado en la caché.
+        """
+        if projection is None:
+            return SpecificPokemonDto.model_construct(name=data["name"], pokedex_number=data["id"],
+                                                      abilities=data['abilities'], sprites=data['sprites'],
+                                                      types=data['types'])
+        return SpecificPokemonDto.model_construct(
+            name=data["name"], pokedex_number=data["id"],
+            abilities=data['abilities'] if projection.includes('abilities') else None,
+            sprites=projection.trim_sprites(data['sprites']) if projection.includes('sprites') else None,
+            types=data['types'] if projection.includes('types') else None)
@@ -0,0 +1,180 @@
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, TypeVar
+
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.request_timing import timed
+
+T = TypeVar('T')
+
+
+class SqliteGateway:
+    """
+    Acceso asíncrono a la base de datos SQLite.
+
+    Mantiene un pool de conexiones reutilizables y ejecuta todas las consultas en un pool de hilos dedicado,
+    de modo que el event loop nunca se bloquea esperando a SQLite. Cada conexión se inicializa una sola vez
+    con modo WAL, `mmap_size`, `cache_size` y `synchronous=NORMAL`.
+    """
+
+    def __init__(self, db_path: str = None, pool_size: int = None, mmap_size: int = None, cache_size: int = None,
+                 busy_timeout: float = None, metrics: MetricsRegistry | None = None, timing_phase: str = 'db'):
+        """
+        Inicializa el gateway. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            db_path (str): Ruta del archivo SQLite (`DB_PATH`).
+            pool_size (int): Número de conexiones e hilos del pool (`DB_POOL_SIZE`).
+            mmap_size (int): Bytes del archivo mapeados en memoria (`DB_MMAP_SIZE`).
+            cache_size (int): Tamaño de la caché de páginas; negativo indica KiB (`DB_CACHE_SIZE`).
+            busy_timeout (float): Segundos que una conexión espera el bloqueo de escritura (`DB_BUSY_TIMEOUT`).
+            metrics (MetricsRegistry | None): Registro donde se publica la duración de cada consulta por nombre.
+            timing_phase (str): Fase de `Server-Timing` a la que se suma el tiempo de sus consultas.
+        """
+        self.db_path = db_path or os.getenv('DB_PATH', 'pokemon.db')
+        self.pool_size = pool_size or int(os.getenv('DB_POOL_SIZE', '4'))
+        self.mmap_size = mmap_size if mmap_size is not None else int(os.getenv('DB_MMAP_SIZE', '268435456'))
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv('DB_CACHE_SIZE', '-16000'))
+        self.busy_timeout = busy_timeout or float(os.getenv('DB_BUSY_TIMEOUT', '5'))
+        self._connections: queue.LifoQueue = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='sqlite')
+        self.timing_phase = timing_phase
+        self._query_duration = metrics.histogram(
+            'sqlite_query_duration_seconds', 'Tiempo de ejecución de las consultas SQLite, sin la espera por el pool.',
+            ('query',)) if metrics is not None else None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre una conexión nueva y aplica los PRAGMA de rendimiento.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+        conn.execute(f'PRAGMA cache_size={int(self.cache_size)}')
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Toma prestada una conexión del pool, creándola si todavía no se alcanzó `pool_size`,
+        y la devuelve al terminar. Debe usarse desde los hilos del gateway.
+        """
+        try:
+            conn = self._connections.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._opened < self.pool_size
+                if create:
+                    self._opened += 1
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T], name: str = 'run') -> T:
+        """
+        Ejecuta `operation(conn)` en el pool de hilos dentro de una transacción, confirmándola si termina
+        correctamente y revirtiéndola si lanza una excepción.
+
+        Args:
+            operation (Callable): Función que recibe una conexión del pool.
+            name (str): Nombre con el que se publica su duración en las métricas.
+
+        Returns:
+            El valor devuelto por `operation`.
+        """
+        def task() -> T:
+            with self.connection() as conn:
+                started = time.perf_counter()
+                try:
+                    result = operation(conn)
+                    conn.commit()
+                    return result
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    if self._query_duration is not None:
+                        self._query_duration.observe(time.perf_counter() - started, name)
+
+        with timed(self.timing_phase):
+            return await asyncio.get_running_loop().run_in_executor(self._executor, task)
+
+    async def fetch_one(self, sql: str, params: Iterable[Any] | Mapping[str, Any] = (),
+                        name: str = None) -> tuple | None:
+        """
+        Ejecuta una consulta y devuelve la primera fila, o None si no hay resultados.
+        """
+        params = self._parameters(params)
+        return await self.run(lambda conn: conn.execute(sql, params).fetchone(), name or self._query_name(sql))
+
+    async def fetch_all(self, sql: str, params: Iterable[Any] | Mapping[str, Any] = (),
+                        name: str = None) -> List[tuple]:
+        """
+        Ejecuta una consulta y devuelve todas las filas.
+        """
+        params = self._parameters(params)
+        return await self.run(lambda conn: conn.execute(sql, params).fetchall(), name or self._query_name(sql))
+
+    async def execute(self, sql: str, params: Iterable[Any] | Mapping[str, Any] = (), name: str = None) -> int:
+        """
+        Ejecuta una sentencia de escritura en su propia transacción y devuelve el número de filas afectadas.
+        """
+        params = self._parameters(params)
+        return await self.run(lambda conn: conn.execute(sql, params).rowcount, name or self._query_name(sql))
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any] | Mapping[str, Any]],
+                          name: str = None) -> int:
+        """
+        Ejecuta la misma sentencia con varios juegos de parámetros en una única transacción.
+        """
+        rows = [self._parameters(params) for params in seq_of_params]
+        return await self.run(lambda conn: conn.executemany(sql, rows).rowcount, name or self._query_name(sql))
+
+    @staticmethod
+    def _query_name(sql: str) -> str:
+        """
+        Nombre por defecto de una consulta en las métricas: la sentencia y la primera tabla, p. ej. `select pokemon`.
+        """
+        words = sql.split()
+        verb = words[0].lower() if words else 'run'
+        for keyword in ('FROM', 'INTO', 'UPDATE'):
+            if keyword in words[:-1]:
+                return f"{verb} {words[words.index(keyword) + 1].lower()}"
+        return verb
+
+    @staticmethod
+    def _parameters(params: Iterable[Any] | Mapping[str, Any]) -> tuple | Mapping[str, Any]:
+        return params if isinstance(params, Mapping) else tuple(params)
+
+    def close(self) -> None:
+        """
+        Cierra todas las conexiones del pool y detiene el pool de hilos.
+        """
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._opened = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='sqlite')
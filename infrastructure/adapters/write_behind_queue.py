@@ -0,0 +1,168 @@
+import asyncio
+import os
+from typing import Any, Dict, Hashable, List, Tuple
+
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+
+_FLUSH = object()
+"""Marca encolada por `flush` para que el grupo en curso se confirme sin esperar a `max_delay`."""
+
+
+class WriteBehindQueue:
+    """
+    Cola de escrituras con commit agrupado (group commit).
+
+    Las escrituras se encolan y una única tarea escritora las confirma en grupos: en cuanto llega la primera espera
+    como máximo `max_delay` segundos a que se acumulen más, hasta `max_batch`, y las ejecuta todas en una sola
+    transacción. Así las ráfagas de actualizaciones no compiten por el bloqueo de escritura de SQLite ni hacen un
+    commit cada una. Quien encola recibe la confirmación después del commit de su grupo, y mientras tanto el valor
+    pendiente se puede consultar con `pending` para que las lecturas vean las escrituras todavía no confirmadas.
+    """
+
+    def __init__(self, sqlite_gateway: SqliteGateway, enabled: bool = None, max_batch: int = None,
+                 max_delay: float = None):
+        """
+        Inicializa la cola. Los valores no proporcionados se leen del `.env`.
+
+        Args:
+            sqlite_gateway (SqliteGateway): Acceso a la base de datos local.
+            enabled (bool): Si es False las escrituras no deben pasar por la cola (`DB_WRITE_BEHIND`).
+            max_batch (int): Escrituras confirmadas como máximo en cada transacción (`DB_WRITE_BEHIND_MAX_BATCH`).
+            max_delay (float): Segundos que se espera a completar un grupo (`DB_WRITE_BEHIND_MAX_DELAY`).
+        """
+        self.sqlite_gateway = sqlite_gateway
+        self.enabled = enabled if enabled is not None else os.getenv('DB_WRITE_BEHIND', 'false') == 'true'
+        self.max_batch = max_batch or int(os.getenv('DB_WRITE_BEHIND_MAX_BATCH', '100'))
+        self.max_delay = max_delay if max_delay is not None else float(os.getenv('DB_WRITE_BEHIND_MAX_DELAY', '0.005'))
+        self.commits = 0
+        self.writes = 0
+        self._pending: Dict[Hashable, Any] = {}
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+
+    def pending(self, key: Hashable) -> Any:
+        """
+        Devuelve el último valor encolado para `key` que todavía no se confirmó, o None.
+        """
+        return self._pending.get(key)
+
+    def pending_items(self) -> Dict[Hashable, Any]:
+        """
+        Devuelve una copia de todos los valores pendientes de confirmar.
+        """
+        return dict(self._pending)
+
+    async def submit(self, key: Hashable, value: Any, sql: str, params: tuple) -> None:
+        """
+        Encola una escritura y espera a que se confirme su grupo.
+
+        Args:
+            key (Hashable): Clave con la que el valor queda visible en `pending` hasta el commit.
+            value (Any): Valor escrito, para las lecturas que deban ver la escritura pendiente.
+            sql (str): Sentencia de escritura.
+            params (tuple): Parámetros de la sentencia.
+
+        Raises:
+            Exception: La excepción de esta escritura, o la de la transacción si el grupo no se pudo confirmar.
+        """
+        if self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.ensure_future(self._drain())
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = value
+        self._queue.put_nowait((key, value, sql, params, future))
+        await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            deadline = loop.time() + self.max_delay
+            batch = []
+            while True:
+                if item is _FLUSH:
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                if not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if batch:
+                await self._commit(batch)
+
+    async def _commit(self, batch: List[Tuple[Hashable, Any, str, tuple, asyncio.Future]]) -> None:
+        """
+        Ejecuta el grupo en una sola transacción y resuelve la espera de cada escritura.
+
+        Cada escritura se ejecuta dentro de su propio SAVEPOINT: si una falla solo se deshace esa y solo quien la
+        encoló recibe la excepción; el resto del grupo se confirma igualmente.
+        """
+        def write(conn) -> List[Exception | None]:
+            if not conn.in_transaction:
+                conn.execute('BEGIN')
+            errors = []
+            for _, _, sql, params, _ in batch:
+                conn.execute('SAVEPOINT write_behind_item')
+                try:
+                    conn.execute(sql, params)
+                    errors.append(None)
+                except Exception as exc:
+                    conn.execute('ROLLBACK TO write_behind_item')
+                    errors.append(exc)
+                conn.execute('RELEASE write_behind_item')
+            return errors
+
+        try:
+            errors = await self.sqlite_gateway.run(write, 'write_behind.commit')
+            self.commits += 1
+            self.writes += errors.count(None)
+        except Exception as exc:
+            errors = [exc] * len(batch)
+        for (key, value, _, _, future), error in zip(batch, errors):
+            # Una escritura posterior de la misma clave sigue pendiente hasta su propio commit.
+            if self._pending.get(key) is value:
+                del self._pending[key]
+            if not future.done():
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+            self._queue.task_done()
+
+    async def flush(self) -> None:
+        """
+        Confirma de inmediato las escrituras encoladas, sin esperar a que se complete el grupo, y espera al commit.
+        """
+        if self._writer is not None and not self._writer.done():
+            self._queue.put_nowait(_FLUSH)
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """
+        Confirma las escrituras pendientes y detiene la tarea escritora.
+        """
+        await self.flush()
+        if self._writer is not None:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+        self._writer = None
+        self._queue = None
+
+    def stats(self) -> dict:
+        """
+        Devuelve cuántas transacciones y escrituras se confirmaron y cuántas claves siguen pendientes.
+        """
+        return {
+            'commits': self.commits,
+            'writes': self.writes,
+            'pending': len(self._pending)
+        }
@@ -3,9 +3,20 @@ from dependency_injector import containers, providers
 from api import Handlers
 from application.get_general.get_general_handler import GetGeneralHandler
 from application.get_specific.get_specific_handler import GetSpecificHandler
+from application.get_specific_batch.get_specific_batch_handler import GetSpecificBatchHandler
+from application.patch_pokemon.patch_pokemon_handler import PatchPokemonHandler
 from application.update_pokemon.update_pokemon_handler import UpdatePokemonHanlder
+from application.update_pokemon_bulk.update_pokemon_bulk_handler import UpdatePokemonBulkHandler
 from domain.services.pokemon_service import PokemonService
+from infrastructure.adapters.circuit_breaker import CircuitBreaker
+from infrastructure.adapters.data_version import DataVersion
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.pokeapi_client import PokeApiClient
 from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.adapters.write_behind_queue import WriteBehindQueue
 
 
 class Container(containers.DeclarativeContainer):
@@ -23,8 +34,87 @@ class Container(containers.DeclarativeContainer):
     Define cómo los módulos de la API recibirán las dependencias inyectadas automáticamente.
     """
 
+    metrics = providers.Singleton(
+        MetricsRegistry
+    )
+    """
+    Proveedor de una instancia singleton de `MetricsRegistry`, el registro de métricas que se expone en `/metrics`
+    y en el que publican el middleware de métricas, el gateway de SQLite, el cliente de PokeAPI y el repositorio.
+    """
+
+    http_cache = providers.Singleton(
+        HttpCache
+    )
+    """
+    Proveedor de una instancia singleton de `HttpCache`, la caché persistente en disco de las respuestas de PokeAPI
+    con revalidación por ETag / Last-Modified, compartida por todos los workers del host.
+    """
+
+    circuit_breaker = providers.Singleton(
+        CircuitBreaker
+    )
+    """
+    Proveedor de una instancia singleton de `CircuitBreaker`, el cortocircuito de las peticiones a PokeAPI: tras
+    varios fallos consecutivos deja de salir a la red durante un tiempo y el cliente sirve la caché persistente.
+    """
+
+    pokemon_cache = providers.Singleton(
+        LruTtlCache
+    )
+    """
+    Proveedor de una instancia singleton de `LruTtlCache`, la caché en memoria (LRU con TTL) que comparten
+    ambos repositorios de consulta delante de las búsquedas a PokeAPI.
+    """
+
+    sqlite_gateway = providers.Singleton(
+        SqliteGateway,
+        metrics=metrics
+    )
+    """
+    Proveedor de una instancia singleton de `SqliteGateway`, que mantiene el pool de conexiones a SQLite y ejecuta
+    las consultas fuera del event loop. Sus conexiones se cierran con el lifespan de la app.
+    """
+
+    write_behind_queue = providers.Singleton(
+        WriteBehindQueue,
+        sqlite_gateway=sqlite_gateway
+    )
+    """
+    Proveedor de una instancia singleton de `WriteBehindQueue`, la cola opcional (`DB_WRITE_BEHIND`) que confirma
+    las actualizaciones en grupos. Se vacía con el lifespan de la app antes de cerrar las conexiones.
+    """
+
+    data_version = providers.Singleton(
+        DataVersion,
+        sqlite_gateway=sqlite_gateway,
+        write_behind_queue=write_behind_queue
+    )
+    """
+    Proveedor de una instancia singleton de `DataVersion`, la versión de los datos de la que se derivan los ETag
+    de los endpoints de lectura. Se guarda en la base de datos, donde la incrementan los triggers de cada escritura,
+    el repositorio al reconstruir un catálogo distinto y el cliente de PokeAPI al detectar cambios.
+    """
+
+    pokeapi_client = providers.Singleton(
+        PokeApiClient,
+        http_cache=http_cache,
+        data_version=data_version,
+        metrics=metrics,
+        circuit_breaker=circuit_breaker
+    )
+    """
+    Proveedor de una instancia singleton de `PokeApiClient`, el cliente HTTP compartido con pool de conexiones
+    que utilizan todos los repositorios para comunicarse con PokeAPI. Se abre y se cierra con el lifespan de la app.
+    """
+
     pokemon_repository = providers.Singleton(
-        PokemonRepositoryImplementation
+        PokemonRepositoryImplementation,
+        pokeapi_client=pokeapi_client,
+        sqlite_gateway=sqlite_gateway,
+        pokemon_cache=pokemon_cache,
+        write_behind_queue=write_behind_queue,
+        data_version=data_version,
+        metrics=metrics
     )
     """
     Proveedor de una instancia singleton de `PokemonRepositoryImplementation`, que es el repositorio 
@@ -49,6 +139,15 @@ class Container(containers.DeclarativeContainer):
     El repositorio de Pokémon es inyectado como dependencia.
     """
 
+    get_specific_batch_handler = providers.Factory(
+        GetSpecificBatchHandler,
+        pokemon_repository=pokemon_repository
+    )
+    """
+    Proveedor de una fábrica de instancias de `GetSpecificBatchHandler`, que maneja las consultas de varios Pokémon
+    específicos a la vez. El repositorio de Pokémon es inyectado como dependencia.
+    """
+
     get_general_handler = providers.Factory(
         GetGeneralHandler,
         pokemon_repository=pokemon_repository
@@ -66,3 +165,21 @@ class Container(containers.DeclarativeContainer):
     Proveedor de una fábrica de instancias de `UpdatePokemonHandler`, que maneja las actualizaciones de Pokémon.
     El servicio de Pokémon es inyectado como dependencia.
     """
+
+    update_pokemon_bulk_handler = providers.Factory(
+        UpdatePokemonBulkHandler,
+        pokemon_service=pokemon_service
+    )
+    """
+    Proveedor de una fábrica de instancias de `UpdatePokemonBulkHandler`, que maneja las actualizaciones de varios
+    Pokémon a la vez. El servicio de Pokémon es inyectado como dependencia.
+    """
+
+    patch_pokemon_handler = providers.Factory(
+        PatchPokemonHandler,
+        pokemon_service=pokemon_service
+    )
+    """
+    Proveedor de una fábrica de instancias de `PatchPokemonHandler`, que maneja las actualizaciones parciales de
+    Pokémon. El servicio de Pokémon es inyectado como dependencia.
+    """
@@ -0,0 +1,191 @@
+"""
+Migraciones del esquema de la base de datos local de Pokémon.
+
+La versión del esquema se guarda en `PRAGMA user_version`, por lo que ejecutar las migraciones sobre una base ya
+actualizada no hace nada. Se pueden ejecutar de forma puntual sobre un `pokemon.db` existente con:
+
+    python -m infrastructure.migrations [ruta_db] [--binary]
+"""
+import ast
+import argparse
+import os
+import sqlite3
+import uuid
+from typing import Callable, List, Tuple
+
+import dotenv
+
+from infrastructure.adapters.pokemon_codec import encode_column
+
+
+def _create_pokemon_table(conn: sqlite3.Connection, binary: bool) -> None:
+    """
+    Versión 1 (base): crea la tabla `pokemon` si la base de datos es nueva.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS pokemon (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            pokedex_number INTEGER UNIQUE,
+            abilities TEXT,
+            sprites TEXT,
+            types TEXT
+        )
+    ''')
+
+
+def _legacy_list(raw: str | None) -> list:
+    return raw.split(',') if raw else []
+
+
+def _legacy_sprites(raw: str | None) -> dict:
+    return ast.literal_eval(raw) if raw else {}
+
+
+def _store_columns_as_json(conn: sqlite3.Connection, binary: bool) -> None:
+    """
+    Versión 2: convierte `abilities` y `types` (texto separado por comas) y `sprites` (repr de un dict de Python)
+    a JSON, o a JSON comprimido si `binary` es True.
+    """
+    rows = conn.execute('SELECT id, abilities, sprites, types FROM pokemon').fetchall()
+    conn.executemany(
+        'UPDATE pokemon SET abilities=?, sprites=?, types=? WHERE id=?',
+        [(encode_column(_legacy_list(abilities), binary),
+          encode_column(_legacy_sprites(sprites), binary),
+          encode_column(_legacy_list(types), binary),
+          row_id)
+         for row_id, abilities, sprites, types in rows]
+    )
+
+
+def _track_mirror_sync(conn: sqlite3.Connection, binary: bool) -> None:
+    """
+    Versión 3: distingue las filas copiadas de PokeAPI (`origin='mirror'`) de las editadas por los usuarios
+    (`origin='custom'`) y crea `sync_state`, que registra qué registros del catálogo ya se sincronizaron.
+    """
+    conn.execute("ALTER TABLE pokemon ADD COLUMN origin TEXT NOT NULL DEFAULT 'custom'")
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sync_state (
+            pokedex_number INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        )
+    ''')
+
+
+def _index_names(conn: sqlite3.Connection, binary: bool) -> None:
+    """
+    Versión 4: índice de búsqueda por nombre. Una tabla FTS5 con tokenizador trigram (contenido externo sobre
+    `pokemon`, sincronizada por triggers) resuelve las búsquedas por subcadena, y un índice NOCASE sobre `name`
+    resuelve las coincidencias exactas y por prefijo.
+    """
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_pokemon_name ON pokemon(name COLLATE NOCASE)')
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS pokemon_name_fts
+        USING fts5(name, content='pokemon', content_rowid='id', tokenize='trigram')
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS pokemon_name_fts_insert AFTER INSERT ON pokemon BEGIN
+            INSERT INTO pokemon_name_fts(rowid, name) VALUES (new.id, new.name);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS pokemon_name_fts_delete AFTER DELETE ON pokemon BEGIN
+            INSERT INTO pokemon_name_fts(pokemon_name_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS pokemon_name_fts_update AFTER UPDATE OF name ON pokemon BEGIN
+            INSERT INTO pokemon_name_fts(pokemon_name_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            INSERT INTO pokemon_name_fts(rowid, name) VALUES (new.id, new.name);
+        END
+    ''')
+    conn.execute("INSERT INTO pokemon_name_fts(pokemon_name_fts) VALUES ('rebuild')")
+
+
+def _track_data_version(conn: sqlite3.Connection, binary: bool) -> None:
+    """
+    Versión 5: crea `data_version`, una única fila con la versión de los datos de la que se derivan los ETag, y
+    triggers que la incrementan en la misma transacción que cada escritura en `pokemon`, la haga quien la haga
+    (cualquier worker, la cola de escrituras o `sync.py`). `epoch` identifica la base de datos, para que los ETag
+    de una base recreada no coincidan con los de la anterior.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            epoch TEXT NOT NULL,
+            value INTEGER NOT NULL
+        )
+    ''')
+    conn.execute('INSERT OR IGNORE INTO data_version (id, epoch, value) VALUES (1, ?, 0)', (uuid.uuid4().hex[:12],))
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS pokemon_data_version_{event.lower()} AFTER {event} ON pokemon BEGIN
+                UPDATE data_version SET value = value + 1 WHERE id = 1;
+            END
+        ''')
+
+
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Connection, bool], None]]] = [
+    (1, _create_pokemon_table),
+    (2, _store_columns_as_json),
+    (3, _track_mirror_sync),
+    (4, _index_names),
+    (5, _track_data_version),
+]
+"""
+Lista ordenada de migraciones `(versión, función)`. Cada función recibe la conexión y si se usa la codificación
+binaria, y se ejecuta dentro de la misma transacción que actualiza `user_version`.
+"""
+
+
+def migrate(conn: sqlite3.Connection, binary: bool = False) -> int:
+    """
+    Aplica las migraciones pendientes sobre la conexión indicada.
+
+    Args:
+        conn (sqlite3.Connection): Conexión a la base de datos a migrar.
+        binary (bool): Si es True las columnas estructuradas se guardan como JSON comprimido.
+
+    Returns:
+        int: Versión del esquema tras la migración.
+    """
+    current_version = conn.execute('PRAGMA user_version').fetchone()[0]
+    for version, migration in MIGRATIONS:
+        if version <= current_version:
+            continue
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Otro proceso pudo migrar mientras se esperaba el bloqueo de escritura.
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= version:
+                conn.rollback()
+                continue
+            migration(conn, binary)
+            conn.execute(f'PRAGMA user_version={version}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current_version = version
+    return current_version
+
+
+def main() -> None:
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description='Migra el esquema de la base de datos local de Pokémon.')
+    parser.add_argument('db_path', nargs='?', default=os.getenv('DB_PATH', 'pokemon.db'))
+    parser.add_argument('--binary', action='store_true', default=os.getenv('DB_BINARY_ENCODING', 'false') == 'true',
+                        help='Guarda abilities, sprites y types como JSON comprimido con zlib.')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db_path, isolation_level=None)
+    try:
+        version = migrate(conn, args.binary)
+    finally:
+        conn.close()
+    print(f'{args.db_path}: esquema en la versión {version}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,44 @@
+import os
+from contextlib import asynccontextmanager
+
 import dotenv
 from fastapi import FastAPI
 
-from api import Handlers
-from api.exception_handler import ExceptionMiddleware
-from infrastructure.container import Container
-
+# Antes de importar la aplicación: el contenedor lee `ROUTES_MANIFEST` al importarse.
 dotenv.load_dotenv()
 
-app = FastAPI()
+from api import Handlers  # noqa: E402
+from api.exception_handler import ExceptionMiddleware  # noqa: E402
+from api.metrics_middleware import MetricsMiddleware  # noqa: E402
+from api.server_timing_middleware import ServerTimingMiddleware  # noqa: E402
+from infrastructure.container import Container  # noqa: E402
+from infrastructure.migrations import migrate  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """
+    Abre los recursos compartidos de la aplicación al arrancar y los libera al apagarse.
+    """
+    sqlite_gateway = application.container.sqlite_gateway()
+    binary_encoding = os.getenv('DB_BINARY_ENCODING', 'false') == 'true'
+    await sqlite_gateway.run(lambda conn: migrate(conn, binary_encoding))
+    pokeapi_client = application.container.pokeapi_client()
+    if os.getenv('LAZY_STARTUP', 'false') == 'true':
+        # Se empieza a atender peticiones sin esperar a importar aiohttp ni a abrir la sesión HTTP.
+        pokeapi_client.start_in_background()
+    else:
+        await pokeapi_client.start()
+    yield
+    await application.container.write_behind_queue().close()
+    await pokeapi_client.close()
+    sqlite_gateway.close()
+
+
+app = FastAPI(lifespan=lifespan)
 app.container = Container()
 app.add_middleware(ExceptionMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware, metrics=app.container.metrics())
 for handler in Handlers.iterator():
     app.include_router(handler.router)
@@ -0,0 +1,60 @@
+"""
+Sincroniza el catálogo completo de PokeAPI en la base de datos local.
+
+    python sync.py                # incremental: solo registros nuevos o renombrados
+    python sync.py --revalidate   # revisa todos los registros y escribe solo los que cambiaron
+    python sync.py --full         # vuelve a escribir todo el catálogo
+
+Se puede interrumpir y volver a ejecutar: los lotes ya escritos no se repiten.
+"""
+import argparse
+import asyncio
+import json
+import os
+
+import dotenv
+
+from infrastructure.adapters.catalog_sync import CatalogSync
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+
+
+async def run(args: argparse.Namespace) -> dict:
+    binary_encoding = os.getenv('DB_BINARY_ENCODING', 'false') == 'true'
+    sqlite_gateway = SqliteGateway()
+    await sqlite_gateway.run(lambda conn: migrate(conn, binary_encoding))
+    pokeapi_client = PokeApiClient(http_cache=None if args.no_http_cache else HttpCache())
+    catalog_sync = CatalogSync(
+        pokeapi_client,
+        sqlite_gateway,
+        os.getenv('POKEAPI_URL', 'https://pokeapi.co/api/v2/pokemon/'),
+        page_size=args.page_size,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        binary_encoding=binary_encoding
+    )
+    try:
+        return await catalog_sync.run(full=args.full, revalidate=args.revalidate)
+    finally:
+        await pokeapi_client.close()
+        sqlite_gateway.close()
+
+
+def main() -> None:
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description='Copia el catálogo de PokeAPI en la tabla local pokemon.')
+    parser.add_argument('--full', action='store_true', help='Vuelve a escribir todos los registros.')
+    parser.add_argument('--revalidate', action='store_true',
+                        help='Revisa todos los registros y escribe solo los que cambiaron.')
+    parser.add_argument('--page-size', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('POKEAPI_FANOUT_CONCURRENCY', '10')))
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--no-http-cache', action='store_true', help='No usa la caché HTTP persistente.')
+    report = asyncio.run(run(parser.parse_args()))
+    print(json.dumps(report))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+
+from infrastructure.adapters.catalog_sync import CatalogSync
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+
+@pytest_asyncio.fixture
+async def stub():
+    stub_api = StubPokeApi(count=45)
+    server = TestServer(stub_api.application())
+    await server.start_server()
+    yield stub_api, str(server.make_url("/api/v2/pokemon/"))
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def gateway(tmp_path):
+    sqlite_gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await sqlite_gateway.run(migrate)
+    yield sqlite_gateway
+    sqlite_gateway.close()
+
+
+def catalog_sync(gateway, api_url, http_cache=None) -> CatalogSync:
+    return CatalogSync(PokeApiClient(http_cache=http_cache), gateway, api_url, page_size=10, concurrency=4,
+                       batch_size=7)
+
+
+@pytest.mark.asyncio
+async def test_sync_mirrors_the_whole_catalog(stub, gateway):
+    """Prueba que la sincronización copia todo el catálogo paginado en la tabla local"""
+    stub_api, api_url = stub
+
+    sync = catalog_sync(gateway, api_url)
+    report = await sync.run()
+    await sync.pokeapi_client.close()
+
+    rows = await gateway.fetch_all("SELECT pokedex_number, origin FROM pokemon ORDER BY pokedex_number")
+    assert report["written"] == 45
+    assert rows == [(number, "mirror") for number in range(1, 46)]
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_only_fetches_new_or_renamed_records(stub, gateway):
+    """Prueba que una ejecución incremental solo consulta los registros nuevos o renombrados"""
+    stub_api, api_url = stub
+    await catalog_sync(gateway, api_url).run()
+    stub_api.count = 47
+    stub_api.renamed[3] = "renamed-3"
+    stub_api.requests.clear()
+
+    report = await catalog_sync(gateway, api_url).run()
+
+    detail_requests = [path for path in stub_api.requests if "?" not in path]
+    assert sorted(detail_requests) == ["/api/v2/pokemon/3/", "/api/v2/pokemon/46/", "/api/v2/pokemon/47/"]
+    assert report["written"] == 3
+    assert await gateway.fetch_one("SELECT name FROM pokemon WHERE pokedex_number=3") == ("renamed-3",)
+
+
+@pytest.mark.asyncio
+async def test_sync_resumes_and_keeps_custom_rows(stub, gateway, tmp_path):
+    """Prueba que tras una interrupción se reanuda sin repetir lotes y que no pisa las filas editadas"""
+    stub_api, api_url = stub
+    await gateway.execute("INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) "
+                          "VALUES ('custom', 5, '[]', '{}', '[]')")
+    # Simula una ejecución interrumpida tras escribir los primeros registros.
+    await gateway.executemany("INSERT INTO sync_state (pokedex_number, name, content_hash, synced_at) "
+                              "VALUES (?, ?, 'x', 0)", [(n, f"pokemon-{n}") for n in range(1, 15)])
+    stub_api.requests.clear()
+
+    report = await catalog_sync(gateway, api_url, HttpCache(str(tmp_path / "cache.db"))).run()
+
+    assert report["skipped"] == 14
+    assert not any(path == f"/api/v2/pokemon/{n}/" for path in stub_api.requests for n in range(1, 15))
+    assert await gateway.fetch_one("SELECT name, origin FROM pokemon WHERE pokedex_number=5") == ("custom", "custom")
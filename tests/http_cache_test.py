@@ -0,0 +1,60 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+
+
+@pytest_asyncio.fixture
+async def pokeapi_stub():
+    """Servidor local que responde como PokeAPI y honra If-None-Match"""
+    requests = []
+
+    async def pokemon(request: web.Request) -> web.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+        return web.json_response({"name": "pikachu", "id": 25},
+                                 headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+
+    app = web.Application()
+    app.router.add_get("/api/v2/pokemon/25", pokemon)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, requests
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_etag(tmp_path, pokeapi_stub):
+    """Prueba que una entrada vencida se revalida con If-None-Match y que el 304 reutiliza el cuerpo guardado"""
+    server, requests = pokeapi_stub
+    client = PokeApiClient(http_cache=HttpCache(str(tmp_path / "pokeapi_cache.db")))
+    url = str(server.make_url("/api/v2/pokemon/25"))
+
+    first = await client.get_json(url)
+    second = await client.get_json(url)
+    await client.close()
+
+    assert first == second == {"name": "pikachu", "id": 25}
+    assert requests == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_shared_without_network(tmp_path, pokeapi_stub):
+    """Prueba que otro proceso con la misma caché en disco sirve una entrada vigente sin salir a la red"""
+    server, requests = pokeapi_stub
+    cache_path = str(tmp_path / "pokeapi_cache.db")
+    url = str(server.make_url("/api/v2/pokemon/25"))
+    writer = HttpCache(cache_path, default_ttl=60)
+    await writer.store(url, b'{"name": "pikachu", "id": 25}', {"ETag": '"v1"'})
+    writer.close()
+
+    client = PokeApiClient(http_cache=HttpCache(cache_path))
+    data = await client.get_json(url)
+    await client.close()
+
+    assert data == {"name": "pikachu", "id": 25}
+    assert requests == []
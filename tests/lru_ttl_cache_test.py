@@ -0,0 +1,47 @@
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_least_recently_used_entry():
+    """Prueba que al superar el número de entradas se expulsa la menos usada recientemente"""
+    cache = LruTtlCache(max_entries=2, ttl=60)
+    cache.set("pikachu", {"id": 25})
+    cache.set("bulbasaur", {"id": 1})
+    cache.get("pikachu")
+
+    cache.set("charmander", {"id": 4})
+
+    assert cache.get("bulbasaur") is None
+    assert cache.get("pikachu") == {"id": 25}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_expires_entries_after_ttl():
+    """Prueba que una entrada deja de devolverse cuando vence su TTL"""
+    clock = FakeClock()
+    cache = LruTtlCache(ttl=10, clock=clock)
+    cache.set(25, {"id": 25})
+
+    clock.now = 9
+    assert cache.get("025") == {"id": 25}
+    clock.now = 10
+    assert cache.get(25) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_respects_byte_limit():
+    """Prueba que el tamaño aproximado en bytes de la caché nunca supera el límite configurado"""
+    cache = LruTtlCache(max_entries=100, max_bytes=50, ttl=60)
+    cache.set("a", "x" * 30)
+    cache.set("b", "y" * 30)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 30
+    assert cache.stats()["bytes"] <= 50
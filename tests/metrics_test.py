@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Prueba que el histograma se exporta con cubetas acumuladas, suma y total por combinación de etiquetas"""
+    metrics = MetricsRegistry()
+    histogram = metrics.histogram('query_seconds', 'Duración.', ('query',))
+
+    histogram.observe(0.0004, 'select')
+    histogram.observe(0.003, 'select')
+    histogram.observe(20, 'select')
+
+    lines = metrics.render().splitlines()
+    assert 'query_seconds_bucket{query="select",le="0.0005"} 1' in lines
+    assert 'query_seconds_bucket{query="select",le="0.005"} 2' in lines
+    assert 'query_seconds_bucket{query="select",le="10.0"} 2' in lines
+    assert 'query_seconds_bucket{query="select",le="+Inf"} 3' in lines
+    assert 'query_seconds_count{query="select"} 3' in lines
+
+
+def test_registry_reuses_metrics_and_rejects_conflicts():
+    """Prueba que pedir dos veces la misma métrica devuelve la misma instancia y que un tipo distinto se rechaza"""
+    metrics = MetricsRegistry()
+    counter = metrics.counter('requests_total', 'Peticiones.', ('status',))
+
+    assert metrics.counter('requests_total', 'Peticiones.', ('status',)) is counter
+    with pytest.raises(ValueError):
+        metrics.gauge('requests_total', 'Peticiones.', ('status',))
+
+
+def test_label_values_are_escaped():
+    """Prueba que las comillas y saltos de línea de las etiquetas se escapan"""
+    metrics = MetricsRegistry()
+    metrics.counter('errors_total', 'Errores.', ('message',)).inc('say "hi"\n')
+
+    assert 'errors_total{message="say \\"hi\\"\\n"} 1' in metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_repository_publishes_single_flight_counters():
+    """Prueba que el repositorio publica las ejecuciones y las llamadas deduplicadas del single-flight"""
+    registry = MetricsRegistry()
+    repository = PokemonRepositoryImplementation(PokeApiClient(), MagicMock(), LruTtlCache(), metrics=registry)
+
+    async def lookup():
+        await asyncio.sleep(0.01)
+        return []
+
+    await asyncio.gather(*[repository.single_flight.do("pikachu", lookup) for _ in range(3)])
+    rendered = registry.render()
+
+    assert "single_flight_calls_total 1" in rendered
+    assert "single_flight_deduplicated_total 2" in rendered
@@ -0,0 +1,52 @@
+import sqlite3
+
+import pytest
+
+from infrastructure.adapters.pokemon_codec import decode_column
+from infrastructure.migrations import MIGRATIONS, migrate
+
+LEGACY_SPRITES = "{'front_default': 'https://pokeapi.co/sprites/pokemon/25.png', 'back_female': None}"
+
+
+def legacy_database(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute('''
+        CREATE TABLE pokemon (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            pokedex_number INTEGER UNIQUE,
+            abilities TEXT,
+            sprites TEXT,
+            types TEXT
+        )
+    ''')
+    conn.execute("INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) VALUES (?, ?, ?, ?, ?)",
+                 ("pikachu", 25, "static,lightning-rod", LEGACY_SPRITES, "electric"))
+    return conn
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_migrate_converts_legacy_rows(tmp_path, binary):
+    """Prueba que la migración convierte las columnas heredadas a JSON (o JSON comprimido) sin usar eval"""
+    conn = legacy_database(tmp_path / "pokemon.db")
+
+    version = migrate(conn, binary)
+
+    abilities, sprites, types = conn.execute("SELECT abilities, sprites, types FROM pokemon").fetchone()
+    assert version == MIGRATIONS[-1][0]
+    assert isinstance(sprites, bytes) is binary
+    assert decode_column(abilities) == ["static", "lightning-rod"]
+    assert decode_column(sprites) == {"front_default": "https://pokeapi.co/sprites/pokemon/25.png",
+                                      "back_female": None}
+    assert decode_column(types) == ["electric"]
+
+
+def test_migrate_is_idempotent(tmp_path):
+    """Prueba que volver a ejecutar la migración sobre una base ya migrada no modifica los datos"""
+    conn = legacy_database(tmp_path / "pokemon.db")
+    migrate(conn)
+    migrated = conn.execute("SELECT abilities, sprites, types FROM pokemon").fetchone()
+
+    migrate(conn)
+
+    assert conn.execute("SELECT abilities, sprites, types FROM pokemon").fetchone() == migrated
@@ -0,0 +1,225 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from domain.dto.page_dto import PageRequestDto
+from infrastructure.adapters.circuit_breaker import CircuitBreaker
+from infrastructure.adapters.general_pokemon_query_repository import GeneralPokemonQueryRepository
+from infrastructure.adapters.http_cache import HttpCache
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.metrics import MetricsRegistry
+from infrastructure.adapters.pokeapi_client import PokeApiClient, UpstreamUnavailableError
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+
+@pytest_asyncio.fixture
+async def flaky_stub():
+    """Servidor local que responde con la secuencia de comportamientos indicada en `script`"""
+    script = []
+    requests = []
+
+    async def pokemon(request: web.Request) -> web.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        behaviour = script.pop(0) if script else "ok"
+        if isinstance(behaviour, float):
+            await asyncio.sleep(behaviour)
+        elif behaviour != "ok":
+            return web.Response(status=behaviour)
+        return web.json_response({"name": "pikachu", "id": 25},
+                                 headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+
+    app = web.Application()
+    app.router.add_get("/api/v2/pokemon/25", pokemon)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/api/v2/pokemon/25")), script, requests
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def repository_without_upstream(tmp_path, monkeypatch):
+    """Repositorio con dos filas en la base de datos y un PokeAPI que responde siempre 500"""
+    server = TestServer(StubPokeApi(count=10, error_rate=1.0).application())
+    await server.start_server()
+    monkeypatch.setenv("POKEAPI_URL", str(server.make_url("/api/v2/pokemon/")))
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.run(migrate)
+    await gateway.executemany(
+        "INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) VALUES (?, ?, '[]', '{}', '[]')",
+        [("pikachu", 25), ("raichu", 26)])
+    pokeapi_client = PokeApiClient(retries=0)
+    yield PokemonRepositoryImplementation(pokeapi_client, gateway, LruTtlCache())
+    await pokeapi_client.close()
+    gateway.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_with_backoff(flaky_stub):
+    """Prueba que un 503 se reintenta y que el reintento obtiene la respuesta"""
+    url, script, requests = flaky_stub
+    script.extend([503, 503])
+    metrics = MetricsRegistry()
+    client = PokeApiClient(retries=2, backoff_base=0.001, metrics=metrics)
+
+    data = await client.get_json(url)
+    await client.close()
+
+    assert data == {"name": "pikachu", "id": 25}
+    assert len(requests) == 3
+    assert metrics.counter("pokeapi_resilience_total", "", ("event",)).value("retry") == 2
+
+
+@pytest.mark.asyncio
+async def test_server_errors_and_network_failures_end_the_same_way(flaky_stub):
+    """Prueba que un 5xx que persiste tras los reintentos falla igual que un error de red, y no como un 404"""
+    url, script, _ = flaky_stub
+    script.extend([500, 500])
+    client = PokeApiClient(retries=1, backoff_base=0.001)
+
+    with pytest.raises(UpstreamUnavailableError):
+        await client.get_json(url)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_read_timeout_gives_up_without_cache(flaky_stub):
+    """Prueba que una respuesta colgada corta por timeout y, sin copia en caché, falla con UpstreamUnavailableError"""
+    url, script, requests = flaky_stub
+    script.extend([1.0, 1.0])
+    client = PokeApiClient(total_timeout=0.05, retries=1, backoff_base=0.001)
+
+    with pytest.raises(UpstreamUnavailableError):
+        await client.get_json(url)
+    await client.close()
+
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stale_cache_without_network(tmp_path, flaky_stub):
+    """Prueba que con el cortocircuito abierto se sirve la copia vencida sin salir a la red"""
+    url, script, requests = flaky_stub
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = PokeApiClient(http_cache=HttpCache(str(tmp_path / "pokeapi_cache.db")), retries=1,
+                           backoff_base=0.001, circuit_breaker=breaker)
+    await client.get_json(url)
+
+    script.extend([500, 500])
+    stale = await client.get_json(url)
+    assert breaker.state == CircuitBreaker.OPEN
+    requests_before = len(requests)
+    again = await client.get_json(url)
+    await client.close()
+
+    assert stale == again == {"name": "pikachu", "id": 25}
+    assert len(requests) == requests_before
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_the_fastest_response(flaky_stub):
+    """Prueba que si la primera petición tarda más que hedge_delay responde la segunda"""
+    url, script, requests = flaky_stub
+    script.append(2.0)
+    client = PokeApiClient(hedge_delay=0.05)
+
+    started = asyncio.get_running_loop().time()
+    data = await client.get_json(url)
+    elapsed = asyncio.get_running_loop().time() - started
+    await client.close()
+
+    assert data == {"name": "pikachu", "id": 25}
+    assert len(requests) == 2
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_losing_hedged_request_is_awaited(flaky_stub):
+    """Prueba que la petición duplicada que pierde ya terminó (cancelada) cuando se devuelve la respuesta"""
+    url, script, _ = flaky_stub
+    script.append(2.0)
+    metrics = MetricsRegistry()
+    client = PokeApiClient(hedge_delay=0.05, metrics=metrics)
+
+    await client.get_json(url)
+    cancelled = metrics.histogram("pokeapi_request_duration_seconds", "", ("status",)).count("cancelled")
+    await client.close()
+
+    assert cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_upstream_payloads_are_rejected(flaky_stub):
+    """Prueba que un detalle o un listado sin la forma esperada falla con UpstreamUnavailableError en vez de
+    llegar a los DTO sin validar"""
+    url, _, _ = flaky_stub
+    client = PokeApiClient()
+
+    with pytest.raises(UpstreamUnavailableError):
+        await client.get_pokemon(url)
+    await client.close()
+
+    listing_client = AsyncMock(PokeApiClient)
+    listing_client.get_json.return_value = {"count": 1, "results": [{"name": None, "url": "https://pokeapi.co/"}]}
+    repository = GeneralPokemonQueryRepository(None, "https://pokeapi.co/api/v2/pokemon/", listing_client,
+                                               LruTtlCache())
+    with pytest.raises(UpstreamUnavailableError):
+        await repository.get_page_from_api(10, 0)
+
+
+@pytest.mark.asyncio
+async def test_malformed_specific_listing_falls_back_to_the_database(repository_without_upstream):
+    """Prueba que un listado de PokeAPI sin la forma esperada no rompe la lista específica ni el streaming, que
+    se sirven con las filas de la base de datos"""
+    repository = repository_without_upstream
+    repository.specific_query_repo.pokeapi_client.get_json = AsyncMock(return_value={"results": [{"name": "x"}]})
+
+    with pytest.raises(UpstreamUnavailableError):
+        await repository.specific_query_repo.list_identifiers_from_api()
+    specific = await repository.get_specific()
+    streamed = [pokemon async for pokemon in repository.stream_specific()]
+
+    assert [pokemon.pokedex_number for pokemon in specific] == [25, 26]
+    assert not specific.complete
+    assert [pokemon.pokedex_number for pokemon in streamed] == [25, 26]
+
+
+@pytest.mark.asyncio
+async def test_lists_fall_back_to_the_database_when_upstream_is_down(repository_without_upstream):
+    """Prueba que sin PokeAPI las listas y las páginas se sirven con las filas de la base de datos"""
+    repository = repository_without_upstream
+
+    general = await repository.get_general()
+    specific = await repository.get_specific()
+    page = await repository.get_general_page(PageRequestDto(limit=10))
+
+    assert [pokemon.name for pokemon in general] == ["pikachu", "raichu"]
+    assert [pokemon.pokedex_number for pokemon in specific] == [25, 26]
+    assert [pokemon.name for pokemon in page.items] == ["pikachu", "raichu"]
+    assert not general.complete and not page.complete
+
+
+@pytest.mark.asyncio
+async def test_search_fails_when_upstream_is_down(repository_without_upstream):
+    """Prueba que una búsqueda que no está en la base de datos falla en vez de responder que no existe"""
+    with pytest.raises(UpstreamUnavailableError):
+        await repository_without_upstream.get_general("bulbasaur")
+
+
+@pytest.mark.asyncio
+async def test_batch_marks_unresolved_identifiers_as_unavailable(repository_without_upstream):
+    """Prueba que en un lote sin PokeAPI lo que no está en la base de datos queda `unavailable` y no como inexistente,
+    y que si no se resuelve ninguno falla"""
+    result = await repository_without_upstream.get_specific_batch(["25", "bulbasaur"])
+
+    assert result["25"].name == "pikachu"
+    assert result["bulbasaur"] == "unavailable"
+    with pytest.raises(UpstreamUnavailableError):
+        await repository_without_upstream.get_specific_batch(["1", "bulbasaur"])
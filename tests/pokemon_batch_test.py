@@ -0,0 +1,98 @@
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path, monkeypatch):
+    stub_api = StubPokeApi(count=25)
+    server = TestServer(stub_api.application())
+    await server.start_server()
+    monkeypatch.setenv("POKEAPI_URL", str(server.make_url("/api/v2/pokemon/")))
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.run(migrate)
+    await gateway.executemany(
+        "INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) VALUES (?, ?, '[]', '{}', '[]')",
+        [("pikachu", 25), ("raichu", 26)])
+    pokeapi_client = PokeApiClient()
+    yield PokemonRepositoryImplementation(pokeapi_client, gateway, LruTtlCache()), stub_api
+    await pokeapi_client.close()
+    gateway.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_resolves_database_hits_and_fetches_only_misses(repository):
+    """Prueba que el lote resuelve la base de datos en una consulta y solo pide a PokeAPI los que faltan"""
+    pokemon_repository, stub_api = repository
+
+    result = await pokemon_repository.get_specific_batch(["Pikachu", "026", "7", "pokemon-8", "missingno", "7"])
+
+    assert result["Pikachu"].pokedex_number == 25
+    assert result["026"].name == "raichu"
+    assert result["7"].name == "pokemon-7"
+    assert result["pokemon-8"].pokedex_number == 8
+    assert result["missingno"] is None
+    assert sorted(stub_api.requests) == ["/api/v2/pokemon/7", "/api/v2/pokemon/missingno", "/api/v2/pokemon/pokemon-8"]
+
+
+@pytest.mark.asyncio
+async def test_update_many_writes_every_row_in_one_call(repository):
+    """Prueba que la actualización masiva escribe todas las filas y las marca como editadas"""
+    pokemon_repository, stub_api = repository
+    pokemons = await pokemon_repository.get_many([25, 7, 999])
+    assert pokemons[999] is None
+    found = [pokemon for pokemon in pokemons.values() if pokemon is not None]
+    for pokemon in found:
+        pokemon.update(name=f"{pokemon.name}-custom")
+
+    await pokemon_repository.update_many(found)
+
+    rows = await pokemon_repository.sqlite_gateway.fetch_all(
+        "SELECT pokedex_number, name, origin FROM pokemon ORDER BY pokedex_number")
+    assert sorted(pokemon.pokedex_number for pokemon in found) == [7, 25]
+    assert rows == [(7, "pokemon-7-custom", "custom"), (25, "pikachu-custom", "custom"), (26, "raichu", "custom")]
+    assert sorted(stub_api.requests) == ["/api/v2/pokemon/7", "/api/v2/pokemon/999"]
+
+
+@pytest.mark.asyncio
+async def test_patch_only_touches_the_supplied_columns(repository):
+    """Prueba que la actualización parcial cambia solo las columnas indicadas y consulta PokeAPI solo si falta la fila"""
+    pokemon_repository, stub_api = repository
+    gateway = pokemon_repository.sqlite_gateway
+    row_id = (await gateway.fetch_one("SELECT id FROM pokemon WHERE pokedex_number=25"))[0]
+
+    assert await pokemon_repository.patch(25, {"types": ["electric", "fairy"]})
+    assert await pokemon_repository.patch(7, {"name": "squirtle"})
+    assert not await pokemon_repository.patch(999, {"name": "missingno"})
+
+    rows = await gateway.fetch_all("SELECT id, name, pokedex_number, types, origin FROM pokemon ORDER BY pokedex_number")
+    assert rows[0][1:] == ("squirtle", 7, '["electric"]', "custom")
+    assert rows[1] == (row_id, "pikachu", 25, '["electric","fairy"]', "custom")
+    assert sorted(stub_api.requests) == ["/api/v2/pokemon/7", "/api/v2/pokemon/999"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_ignores_the_listing_deadline_and_separates_failures(repository):
+    """Prueba que la búsqueda de las escrituras masivas no usa el plazo de los listados y que solo un 404 es `None`"""
+    pokemon_repository, stub_api = repository
+    stub_api.latency = 0.05
+    pokemon_repository.specific_query_repo.fanout_deadline = 0.01
+    pokemon_repository.specific_query_repo.fanout_concurrency = 2
+
+    pokemons = await pokemon_repository.get_many(list(range(1, 9)) + [999])
+    assert sorted(number for number, pokemon in pokemons.items() if pokemon is not None) == list(range(1, 9))
+    assert pokemons[999] is None
+
+    stub_api.error_rate = 1.0
+    pokemon_repository.specific_query_repo.pokeapi_client.retries = 0
+    unavailable = await pokemon_repository.get_many([10, 25])
+    assert list(unavailable) == [25]
+    assert unavailable[25].name == "pikachu"
@@ -0,0 +1,110 @@
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+
+from domain.entities.pokemon import Pokemon
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path, monkeypatch):
+    stub_api = StubPokeApi(count=10)
+    server = TestServer(stub_api.application())
+    await server.start_server()
+    monkeypatch.setenv("POKEAPI_URL", str(server.make_url("/api/v2/pokemon/")))
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.run(migrate)
+    pokeapi_client = PokeApiClient()
+    yield PokemonRepositoryImplementation(pokeapi_client, gateway, LruTtlCache()), stub_api
+    await pokeapi_client.close()
+    gateway.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_full_list_is_served_from_memory_until_a_write(repository):
+    """Prueba que la lista completa se reutiliza entre peticiones y se reconstruye tras una actualización"""
+    pokemon_repository, stub_api = repository
+
+    first = await pokemon_repository.get_general()
+    second = await pokemon_repository.get_general()
+    assert second is first
+    assert len(stub_api.requests) == 1
+
+    await pokemon_repository.update(Pokemon(name="custom-3", pokedex_number=3, abilities=[], sprites={}, types=[]))
+    third = await pokemon_repository.get_general()
+
+    assert third is not first
+    assert [pokemon.name for pokemon in third][2] == "custom-3"
+
+
+@pytest.mark.asyncio
+async def test_full_list_is_rebuilt_after_its_ttl(repository):
+    """Prueba que la lista completa se vuelve a construir al vencer su TTL"""
+    pokemon_repository, stub_api = repository
+    pokemon_repository.catalog_ttl = 0
+
+    await pokemon_repository.get_general()
+    await pokemon_repository.get_general()
+
+    assert len(stub_api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_data_version_changes_with_writes_but_not_with_unchanged_rebuilds(repository):
+    """Prueba que la versión cambia tras una actualización pero no al reconstruir un catálogo idéntico"""
+    pokemon_repository, _ = repository
+    pokemon_repository.catalog_ttl = 0
+    version = await pokemon_repository.data_version.current()
+
+    await pokemon_repository.get_general()
+    await pokemon_repository.get_general()
+    assert await pokemon_repository.data_version.current() == version
+
+    await pokemon_repository.update(Pokemon(name="custom-3", pokedex_number=3, abilities=[], sprites={}, types=[]))
+    assert await pokemon_repository.data_version.current() != version
+
+
+@pytest.mark.asyncio
+async def test_incomplete_catalogs_are_not_kept(repository):
+    """Prueba que un catálogo construido sin PokeAPI se marca como incompleto, no se conserva y no cambia la versión"""
+    pokemon_repository, stub_api = repository
+    pokemon_repository.specific_query_repo.pokeapi_client.retries = 0
+    await pokemon_repository.update(Pokemon(name="custom-3", pokedex_number=3, abilities=[], sprites={}, types=[]))
+    version = await pokemon_repository.data_version.current()
+    stub_api.error_rate = 1.0
+
+    first = await pokemon_repository.get_general()
+    second = await pokemon_repository.get_general()
+
+    assert not first.complete
+    assert [pokemon.name for pokemon in first] == ["custom-3"]
+    assert second is not first
+    assert await pokemon_repository.data_version.current() == version
+
+    stub_api.error_rate = 0.0
+    assert (await pokemon_repository.get_general()).complete
+
+
+@pytest.mark.asyncio
+async def test_full_list_is_rebuilt_after_a_write_from_another_worker(repository):
+    """Prueba que una escritura hecha por otro worker sobre la misma base invalida la lista en memoria"""
+    pokemon_repository, stub_api = repository
+    first = await pokemon_repository.get_general()
+    assert await pokemon_repository.get_general() is first
+
+    other_worker = SqliteGateway(pokemon_repository.sqlite_gateway.db_path, pool_size=1)
+    await other_worker.execute("INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) "
+                               "VALUES ('custom-3', 3, '[]', '{}', '[]')")
+    other_worker.close()
+    rebuilt = await pokemon_repository.get_general()
+
+    assert rebuilt is not first
+    assert [pokemon.name for pokemon in rebuilt][2] == "custom-3"
+    assert await pokemon_repository.get_general() is rebuilt
+    assert len(stub_api.requests) == 2
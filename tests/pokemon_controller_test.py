@@ -1,14 +1,35 @@
+import asyncio
+import json
+import sqlite3
 import pytest
 from unittest.mock import patch
 from fastapi.testclient import TestClient
 from main import app
 from domain.entities.pokemon import Pokemon
 from domain.dto.general_pokemon_dto import GeneralPokemonDto
+from domain.dto.materialized_list_dto import MaterializedListDto
 from domain.dto.specific_pokemon_dto import SpecificPokemonDto
+from infrastructure.adapters.data_version import DataVersion
+from infrastructure.adapters.pokeapi_client import UpstreamUnavailableError
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def database(tmp_path):
+    """Versión de los datos sobre una base temporal ya migrada; devuelve su ruta para escribir como otro worker"""
+    path = str(tmp_path / "pokemon.db")
+    conn = sqlite3.connect(path, isolation_level=None)
+    migrate(conn)
+    conn.close()
+    gateway = SqliteGateway(path, pool_size=1)
+    with app.container.data_version.override(DataVersion(gateway)):
+        yield path
+    gateway.close()
+
+
 @pytest.mark.asyncio
 @patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_specific")
 async def test_get_pokemon_by_pokedex_number_found(mock_get_specific):
@@ -80,6 +101,37 @@ async def test_get_pokemon_by_name_not_found(mock_get_general):
     assert len(response_data) == 0  # No debe haber resultados
 
 
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_get_general_answers_503_when_upstream_is_unavailable(mock_get_general):
+    """
+    Test de integración que verifica que una búsqueda sin PokeAPI disponible responde 503 (endpoint /general).
+    """
+    mock_get_general.side_effect = UpstreamUnavailableError("PokeAPI circuit is open")
+
+    response = client.get("/pokemon/general?data_to_search=Unknown")
+    assert response.status_code == 503
+    assert response.json()["ExceptionType"] == "UpstreamUnavailableError"
+
+
+class _ErrorWithStatus(Exception):
+    status_code = 500
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_other_exceptions_answer_400_even_with_a_status_code(mock_get_general):
+    """
+    Test de integración que verifica que solo UpstreamUnavailableError cambia el código de estado: cualquier otra
+    excepción responde 400 aunque tenga un atributo `status_code` (endpoint /general).
+    """
+    mock_get_general.side_effect = _ErrorWithStatus("boom")
+
+    response = client.get("/pokemon/general?data_to_search=Unknown")
+    assert response.status_code == 400
+    assert response.json() == {"ExceptionType": "_ErrorWithStatus", "message": "boom"}
+
+
 @pytest.mark.asyncio
 @patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_one")
 @patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.update")
@@ -128,3 +180,232 @@ async def test_update_pokemon_not_found(mock_update, mock_get_one):
     response_data = response.json()  # Convertimos la respuesta a JSON
     assert response.status_code == 400
     assert response_data == {'ExceptionType': 'Exception', 'message': 'Pokemon not found'}
+
+
+async def fake_stream_specific(self, projection=None):
+    for pokedex_number in (25, 26):
+        yield SpecificPokemonDto(name=f"pokemon-{pokedex_number}", pokedex_number=pokedex_number, abilities=[],
+                                 sprites={}, types=["electric"])
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.stream_specific",
+       new=fake_stream_specific)
+async def test_get_specific_streams_ndjson():
+    """
+    Test de integración que verifica que con `Accept: application/x-ndjson` se envía un Pokémon por línea.
+    """
+    response = client.get("/pokemon/specific", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line)["pokedex_number"] for line in response.text.splitlines()] == [25, 26]
+
+
+async def failing_stream_specific(self, projection=None):
+    yield SpecificPokemonDto(name="pokemon-25", pokedex_number=25, abilities=[], sprites={}, types=["electric"])
+    raise Exception("stream broke")
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_unhandled_exceptions_answer_400(mock_get_general):
+    """
+    Test de integración que verifica que una excepción cualquiera se convierte en un 400 con el tipo y el mensaje
+    de la excepción (endpoint /general).
+    """
+    mock_get_general.side_effect = Exception("boom")
+
+    response = client.get("/pokemon/general")
+    assert response.status_code == 400
+    assert response.json() == {"ExceptionType": "Exception", "message": "boom"}
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.stream_specific",
+       new=failing_stream_specific)
+async def test_errors_after_the_stream_started_end_the_response():
+    """
+    Test de integración que verifica que un error a mitad de un streaming no intenta enviar una segunda respuesta:
+    lo ya enviado no se altera y la excepción llega al servidor para que corte la conexión.
+    """
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+             "path": "/pokemon/specific", "raw_path": b"/pokemon/specific", "root_path": "", "query_string": b"",
+             "headers": [(b"host", b"testserver"), (b"accept", b"application/x-ndjson")],
+             "client": ("testclient", 50000), "server": ("testserver", 80)}
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # El cliente sigue conectado: la respuesta en streaming espera aquí una desconexión que no llega.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    with pytest.raises(Exception):
+        await app(scope, receive, send)
+
+    starts = [message for message in messages if message["type"] == "http.response.start"]
+    body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+    assert [start["status"] for start in starts] == [200]
+    assert [json.loads(line)["pokedex_number"] for line in body.decode().splitlines()] == [25]
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_specific_batch")
+async def test_get_specific_batch_keys_results_by_identifier(mock_get_specific_batch):
+    """
+    Test de integración que verifica que el lote devuelve cada identificador con su Pokémon o null (endpoint /specific/batch).
+    """
+    mock_get_specific_batch.return_value = {
+        "25": SpecificPokemonDto(name="Pikachu", pokedex_number=25, abilities=[], sprites={}, types=["electric"]),
+        "missingno": None,
+        "26": "unavailable"
+    }
+
+    response = client.post("/pokemon/specific/batch", json={"identifiers": [25, "missingno", 26]})
+    response_data = response.json()
+    assert response.status_code == 200
+    assert response_data["25"]["name"] == "Pikachu"
+    assert response_data["missingno"] is None
+    assert response_data["26"] == "unavailable"
+    mock_get_specific_batch.assert_called_once_with(["25", "missingno", "26"])
+
+
+def test_get_specific_batch_rejects_oversized_batches():
+    """
+    Test de integración que verifica que un lote de más de 100 identificadores se rechaza (endpoint /specific/batch).
+    """
+    response = client.post("/pokemon/specific/batch", json={"identifiers": list(range(101))})
+    assert response.status_code == 422
+
+
+def test_list_endpoints_reject_oversized_pages():
+    """
+    Test de integración que verifica que un `limit` mayor de 100 se rechaza (endpoints /specific y /general).
+    """
+    assert client.get("/pokemon/specific?limit=101").status_code == 422
+    assert client.get("/pokemon/general?limit=100000").status_code == 422
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_many")
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.update_many")
+async def test_update_pokemon_bulk(mock_update_many, mock_get_many):
+    """
+    Test de integración que verifica el resultado por elemento de la actualización masiva (endpoint /bulk).
+    """
+    mock_get_many.return_value = {
+        25: Pokemon(name="Pikachu", pokedex_number=25, abilities=[], sprites={}, types=["electric"]),
+        9999: None
+    }
+    item = {"name": "Raichu", "abilities": ["static"], "sprites": {}, "types": ["electric"]}
+
+    response = client.put("/pokemon/bulk", json={"items": [{**item, "pokedex_number": 25},
+                                                           {**item, "pokedex_number": 9999}]})
+    assert response.status_code == 200
+    assert response.json() == [{"pokedex_number": 25, "status": "updated"},
+                               {"pokedex_number": 9999, "status": "not_found"}]
+    mock_update_many.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_get_general_answers_not_modified_for_a_current_etag(mock_get_general, database):
+    """
+    Test de integración que verifica que con un ETag vigente en `If-None-Match` se responde 304 sin consultar el
+    repositorio, y que una escritura hecha por otro proceso sobre la misma base lo invalida.
+    """
+    mock_get_general.return_value = [GeneralPokemonDto(name="Pikachu", resource="https://pokeapi.co/api/v2/pokemon/25/")]
+
+    etag = client.get("/pokemon/general").headers["ETag"]
+    response = client.get("/pokemon/general", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert mock_get_general.call_count == 1
+
+    other_worker = sqlite3.connect(database)
+    with other_worker:
+        other_worker.execute("INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) "
+                             "VALUES ('pikachu', 25, '[]', '{}', '[]')")
+    other_worker.close()
+    response = client.get("/pokemon/general", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_incomplete_lists_are_sent_without_etag(mock_get_general):
+    """
+    Test de integración que verifica que una lista incompleta (PokeAPI no respondió) se envía sin ETag.
+    """
+    mock_get_general.return_value = MaterializedListDto(
+        [GeneralPokemonDto(name="Pikachu", resource="https://pokeapi.co/api/v2/pokemon/25/")], complete=False)
+
+    response = client.get("/pokemon/general")
+
+    assert response.status_code == 200
+    assert response.json()[0]["name"] == "Pikachu"
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.stream_specific",
+       new=fake_stream_specific)
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_specific")
+async def test_specific_varies_on_accept_and_streams_without_etag(mock_get_specific):
+    """
+    Test de integración que verifica que `/specific` declara `Vary: Accept` (también en los 304) y que el NDJSON
+    sin búsqueda ni página, que se envía según llega, no lleva ETag.
+    """
+    mock_get_specific.return_value = []
+
+    etag = client.get("/pokemon/specific").headers["ETag"]
+    not_modified = client.get("/pokemon/specific", headers={"If-None-Match": etag})
+    streamed = client.get("/pokemon/specific", headers={"Accept": "application/x-ndjson", "If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["Vary"] == "Accept"
+    assert streamed.status_code == 200
+    assert streamed.headers["Vary"] == "Accept"
+    assert "ETag" not in streamed.headers
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_specific")
+async def test_get_specific_projects_fields_and_sprites(mock_get_specific):
+    """
+    Test de integración que verifica que `fields` y `sprites` reducen la respuesta a los campos y sprites pedidos.
+    """
+    mock_get_specific.return_value = [
+        SpecificPokemonDto(name="Pikachu", pokedex_number=25, abilities=["static"], types=["electric"],
+                           sprites={"front_default": "front.png", "back_default": "back.png",
+                                    "versions": {"generation-i": {"red-blue": {"front_default": None}}}})
+    ]
+
+    response = client.get("/pokemon/specific?data_to_search=25&fields=name,sprites&sprites=front_default")
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": "Pikachu", "sprites": {"front_default": "front.png"}}]
+
+
+@pytest.mark.asyncio
+@patch("infrastructure.adapters.pokemon_repository_implementation.PokemonRepositoryImplementation.get_general")
+async def test_metrics_expose_latency_by_route_template(mock_get_general):
+    """
+    Test de integración que verifica que `/metrics` publica la latencia por plantilla de ruta y estado.
+    """
+    mock_get_general.return_value = []
+
+    client.get("/pokemon/general?data_to_search=Unknown")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/pokemon/general",status="200"}' in response.text
+    assert "http_requests_in_flight" in response.text
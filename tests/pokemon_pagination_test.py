@@ -0,0 +1,102 @@
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+
+from domain.dto.page_dto import PageRequestDto
+from domain.dto.projection_dto import ProjectionDto
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+from tests.stub_pokeapi import StubPokeApi
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path, monkeypatch):
+    stub_api = StubPokeApi(count=25)
+    server = TestServer(stub_api.application())
+    await server.start_server()
+    monkeypatch.setenv("POKEAPI_URL", str(server.make_url("/api/v2/pokemon/")))
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.run(migrate)
+    await gateway.executemany(
+        "INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) VALUES (?, ?, '[]', '{}', '[]')",
+        [("custom-3", 3), ("custom-100", 100)])
+    pokeapi_client = PokeApiClient()
+    yield PokemonRepositoryImplementation(pokeapi_client, gateway, LruTtlCache()), stub_api
+    await pokeapi_client.close()
+    gateway.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_general_pages_cover_the_catalog_once(repository):
+    """Prueba que recorrer las páginas con el cursor devuelve cada Pokémon una vez, priorizando la base de datos"""
+    pokemon_repository, _ = repository
+    names, cursor, pages = [], None, 0
+
+    while True:
+        page = PageRequestDto.from_cursor(10, cursor) if cursor else PageRequestDto(10)
+        result = await pokemon_repository.get_general_page(page)
+        names += [item.name for item in result.items]
+        pages += 1
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+
+    expected = [f"pokemon-{number}" for number in range(1, 26)] + ["custom-100"]
+    expected[2] = "custom-3"
+    assert names == expected
+    assert pages == 3
+
+
+@pytest.mark.asyncio
+async def test_specific_page_only_fetches_its_own_details(repository):
+    """Prueba que una página específica solo consulta en PokeAPI los detalles que le faltan a la base de datos"""
+    pokemon_repository, stub_api = repository
+
+    result = await pokemon_repository.get_specific_page(PageRequestDto(5, upstream_offset=10))
+
+    detail_requests = [path for path in stub_api.requests if "?" not in path]
+    assert [item.pokedex_number for item in result.items] == [11, 12, 13, 14, 15]
+    assert sorted(detail_requests) == sorted(f"/api/v2/pokemon/{number}" for number in range(11, 16))
+    assert result.next_cursor is not None
+
+
+def test_invalid_cursor_is_rejected():
+    """Prueba que un cursor manipulado se rechaza"""
+    with pytest.raises(ValueError):
+        PageRequestDto.from_cursor(10, "not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_stream_gives_priority_to_the_database(repository):
+    """Prueba que el modo streaming entrega la base de datos y el resto del catálogo sin duplicados"""
+    pokemon_repository, _ = repository
+
+    streamed = [(pokemon.pokedex_number, pokemon.name) async for pokemon in pokemon_repository.stream_specific()]
+
+    assert sorted(number for number, _ in streamed) == list(range(1, 26)) + [100]
+    assert (3, "custom-3") in streamed
+
+
+@pytest.mark.asyncio
+async def test_specific_page_applies_the_projection_to_both_sources(repository):
+    """Prueba que la proyección omite los campos no pedidos y recorta los sprites de la base de datos y de PokeAPI"""
+    pokemon_repository, _ = repository
+    projection = ProjectionDto.from_params("name,sprites", "front_default,other.official-artwork")
+
+    result = await pokemon_repository.get_specific_page(PageRequestDto(4), projection)
+
+    custom, from_api = result.items[2], result.items[3]
+    assert (custom.name, custom.sprites, custom.abilities) == ("custom-3", {}, None)
+    assert from_api.types is None
+    assert from_api.sprites == {"front_default": "https://sprites.local/pokemon/4.png",
+                                "other": {"official-artwork": {"front_default": "https://sprites.local/art/4.png"}}}
+
+
+def test_projection_rejects_unknown_fields():
+    """Prueba que pedir un campo desconocido se rechaza"""
+    with pytest.raises(ValueError):
+        ProjectionDto.from_params("name,moves", None)
@@ -0,0 +1,51 @@
+import pytest
+import pytest_asyncio
+
+from domain.entities.pokemon import Pokemon
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.migrations import migrate
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.run(migrate)
+    await gateway.executemany(
+        "INSERT INTO pokemon (name, pokedex_number, abilities, sprites, types) VALUES (?, ?, '[]', '{}', '[]')",
+        [("raichu", 26), ("pichu", 172), ("pikachu-rock-star", 10080), ("pikachu", 25), ("porygon2", 233)])
+    yield PokemonRepositoryImplementation(PokeApiClient(), gateway, LruTtlCache())
+    gateway.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data_to_search, expected", [
+    ("pikachu", "pikachu"),      # exacta antes que prefijo
+    ("pika", "pikachu"),         # prefijo, el nombre más corto primero
+    ("chu", "pichu"),            # subcadena, el nombre más corto primero
+    ("ro", "pikachu-rock-star"), # texto corto sin prefijo: subcadena
+    ("ra", "raichu"),            # texto corto: prefijo por el índice NOCASE
+    ("233", "porygon2"),         # número: solo por número de Pokédex
+])
+async def test_name_search_ranking(repository, data_to_search, expected):
+    """Prueba que la búsqueda por nombre prioriza exacta, luego prefijo y luego subcadena de forma determinista"""
+    result = await repository.general_query_repo.get_single_from_db(data_to_search)
+
+    assert result.name == expected
+
+
+@pytest.mark.asyncio
+async def test_number_search_does_not_match_names(repository):
+    """Prueba que un número solo se busca por número de Pokédex y no por nombre"""
+    assert await repository.general_query_repo.get_single_from_db("2") is None
+
+
+@pytest.mark.asyncio
+async def test_index_follows_updates(repository):
+    """Prueba que el índice de nombres se mantiene sincronizado al actualizar un Pokémon"""
+    await repository.update(Pokemon(name="sparky", pokedex_number=25, abilities=[], sprites={}, types=[]))
+
+    assert (await repository.general_query_repo.get_single_from_db("spark")).name == "sparky"
+    assert (await repository.general_query_repo.get_single_from_db("pikachu")).name == "pikachu-rock-star"
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock
 from domain.entities.pokemon import Pokemon
+from domain.dto.pokemon_to_patch_dto import PokemonToPatchDto
 from domain.dto.pokemon_to_update_dto import PokemonToUpdateDto
 from domain.services.pokemon_service import PokemonService
 from domain.repositories.pokemon_repository import PokemonRepository
@@ -57,3 +58,45 @@ async def test_update_pokemon_not_found():
     # Asegurarse de que el método update no fue llamado
     mock_repo.update.assert_not_called()
 
+
+@pytest.mark.asyncio
+async def test_update_many_reports_each_item():
+    """Prueba que la actualización masiva guarda los encontrados juntos e informa los que no existen"""
+    mock_repo = AsyncMock(PokemonRepository)
+    mock_repo.get_many.return_value = {25: FAKE_POKEMON_DATA, 0: None}
+    missing = PokemonToUpdateDto(name="Missingno", pokedex_number=0, abilities=[], sprites={}, types=[])
+
+    pokemon_service = PokemonService(mock_repo)
+    results = await pokemon_service.update_many([FAKE_POKEMON_TO_UPDATE, missing])
+
+    mock_repo.get_many.assert_called_once_with([25, 0])
+    assert [(result.pokedex_number, result.status) for result in results] == [(25, "updated"), (0, "not_found")]
+    saved = mock_repo.update_many.call_args[0][0]
+    assert [pokemon.name for pokemon in saved] == ["Pikachu Updated"]
+
+
+@pytest.mark.asyncio
+async def test_update_many_reports_unverifiable_items_as_unavailable():
+    """Prueba que un Pokémon cuya existencia no pudo comprobarse se informa como `unavailable` y no `not_found`"""
+    mock_repo = AsyncMock(PokemonRepository)
+    mock_repo.get_many.return_value = {25: FAKE_POKEMON_DATA}
+    unverified = PokemonToUpdateDto(name="Raichu", pokedex_number=26, abilities=[], sprites={}, types=[])
+
+    pokemon_service = PokemonService(mock_repo)
+    results = await pokemon_service.update_many([FAKE_POKEMON_TO_UPDATE, unverified])
+
+    assert [(result.pokedex_number, result.status) for result in results] == [(25, "updated"), (26, "unavailable")]
+    assert [pokemon.pokedex_number for pokemon in mock_repo.update_many.call_args[0][0]] == [25]
+
+
+@pytest.mark.asyncio
+async def test_patch_pokemon_not_found():
+    """Prueba que la actualización parcial de un Pokémon inexistente lanza una excepción"""
+    mock_repo = AsyncMock(PokemonRepository)
+    mock_repo.patch.return_value = False
+
+    pokemon_service = PokemonService(mock_repo)
+
+    with pytest.raises(Exception, match="Pokemon not found"):
+        await pokemon_service.patch(PokemonToPatchDto(9999, name="Missingno"))
+    mock_repo.patch.assert_called_once_with(9999, {"name": "Missingno"})
@@ -0,0 +1,59 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.server_timing_middleware import ServerTimingMiddleware
+from infrastructure.adapters.request_timing import start_request_timings, stop_request_timings, timed
+
+
+@pytest.mark.asyncio
+async def test_overlapping_operations_count_once_per_phase():
+    """Prueba que las operaciones concurrentes de una misma fase suman su duración conjunta, no la de cada una"""
+    timings, token = start_request_timings()
+
+    async def upstream_call():
+        with timed('upstream'):
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(*[upstream_call() for _ in range(5)])
+    stop_request_timings(token)
+
+    assert 0.05 <= timings.durations['upstream'] < 0.15
+
+
+def build_client(tmp_path) -> TestClient:
+    application = FastAPI()
+
+    @application.get('/ping')
+    async def ping() -> dict:
+        with timed('db'):
+            await asyncio.sleep(0.01)
+        return {'pong': True}
+
+    application.add_middleware(ServerTimingMiddleware, enabled=True, profile_token='secret',
+                               profile_dir=str(tmp_path))
+    return TestClient(application)
+
+
+def test_responses_carry_server_timing(tmp_path):
+    """Prueba que la respuesta incluye las fases medidas y la duración total"""
+    response = build_client(tmp_path).get('/ping')
+
+    assert response.headers['Server-Timing'].startswith('db;dur=')
+    assert 'total;dur=' in response.headers['Server-Timing']
+    assert 'X-Profile' not in response.headers
+
+
+def test_profile_is_only_taken_with_the_token(tmp_path):
+    """Prueba que solo se perfila la petición con el token correcto y que el perfil se guarda en formato folded"""
+    client = build_client(tmp_path)
+
+    assert 'X-Profile' not in client.get('/ping', headers={'X-Profile': 'wrong'}).headers
+    profile_name = client.get('/ping', headers={'X-Profile': 'secret'}).headers['X-Profile']
+
+    assert os.listdir(tmp_path) == [profile_name]
+    with open(tmp_path / profile_name, encoding='utf-8') as profile:
+        assert all(line.rsplit(' ', 1)[1].strip().isdigit() for line in profile)
@@ -0,0 +1,23 @@
+from api import Handlers
+from api.routes_manifest import CONTROLLER_MODULES
+from generate_routes_manifest import render
+
+
+def test_manifest_matches_controllers_directory():
+    # Si falla, regenerar con `python generate_routes_manifest.py`
+    assert CONTROLLER_MODULES == Handlers.scan_modules()
+
+
+def test_render_round_trips_modules():
+    namespace = {}
+    exec(render(('api.controllers.a', 'api.controllers.b')), namespace)
+    assert namespace['CONTROLLER_MODULES'] == ('api.controllers.a', 'api.controllers.b')
+
+
+def test_routes_manifest_flag_is_read_on_each_call(monkeypatch):
+    # El contenedor llama a `modules()` al importarse, después de que main.py cargue el `.env`
+    monkeypatch.setattr(Handlers, "_scanned", ("api.controllers.scanned",))
+    monkeypatch.setenv("ROUTES_MANIFEST", "false")
+    assert Handlers.modules() == ("api.controllers.scanned",)
+    monkeypatch.setenv("ROUTES_MANIFEST", "true")
+    assert Handlers.modules() == CONTROLLER_MODULES
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from infrastructure.adapters.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    """Prueba que las llamadas idénticas concurrentes se resuelven con una única ejecución"""
+    single_flight = SingleFlight()
+    executions = []
+
+    async def lookup():
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return ["pikachu"]
+
+    results = await asyncio.gather(*[single_flight.do(("specific", "pikachu"), lookup) for _ in range(5)])
+
+    assert results == [["pikachu"]] * 5
+    assert len(executions) == 1
+    assert single_flight.stats() == {"calls": 1, "deduplicated": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_does_not_cancel_the_others():
+    """Prueba que cancelar a un solicitante no cancela la ejecución compartida"""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def lookup():
+        await release.wait()
+        return "pikachu"
+
+    cancelled = asyncio.ensure_future(single_flight.do("pikachu", lookup))
+    waiting = asyncio.ensure_future(single_flight.do("pikachu", lookup))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "pikachu"
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
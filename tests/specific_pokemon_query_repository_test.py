@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from infrastructure.adapters.general_pokemon_query_repository import GeneralPokemonQueryRepository
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.specific_pokemon_query_repository import SpecificPokemonQueryRepository
+
+API_URL = "https://pokeapi.co/api/v2/pokemon/"
+
+
+def fake_details(pokedex_number: int) -> dict:
+    return {
+        "name": f"pokemon-{pokedex_number}",
+        "id": pokedex_number,
+        "abilities": [{"ability": {"name": "static"}}],
+        "sprites": {"front_default": f"https://pokeapi.co/sprites/pokemon/{pokedex_number}.png"},
+        "types": [{"type": {"name": "electric"}}]
+    }
+
+
+class FakePokeApiClient(PokeApiClient):
+    """Cliente falso que responde con retardos distintos por Pokémon para simular un upstream concurrente"""
+
+    def __init__(self, delays: dict, failing: tuple = ()):
+        super().__init__()
+        self.delays = delays
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_json(self, url: str) -> dict | None:
+        if url.endswith("?limit=100"):
+            return {"results": [{"name": f"pokemon-{number}", "url": f"{API_URL}{number}/"}
+                                for number in self.delays]}
+        pokedex_number = int(url.rstrip("/").rsplit("/", 1)[1])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[pokedex_number])
+        finally:
+            self.in_flight -= 1
+        if pokedex_number in self.failing:
+            return None
+        return fake_details(pokedex_number)
+
+
+@pytest.mark.asyncio
+async def test_get_all_from_api_preserves_order_and_skips_failures():
+    """Prueba que la consulta concurrente conserva el orden del listado y omite los elementos fallidos"""
+    client = FakePokeApiClient({1: 0.03, 2: 0.01, 3: 0.02, 4: 0.0}, failing=(3,))
+    repository = SpecificPokemonQueryRepository(None, API_URL, client, LruTtlCache(), fanout_concurrency=2)
+
+    result, complete = await repository.get_all_from_api()
+
+    assert [pokemon.pokedex_number for pokemon in result] == [1, 2, 4]
+    assert complete
+    assert client.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_from_api_respects_deadline():
+    """Prueba que un elemento lento no bloquea la respuesta más allá del plazo configurado"""
+    client = FakePokeApiClient({1: 0.0, 2: 5.0, 3: 0.0})
+    repository = SpecificPokemonQueryRepository(None, API_URL, client, LruTtlCache(), fanout_deadline=0.2)
+
+    result, complete = await repository.get_all_from_api()
+
+    assert [pokemon.pokedex_number for pokemon in result] == [1, 3]
+    assert not complete
+
+
+@pytest.mark.asyncio
+async def test_get_one_from_api_uses_cache_by_name_and_number():
+    """Prueba que una búsqueda en PokeAPI queda en caché tanto por número de Pokédex como por nombre"""
+    client = FakePokeApiClient({25: 0.0})
+    cache = LruTtlCache()
+    repository = SpecificPokemonQueryRepository(None, API_URL, client, cache)
+    calls = []
+    original_get_json = client.get_json
+
+    async def counting_get_json(url):
+        calls.append(url)
+        return await original_get_json(url)
+
+    client.get_json = counting_get_json
+
+    first = await repository._get_from_api(25)
+    by_name = await repository.get_single_from_api("Pokemon-25")
+
+    assert first.name == "pokemon-25"
+    assert by_name[0].pokedex_number == 25
+    assert calls == [f"{API_URL}25"]
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_general_and_specific_lookups_share_the_cached_detail():
+    """Prueba que ambos repositorios piden el detalle por el mismo camino y reutilizan la entrada del otro"""
+    client = FakePokeApiClient({25: 0.0})
+    cache = LruTtlCache()
+    general = GeneralPokemonQueryRepository(None, API_URL, client, cache)
+    specific = SpecificPokemonQueryRepository(None, API_URL, client, cache)
+
+    found = await general.get_single_from_api("25")
+    detail = await specific.get_single_from_api("pokemon-25")
+
+    assert found[0].name == "pokemon-25"
+    assert detail[0].abilities == ["static"]
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+
+
+@pytest.mark.asyncio
+async def test_gateway_reuses_pooled_connections(tmp_path):
+    """Prueba que el gateway ejecuta consultas concurrentes sin abrir más conexiones que el tamaño del pool"""
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await gateway.execute("CREATE TABLE pokemon (name TEXT, pokedex_number INTEGER UNIQUE)")
+    await gateway.executemany("INSERT INTO pokemon (name, pokedex_number) VALUES (?, ?)",
+                              [("bulbasaur", 1), ("ivysaur", 2)])
+
+    results = await asyncio.gather(*[gateway.fetch_one("SELECT name FROM pokemon WHERE pokedex_number=?", (2,))
+                                     for _ in range(10)])
+
+    assert results == [("ivysaur",)] * 10
+    assert gateway._opened <= 2
+    assert await gateway.fetch_one("PRAGMA journal_mode") == ("wal",)
+    gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_gateway_rolls_back_failed_operations(tmp_path):
+    """Prueba que una operación fallida no deja cambios a medio confirmar"""
+    gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=1)
+    await gateway.execute("CREATE TABLE pokemon (name TEXT, pokedex_number INTEGER UNIQUE)")
+
+    def failing_operation(conn):
+        conn.execute("INSERT INTO pokemon (name, pokedex_number) VALUES ('pikachu', 25)")
+        conn.execute("INSERT INTO pokemon (name, pokedex_number) VALUES ('raichu', 25)")
+
+    with pytest.raises(Exception):
+        await gateway.run(failing_operation)
+
+    assert await gateway.fetch_all("SELECT name FROM pokemon") == []
+    gateway.close()
@@ -0,0 +1,97 @@
+"""
+Servidor local que imita los endpoints de PokeAPI usados por la aplicación.
+
+Sirve `/api/v2/pokemon/?limit=&offset=` y `/api/v2/pokemon/{número o nombre}` con datos sintéticos, envía ETag
+y honra `If-None-Match`. Permite configurar latencia, tasa de errores y tamaño del cuerpo para pruebas y benchmarks.
+"""
+import asyncio
+import hashlib
+import json
+import random
+
+from aiohttp import web
+
+
+class StubPokeApi:
+    def __init__(self, count: int = 150, latency: float = 0.0, error_rate: float = 0.0, payload_padding: int = 0,
+                 seed: int = 0):
+        """
+        Args:
+            count (int): Número de Pokémon del catálogo sintético.
+            latency (float): Segundos de espera antes de cada respuesta.
+            error_rate (float): Probabilidad (0-1) de responder 500.
+            payload_padding (int): Número de movimientos de relleno por Pokémon, para simular cuerpos grandes.
+            seed (int): Semilla del generador de errores, para ejecuciones reproducibles.
+        """
+        self.count = count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.payload_padding = payload_padding
+        self.renamed: dict[int, str] = {}
+        self.requests: list[str] = []
+        self._random = random.Random(seed)
+
+    def name_of(self, pokedex_number: int) -> str:
+        return self.renamed.get(pokedex_number, f"pokemon-{pokedex_number}")
+
+    def details(self, pokedex_number: int) -> dict:
+        return {
+            "id": pokedex_number,
+            "name": self.name_of(pokedex_number),
+            "abilities": [{"ability": {"name": "static"}}, {"ability": {"name": "lightning-rod"}}],
+            "sprites": {
+                "front_default": f"https://sprites.local/pokemon/{pokedex_number}.png",
+                "back_default": f"https://sprites.local/pokemon/back/{pokedex_number}.png",
+                "other": {"official-artwork": {"front_default": f"https://sprites.local/art/{pokedex_number}.png"}},
+                "versions": {"generation-i": {"red-blue": {"front_default": None}}}
+            },
+            "types": [{"type": {"name": "electric"}}],
+            "moves": [{"move": {"name": f"move-{index}"}} for index in range(self.payload_padding)]
+        }
+
+    async def _delay_or_fail(self, request: web.Request) -> web.Response | None:
+        self.requests.append(request.path_qs)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.Response(status=500)
+        return None
+
+    async def list_pokemon(self, request: web.Request) -> web.Response:
+        failure = await self._delay_or_fail(request)
+        if failure is not None:
+            return failure
+        limit = int(request.query.get("limit", 20))
+        offset = int(request.query.get("offset", 0))
+        base = str(request.url.with_query(None))
+        numbers = range(offset + 1, min(offset + limit, self.count) + 1)
+        return web.json_response({
+            "count": self.count,
+            "results": [{"name": self.name_of(number), "url": f"{base}{number}/"} for number in numbers]
+        })
+
+    async def get_pokemon(self, request: web.Request) -> web.Response:
+        failure = await self._delay_or_fail(request)
+        if failure is not None:
+            return failure
+        identifier = request.match_info["identifier"]
+        if identifier.isdigit():
+            pokedex_number = int(identifier)
+        else:
+            pokedex_number = next((number for number in range(1, self.count + 1)
+                                   if self.name_of(number) == identifier), 0)
+        if not 1 <= pokedex_number <= self.count:
+            return web.Response(status=404, text="Not Found")
+        body = json.dumps(self.details(pokedex_number)).encode()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json",
+                            headers={"ETag": etag, "Cache-Control": "max-age=0"})
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v2/pokemon/", self.list_pokemon)
+        app.router.add_get("/api/v2/pokemon/{identifier}", self.get_pokemon)
+        app.router.add_get("/api/v2/pokemon/{identifier}/", self.get_pokemon)
+        return app
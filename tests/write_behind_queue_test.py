@@ -0,0 +1,89 @@
+import asyncio
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from domain.entities.pokemon import Pokemon
+from infrastructure.adapters.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.pokeapi_client import PokeApiClient
+from infrastructure.adapters.pokemon_repository_implementation import PokemonRepositoryImplementation
+from infrastructure.adapters.sqlite_gateway import SqliteGateway
+from infrastructure.adapters.write_behind_queue import WriteBehindQueue
+from infrastructure.migrations import migrate
+
+
+@pytest_asyncio.fixture
+async def gateway(tmp_path):
+    sqlite_gateway = SqliteGateway(str(tmp_path / "pokemon.db"), pool_size=2)
+    await sqlite_gateway.run(migrate)
+    yield sqlite_gateway
+    sqlite_gateway.close()
+
+
+def pokemon(pokedex_number: int, name: str) -> Pokemon:
+    return Pokemon(name=name, pokedex_number=pokedex_number, abilities=[], sprites={}, types=["normal"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_share_one_commit(gateway):
+    """Prueba que una ráfaga de actualizaciones se confirma en una sola transacción"""
+    queue = WriteBehindQueue(gateway, enabled=True, max_batch=100, max_delay=0.05)
+    repository = PokemonRepositoryImplementation(PokeApiClient(), gateway, LruTtlCache(), queue)
+
+    await asyncio.gather(*[repository.update(pokemon(number, f"custom-{number}")) for number in range(1, 21)])
+
+    rows = await gateway.fetch_all("SELECT pokedex_number FROM pokemon ORDER BY pokedex_number")
+    assert rows == [(number,) for number in range(1, 21)]
+    assert queue.stats() == {"commits": 1, "writes": 20, "pending": 0}
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_groups_are_split_by_size(gateway):
+    """Prueba que un grupo no supera `max_batch` escrituras"""
+    queue = WriteBehindQueue(gateway, enabled=True, max_batch=8, max_delay=0.05)
+    repository = PokemonRepositoryImplementation(PokeApiClient(), gateway, LruTtlCache(), queue)
+
+    await asyncio.gather(*[repository.update(pokemon(number, f"custom-{number}")) for number in range(1, 21)])
+
+    assert queue.stats()["commits"] == 3
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_see_pending_writes_and_close_flushes(gateway):
+    """Prueba que las lecturas ven las escrituras pendientes y que cerrar la cola las confirma"""
+    queue = WriteBehindQueue(gateway, enabled=True, max_delay=10)
+    repository = PokemonRepositoryImplementation(PokeApiClient(), gateway, LruTtlCache(), queue)
+
+    update = asyncio.ensure_future(repository.update(pokemon(25, "sparky")))
+    await asyncio.sleep(0)
+
+    assert (await repository.get_one(25)).name == "sparky"
+    assert (await repository.get_specific("Sparky"))[0].pokedex_number == 25
+    assert await gateway.fetch_one("SELECT name FROM pokemon WHERE pokedex_number=25") is None
+
+    await queue.close()
+    await update
+    assert await gateway.fetch_one("SELECT name FROM pokemon WHERE pokedex_number=25") == ("sparky",)
+    assert queue.pending(25) is None
+
+
+@pytest.mark.asyncio
+async def test_a_failing_write_does_not_fail_the_rest_of_its_group(gateway):
+    """Prueba que si una escritura del grupo falla solo falla esa y las demás se confirman"""
+    queue = WriteBehindQueue(gateway, enabled=True, max_batch=100, max_delay=0.05)
+    repository = PokemonRepositoryImplementation(PokeApiClient(), gateway, LruTtlCache(), queue)
+
+    bad_write = queue.submit("bad", None, "INSERT INTO sync_state (pokedex_number, name) VALUES (?, NULL)", (1,))
+    results = await asyncio.gather(repository.update(pokemon(1, "custom-1")), bad_write,
+                                   repository.update(pokemon(2, "custom-2")), return_exceptions=True)
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], sqlite3.IntegrityError)
+    rows = await gateway.fetch_all("SELECT pokedex_number FROM pokemon ORDER BY pokedex_number")
+    assert rows == [(1,), (2,)]
+    assert await gateway.fetch_all("SELECT * FROM sync_state") == []
+    assert queue.stats() == {"commits": 1, "writes": 2, "pending": 0}
+    await queue.close()